@@ -1,9 +1,13 @@
-from flask import Flask, render_template, session, redirect, url_for, send_from_directory, request, jsonify
+from flask import Flask, render_template, session, redirect, url_for, request, jsonify
 from flask_socketio import SocketIO, emit, join_room, leave_room
-import random
+from werkzeug.http import is_resource_modified
+from werkzeug.wsgi import wrap_file
+import hashlib
+import json
+import time
 import uuid
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional
 from enum import Enum
 import os
 import logging
@@ -108,6 +112,20 @@ socketio = SocketIO(
     message_queue=MESSAGE_QUEUE,
 )
 
+# Ordonnanceur unique (un seul tas d'échéances, une seule tâche de fond) pour tous les minuteurs des tables
+from scheduler import TimerScheduler
+from static_assets import IMMUTABLE_MAX_AGE, AssetIndex
+scheduler = TimerScheduler(sleep=socketio.sleep)
+_scheduler_started = False
+
+
+def _ensure_scheduler():
+    """Démarrer la tâche de fond de l'ordonnanceur au premier minuteur programmé."""
+    global _scheduler_started
+    if not _scheduler_started:
+        _scheduler_started = True
+        socketio.start_background_task(scheduler.run_forever)
+
 # Petit log de configuration au démarrage
 print(f"[SocketIO] async_mode={SOCKETIO_ASYNC_MODE} websocket={WEBSOCKET_ENABLED} allow_upgrades={ALLOW_UPGRADES} cors={cors_allowed} ping_interval={PING_INTERVAL}s")
 
@@ -137,27 +155,124 @@ def _force_cors_for_socketio(resp):
         pass
     return resp
 
-# Dossier du build React (Option B)
+# Dossier du build React (Option B), indexé une fois puis seulement s'il change (voir static_assets.py)
 BUILD_DIR = os.path.join(os.path.dirname(__file__), 'frontend', 'build')
+# Intervalle (secondes) de vérification du build pour le réindexer (0 = index figé au démarrage)
+STATIC_RESCAN_SECONDS = float(os.environ.get('STATIC_RESCAN_SECONDS', '2'))
+# Déléguer l'envoi des fichiers au serveur frontal (en-tête X-Sendfile, Apache/lighttpd)
+app.config['USE_X_SENDFILE'] = os.environ.get('STATIC_X_SENDFILE', '0') == '1'
+static_index = AssetIndex(BUILD_DIR, rescan_seconds=STATIC_RESCAN_SECONDS)
 
 # Global games storage
 games: Dict[str, 'PokerGame'] = {}
 # Mapping joueur -> partie
 player_game_mapping = {}
+# Tournois multi-tables en cours (mtt.TournamentDirector), par id de tournoi
+tournaments: Dict[str, object] = {}
+# Spectateurs: canal par table (état public en cache + deltas) et table regardée par connexion (sid)
+_spectators: Dict[str, 'SpectatorChannel'] = {}
+_spectating: Dict[str, str] = {}
+# Format des événements d'état négocié par connexion (sid -> 'msgpack'); absent = JSON
+_wire_formats: Dict[str, str] = {}
+
+# Actions qu'un joueur peut jouer (les blinds et antes sont posées par le moteur)
+PLAYER_ACTIONS = ('fold', 'check', 'call', 'raise')
 
 # Constantes pour les cartes
 suits = ['D', 'H', 'S', 'C']
 card_values = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
 
 NEXT_HAND_DELAY_SECONDS = int(os.environ.get('NEXT_HAND_DELAY_SECONDS', '4'))
+# Délai de parole (secondes) avant action automatique (check sinon fold). 0 = pas de limite
+ACTION_TIMEOUT_SECONDS = int(os.environ.get('ACTION_TIMEOUT_SECONDS', '30'))
+
+# All-in: délai (secondes) entre chaque rue révélée, avec équités affichées (0 = révélation immédiate)
+ALLIN_RUNOUT_SECONDS = float(os.environ.get('ALLIN_RUNOUT_SECONDS', '2'))
+# Budget de calcul des équités par rue (millisecondes): borne le temps passé dans la boucle d'événements
+ALLIN_EQUITY_BUDGET_MS = int(os.environ.get('ALLIN_EQUITY_BUDGET_MS', '30'))
+
+# Évaluation du showdown hors de la boucle d'événements: '' (désactivé), 'thread' ou 'process'
+SHOWDOWN_OFFLOAD = os.environ.get('SHOWDOWN_OFFLOAD', '').strip().lower()
+SHOWDOWN_WORKERS = int(os.environ.get('SHOWDOWN_WORKERS', '2'))
+# Intervalle de la surveillance (unique) des évaluations en cours par l'ordonnanceur
+SHOWDOWN_POLL_SECONDS = 0.005
+showdown_pool = None
+if SHOWDOWN_OFFLOAD in ('thread', 'process'):
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    showdown_pool = (ProcessPoolExecutor if SHOWDOWN_OFFLOAD == 'process' else ThreadPoolExecutor)(max_workers=SHOWDOWN_WORKERS)
+elif SHOWDOWN_OFFLOAD:
+    print(f"[SHOWDOWN] SHOWDOWN_OFFLOAD inconnu: {SHOWDOWN_OFFLOAD!r} (attendu: thread, process); évaluation locale")
+# Évaluations de showdown en cours par partie: (Future, partie, all_in_auto), surveillées par _poll_showdowns
+_showdown_jobs: Dict[str, object] = {}
+
+# Historique des mains (format binaire compact, un fichier par jour). Vide = désactivé.
+HAND_HISTORY_DIR = os.environ.get('HAND_HISTORY_DIR', os.path.join(os.path.dirname(__file__), 'hand_history'))
+hand_history = None
+if HAND_HISTORY_DIR:
+    try:
+        from hand_history import HandHistoryWriter
+        hand_history = HandHistoryWriter(HAND_HISTORY_DIR)
+    except Exception as _e:
+        print(f"[HISTORY] historique des mains désactivé: {_e}")
+
+# Hibernation des tables sans joueur connecté depuis IDLE_TABLE_TTL_SECONDS (0 = jamais).
+# Stockage: Redis si REDIS_URL est défini (partagé entre workers), sinon HIBERNATION_DIR sur disque.
+IDLE_TABLE_TTL_SECONDS = int(os.environ.get('IDLE_TABLE_TTL_SECONDS', '900'))
+HIBERNATION_DIR = os.environ.get('HIBERNATION_DIR', os.path.join(os.path.dirname(__file__), 'hibernated'))
+hibernated = None
+if IDLE_TABLE_TTL_SECONDS > 0:
+    try:
+        from hibernation import DiskStore, RedisStore, dumps_game, loads_game
+        hibernated = RedisStore(MESSAGE_QUEUE) if MESSAGE_QUEUE else DiskStore(HIBERNATION_DIR)
+    except Exception as _e:
+        print(f"[HIBERNATE] hibernation des tables désactivée: {_e}")
+# Début d'inactivité (aucun joueur connecté) par partie, relevé par le ramasseur
+_idle_since: Dict[str, float] = {}
+# Entrée de lobby des tables hibernées par ce worker (les autres n'ont que leur id dans le stockage)
+_asleep: Dict[str, dict] = {}
+
+from deck import Deck
+import wire
+from blinds import BlindStructure, describe, parse_structure
+from spectators import SpectatorChannel
+from hand_eval import LRUCache
+from lobby import LobbyCache
+
+# Détail des mains terminées (mains évaluées, actions), servi à la demande: nombre de mains gardées en cache
+HAND_DETAIL_CACHE_SIZE = int(os.environ.get('HAND_DETAIL_CACHE_SIZE', '512'))
+hand_details = LRUCache(HAND_DETAIL_CACHE_SIZE)
+
+# Lobby HTTP (/api/games): corps JSON compressé en gzip au-delà de LOBBY_GZIP_MIN_BYTES octets (0 = jamais)
+LOBBY_GZIP_MIN_BYTES = int(os.environ.get('LOBBY_GZIP_MIN_BYTES', '1024'))
+
+# Spectateurs: au plus une mise à jour (delta) toutes les SPECTATOR_UPDATE_SECONDS par table, commune à tous
+SPECTATOR_UPDATE_SECONDS = float(os.environ.get('SPECTATOR_UPDATE_SECONDS', '0.5'))
+
+# Structure de blinds de tournoi des nouvelles tables (ex: '10/20,15/30,25/50/5'; vide = blinds fixes 10/20).
+# Montée de niveau toutes les BLIND_LEVEL_HANDS mains et/ou toutes les BLIND_LEVEL_SECONDS secondes (0 = jamais).
+BLIND_STRUCTURE = os.environ.get('BLIND_STRUCTURE', '').strip()
+BLIND_LEVEL_HANDS = int(os.environ.get('BLIND_LEVEL_HANDS', '0'))
+BLIND_LEVEL_SECONDS = float(os.environ.get('BLIND_LEVEL_SECONDS', '0'))
+blind_structure = None
+if BLIND_STRUCTURE:
+    try:
+        blind_structure = parse_structure(BLIND_STRUCTURE, BLIND_LEVEL_HANDS, BLIND_LEVEL_SECONDS)
+        print(f"[BLINDS] structure {describe(blind_structure.levels)} — niveau toutes les "
+              f"{BLIND_LEVEL_HANDS or '∞'} mains / {BLIND_LEVEL_SECONDS or '∞'} s")
+    except ValueError as _e:
+        print(f"[BLINDS] BLIND_STRUCTURE ignorée: {_e}")
 
 # --- NEW: import de l'évaluateur de mains ---
 try:
-    from hand_eval import evaluate_best
+    from hand_eval import evaluate_best, evaluate_labels, card_index
+except Exception as _e:
+    evaluate_best = evaluate_labels = card_index = None  # sera vérifié à l'usage
+try:
+    from equity import equities
 except Exception as _e:
-    evaluate_best = None  # sera vérifié à l'usage
+    equities = None  # équités des all-in désactivées
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     value: int
     suit: str
@@ -174,6 +289,17 @@ class Card:
     def __hash__(self):
         return hash((self.value, self.suit))
 
+    def __reduce__(self):
+        # Sérialisation (hibernation des tables): restaurer la carte partagée plutôt qu'une copie
+        return _shared_card, (self.value, self.suit)
+
+# Les 52 cartes, créées une seule fois et partagées par toutes les tables (indice = hand_eval.card_index)
+CARDS = tuple(Card(value, suit) for suit in suits for value in range(2, 15))
+
+
+def _shared_card(value: int, suit: str) -> Card:
+    return CARDS[13 * suits.index(suit) + value - 2]
+
 class GamePhase(Enum):
     WAITING = "waiting"
     PREFLOP = "preflop"
@@ -182,7 +308,7 @@ class GamePhase(Enum):
     RIVER = "river"
     SHOWDOWN = "showdown"
 
-@dataclass
+@dataclass(slots=True)
 class PokerPlayer:
     id: str
     name: str
@@ -212,11 +338,11 @@ class PokerPlayer:
             'eligible_from_hand': self.eligible_from_hand,
         }
 
-@dataclass
+@dataclass(slots=True)
 class PokerGame:
     id: str
     players: List[PokerPlayer] = field(default_factory=list)
-    deck: List[Card] = field(default_factory=list)
+    deck: Deck = field(default_factory=Deck)
     community_cards: List[Card] = field(default_factory=list)
     pot: int = 0
     current_bet: int = 0
@@ -229,13 +355,36 @@ class PokerGame:
     last_winner: Dict[str, str] = field(default_factory=dict)
     # Nouveau: numéro de main en cours (1-indexé). 0 = pas encore démarré
     hand_number: int = 0
+    # Journal de la main en cours (sièges au départ, actions) pour l'historique des mains
+    hand_log: Dict = field(default_factory=dict)
+    # Graine du mélange de la main en cours (stockée dans l'historique pour rejouer la main à l'identique)
+    hand_seed: int = 0
+    # Showdown évalué hors de la boucle d'événements (cf. SHOWDOWN_OFFLOAD): entrées en attente de résultat
+    defer_showdown: bool = False
+    pending_showdown: Optional[Dict] = None
+    # All-in: révéler les rues une à une (avec équités) au lieu d'aller directement au showdown
+    paced_runout: bool = False
+    # Structure de blinds de tournoi (blinds.py); None = blinds fixes small_blind / big_blind
+    blind_structure: Optional[BlindStructure] = None
+    blind_level: int = 0
+    ante: int = 0
+    # Niveaux atteints au temps (incrémenté par l'ordonnanceur, appliqué à la main suivante)
+    blind_level_due: int = 0
+    # Niveau changé à la dernière main démarrée: à pousser aux clients (blinds_update)
+    blinds_changed: bool = False
+    # Table d'un tournoi multi-tables (mtt.py); vide = partie libre
+    tournament_id: str = ''
 
     def __post_init__(self):
         self.create_deck()
 
-    def create_deck(self):
-        self.deck = [Card(value, suit) for suit in suits for value in range(2, 15)]
-        random.shuffle(self.deck)
+    def create_deck(self, seed: Optional[int] = None):
+        """Remettre les 52 cartes dans le deck, avec une graine propre à la main (tirée de `secrets` si non fournie)."""
+        self.deck.reset(seed)
+        self.hand_seed = self.deck.seed
+
+    def deal_card(self) -> Card:
+        return CARDS[self.deck.deal()]
 
     def add_player(self, player_id: str, name: str, buy_in: int = 1000):
         if len(self.players) >= self.max_players:
@@ -279,7 +428,10 @@ class PokerGame:
     def remove_player(self, player_id: str):
         self.players = [p for p in self.players if p.id != player_id]
 
-    def start_hand(self):
+    def start_hand(self, seed: Optional[int] = None):
+        # Attendre le résultat d'un showdown encore en cours d'évaluation
+        if self.pending_showdown is not None:
+            return False
         # Empêcher de démarrer s'il n'y a pas 2 joueurs capables de miser
         eligible = [p for p in self.players if p.stack > 0 and p.connected]
         if len(eligible) < 2:
@@ -293,11 +445,18 @@ class PokerGame:
         # Incrémenter le numéro de main
         self.hand_number += 1
 
-        self.create_deck()
+        self.create_deck(seed)
         self.community_cards = []
         self.pot = 0
         self.current_bet = 0
         self.phase = GamePhase.PREFLOP
+        self.hand_log = {
+            'started_at': time.time(),
+            'seed': self.hand_seed,
+            'dealer_pos': self.dealer_pos,
+            'seats': [(p.id, p.name, p.stack, p.connected, p.eligible_from_hand) for p in self.players],
+            'actions': [],
+        }
 
         # Reset player states
         for player in self.players:
@@ -320,10 +479,12 @@ class PokerGame:
             player.has_acted = False
 
         # Deal cards uniquement aux joueurs actifs et éligibles
-        for _ in range(2):
-            for player in self.players:
-                if not player.folded and not player.all_in and player.eligible_from_hand <= self.hand_number:
-                    player.hand.append(self.deck.pop())
+        # (une carte chacun puis la seconde; listes à la taille exacte, pas de réallocation par append)
+        dealt = [p for p in self.players
+                 if not p.folded and not p.all_in and p.eligible_from_hand <= self.hand_number]
+        first_cards = [self.deal_card() for _ in dealt]
+        for player, first in zip(dealt, first_cards):
+            player.hand = [first, self.deal_card()]
 
         # Post blinds
         self.post_blinds()
@@ -344,13 +505,60 @@ class PokerGame:
 
         return True
 
+    def apply_blind_level(self) -> bool:
+        """Appliquer le niveau de blinds de la main en cours (O(1)). Retourne True si le niveau a changé."""
+        structure = self.blind_structure
+        if structure is None:
+            return False
+        index = structure.level_index(self.hand_number, self.blind_level_due)
+        level = structure.level(index)
+        changed = (index != self.blind_level or self.hand_number <= 1
+                   or (level.small_blind, level.big_blind, level.ante) != (self.small_blind, self.big_blind, self.ante))
+        self.blind_level = index
+        self.small_blind, self.big_blind, self.ante = level.small_blind, level.big_blind, level.ante
+        return changed
+
+    def blinds_info(self) -> Dict:
+        """Niveau de blinds courant et suivant (événement blinds_update)."""
+        info = {'level': self.blind_level + 1, 'small_blind': self.small_blind, 'big_blind': self.big_blind,
+                'ante': self.ante}
+        structure = self.blind_structure
+        if structure is not None and not structure.is_last(self.blind_level):
+            info['next'] = structure.level(self.blind_level + 1).to_dict()
+            if structure.hands_per_level > 0:
+                info['next_at_hand'] = (self.blind_level + 1) * structure.hands_per_level + 1
+            if structure.seconds_per_level > 0:
+                info['seconds_per_level'] = structure.seconds_per_level
+        return info
+
     def post_blinds(self):
-        # Calculer les positions de blinds parmi les joueurs éligibles
+        # Niveau de blinds de la main (structure de tournoi), puis positions parmi les joueurs éligibles
+        self.blinds_changed = self.apply_blind_level() or self.blinds_changed
         eligible_indices = [i for i, p in enumerate(self.players)
                             if p.eligible_from_hand <= self.hand_number and not p.folded and not p.all_in and p.stack > 0 and p.connected]
         if len(eligible_indices) < 2:
             return
 
+        # Antes: mises mortes de chaque joueur éligible (dans le pot, sans compter dans la mise à suivre)
+        if self.ante > 0:
+            for i in eligible_indices:
+                player = self.players[i]
+                ante = min(self.ante, player.stack)
+                player.total_bet += ante
+                player.stack -= ante
+                if player.stack == 0:
+                    player.all_in = True
+                self.pot += ante
+                self.log_action(player.id, 'ante', ante)
+            # Les joueurs mis all-in par l'ante ne peuvent plus poser de blind
+            eligible_indices = [i for i in eligible_indices if not self.players[i].all_in]
+            if len(eligible_indices) < 2:
+                # Au plus un joueur peut encore miser: pas de blinds, la main va au showdown
+                self.current_bet = 0
+                if eligible_indices:
+                    self.current_player = eligible_indices[0]
+                return
+
         # Trouver le prochain index éligible après dealer_pos pour SB et BB
         def next_eligible(start_idx):
             n = len(self.players)
@@ -373,6 +581,7 @@ class PokerGame:
         if sb_player.stack == 0:
             sb_player.all_in = True
         self.pot += sb_amount
+        self.log_action(sb_player.id, 'sb', sb_amount)
 
         # Big blind
         bb_player = self.players[big_blind_pos]
@@ -383,11 +592,16 @@ class PokerGame:
         if bb_player.stack == 0:
             bb_player.all_in = True
         self.pot += bb_amount
+        self.log_action(bb_player.id, 'bb', bb_amount)
 
-        # La mise courante est la contribution du BB (peut être partielle si all-in)
-        self.current_bet = bb_player.current_bet
-        # Le joueur suivant au BB
+        # La mise courante est la plus forte contribution (le BB peut être partiel si all-in)
+        self.current_bet = max(sb_player.current_bet, bb_player.current_bet)
+        # Le joueur suivant au BB (en sautant ceux que les blinds ont mis all-in, sinon la table se bloque)
         self.current_player = next_eligible(big_blind_pos)
+        for _ in range(len(eligible_indices)):
+            if not self.players[self.current_player].all_in:
+                break
+            self.current_player = next_eligible(self.current_player)
 
     def reset_betting_round(self):
         self.current_bet = 0
@@ -425,7 +639,10 @@ class PokerGame:
 
     def advance_phase_after_betting_if_needed(self):
         """Avancer d'une phase si le tour est complet. Si tous les joueurs actifs sont all-in,
-        avancer automatiquement jusqu'au river/showdown."""
+        avancer automatiquement jusqu'au river/showdown (ou, avec `paced_runout`, laisser l'appelant
+        révéler les rues une à une via runout_step())."""
+        if self.paced_runout and self.in_runout():
+            return
         # Avancer d'au moins une phase si tour complet
         if self.is_betting_round_complete():
             if self.phase == GamePhase.PREFLOP:
@@ -448,6 +665,46 @@ class PokerGame:
             if self.phase == GamePhase.RIVER and self.all_active_all_in():
                 self.showdown()
 
+    def in_runout(self) -> bool:
+        """Main en cours où plus personne ne peut miser: au moins deux joueurs restants, tous all-in."""
+        if self.phase not in (GamePhase.PREFLOP, GamePhase.FLOP, GamePhase.TURN, GamePhase.RIVER):
+            return False
+        active = [p for p in self.players if p.eligible_from_hand <= self.hand_number and not p.folded]
+        return len(active) >= 2 and all(p.all_in for p in active)
+
+    def runout_step(self) -> bool:
+        """Révéler la rue suivante d'un all-in (ou conclure au showdown après la river)."""
+        if not self.in_runout():
+            return False
+        self.next_phase()
+        return True
+
+    def runout_equity(self, time_budget: float = 0.03) -> Optional[Dict]:
+        """Équité de chaque joueur restant sur le board actuel (cartes révélées: tous sont all-in)."""
+        if equities is None:
+            return None
+        live = [p for p in self.players
+                if p.eligible_from_hand <= self.hand_number and not p.folded and len(p.hand) == 2]
+        if len(live) < 2:
+            return None
+        result = equities([[card_index(c) for c in p.hand] for p in live],
+                          [card_index(c) for c in self.community_cards], time_budget=time_budget)
+        return {
+            'hand_number': self.hand_number,
+            'phase': self.phase.value,
+            'community': [str(c) for c in self.community_cards],
+            'players': [{
+                'player_id': p.id,
+                'name': p.name,
+                'cards': [str(c) for c in p.hand],
+                'equity': round(result['equity'][i], 4),
+                'win': round(result['win'][i], 4),
+                'tie': round(result['tie'][i], 4),
+            } for i, p in enumerate(live)],
+            'exact': result['exact'],
+            'samples': result['samples'],
+        }
+
     def next_phase(self):
         if self.phase == GamePhase.PREFLOP:
             self.flop()
@@ -460,29 +717,30 @@ class PokerGame:
 
     def flop(self):
         self.phase = GamePhase.FLOP
-        self.deck.pop()  # Burn card
+        self.deck.deal()  # Burn card
         for _ in range(3):
-            self.community_cards.append(self.deck.pop())
+            self.community_cards.append(self.deal_card())
         self.reset_betting_round()
 
     def turn(self):
         self.phase = GamePhase.TURN
-        self.deck.pop()  # Burn card
-        self.community_cards.append(self.deck.pop())
+        self.deck.deal()  # Burn card
+        self.community_cards.append(self.deal_card())
         self.reset_betting_round()
 
     def river(self):
         self.phase = GamePhase.RIVER
-        self.deck.pop()  # Burn card
-        self.community_cards.append(self.deck.pop())
+        self.deck.deal()  # Burn card
+        self.community_cards.append(self.deal_card())
         self.reset_betting_round()
 
-    def showdown(self):
-        """Gérer la phase de showdown: déterminer le gagnant et stocker le résultat avec les mains évaluées."""
-        self.phase = GamePhase.SHOWDOWN
-        # Évaluation des mains pour tous les joueurs (même couchés, pour affichage complet)
+    def build_hands_info(self, require_board: bool = True, evaluations: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """Construire le détail des mains de tous les joueurs (même couchés, pour affichage complet).
+
+        `evaluations` (id joueur -> résultat evaluate_best) évite de réévaluer des mains déjà calculées ailleurs.
+        """
         hands_info = []
-        can_eval = (evaluate_best is not None and len(self.community_cards) >= 3)
+        can_eval = evaluate_best is not None and (len(self.community_cards) >= 3 or not require_board)
         for p in self.players:
             info = {
                 'player_id': p.id,
@@ -496,13 +754,45 @@ class PokerGame:
             }
             if can_eval and p.hand:
                 try:
-                    res = evaluate_best(self.community_cards + p.hand)
+                    res = evaluations[p.id] if evaluations and p.id in evaluations else \
+                        evaluate_best(self.community_cards + p.hand)
                     info['best'] = res.get('name')
                     info['category'] = res.get('category')
                     info['rank_key'] = res.get('key')
                 except Exception:
                     pass
             hands_info.append(info)
+        return hands_info
+
+    def showdown(self):
+        """Gérer la phase de showdown: déterminer le gagnant et stocker le résultat avec les mains évaluées.
+
+        Si `defer_showdown` est actif, l'évaluation est laissée à l'appelant: la table passe en SHOWDOWN
+        avec `pending_showdown` (entrées de hand_eval.evaluate_labels) et finish_showdown() conclut la main.
+        """
+        self.phase = GamePhase.SHOWDOWN
+        if self.defer_showdown:
+            self.pending_showdown = self.showdown_request()
+            self.last_winner = {}
+            return False
+        return self.finish_showdown()
+
+    def showdown_request(self) -> Dict:
+        """Données (picklables) nécessaires à l'évaluation du showdown, hors de la table."""
+        evaluable = [p for p in self.players if p.hand] if evaluate_best is not None and len(self.community_cards) >= 3 else []
+        return {
+            'player_ids': [p.id for p in evaluable],
+            'hands': [[str(c) for c in p.hand] for p in evaluable],
+            'board': [str(c) for c in self.community_cards],
+        }
+
+    def finish_showdown(self, evaluations: Optional[List[Dict]] = None):
+        """Conclure le showdown (gagnants, pot) à partir des évaluations déjà calculées (sinon calcul ici)."""
+        request = self.pending_showdown
+        self.pending_showdown = None
+        by_id = dict(zip(request['player_ids'], evaluations)) if request and evaluations is not None else None
+        # Évaluation des mains pour tous les joueurs (même couchés, pour affichage complet)
+        hands_info = self.build_hands_info(evaluations=by_id)
 
         # Déterminer le(s) gagnant(s) parmi les joueurs non couchés
         active_infos = [h for h in hands_info if not h['folded']]
@@ -554,9 +844,7 @@ class PokerGame:
             print(f"Jeu terminé - pas assez de joueurs actifs ({len(active_players)})")
             return False
 
-        # Avancer le dealer vers le prochain joueur existant (même si broke, la position sera ajustée aux blinds)
-        if self.players:
-            self.dealer_pos = (self.dealer_pos + 1) % len(self.players)
+        # Le bouton n'avance pas ici: start_hand() le fait une seule fois par main
 
         # Réinitialiser pour la main suivante
         self.phase = GamePhase.WAITING
@@ -586,6 +874,226 @@ class PokerGame:
         # Démarrer la nouvelle main
         return self.start_hand()
 
+    def apply_action(self, player_id: str, action: str, amount: int = 0):
+        """Appliquer l'action d'un joueur et faire avancer la main.
+
+        Retourne (erreur, hand_ended, all_in_auto): erreur est None si l'action a été acceptée.
+        """
+        # Interdire toute action si aucune main n'est en cours
+        if self.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN):
+            return "La main n'est pas en cours. Lancez 'Nouvelle main' pour distribuer.", False, False
+
+        # Refuser les actions inconnues et les relances sans montant (rien n'est journalisé)
+        if action not in PLAYER_ACTIONS:
+            return 'Action inconnue', False, False
+        if action == 'raise':
+            try:
+                amount = int(amount)
+            except (TypeError, ValueError):
+                amount = 0
+            if amount <= 0:
+                return 'Montant de relance invalide', False, False
+
+        # Trouver le joueur
+        current_player = None
+        player_index = None
+        for i, player in enumerate(self.players):
+            if player.id == player_id:
+                current_player = player
+                player_index = i
+                break
+
+        if not current_player or current_player.folded:
+            return 'Action impossible', False, False
+
+        # Interdire l'action si le joueur ne peut pas miser (stack 0 ou all-in)
+        if current_player.stack <= 0 or current_player.all_in:
+            return 'Vous ne pouvez plus miser dans cette main', False, False
+
+        if player_index != self.current_player:
+            return "Ce n'est pas votre tour", False, False
+
+        # Traiter l'action
+        stack_before = current_player.stack
+        if action == 'fold':
+            current_player.folded = True
+            current_player.has_acted = True
+        elif action == 'call':
+            call_amount = min(self.current_bet - current_player.current_bet, current_player.stack)
+            current_player.current_bet += call_amount
+            current_player.stack -= call_amount
+            current_player.total_bet += call_amount
+            current_player.has_acted = True
+            if current_player.stack == 0:
+                current_player.all_in = True
+            self.pot += call_amount
+        elif action == 'raise':
+            bet_amount = min(amount, current_player.stack)
+            current_player.current_bet += bet_amount
+            current_player.stack -= bet_amount
+            current_player.total_bet += bet_amount
+            current_player.has_acted = True
+            if current_player.stack == 0:
+                current_player.all_in = True
+            self.pot += bet_amount
+            # Une relance all-in inférieure à la mise courante ne la fait pas baisser
+            self.current_bet = max(self.current_bet, current_player.current_bet)
+            # Requérir une action à nouveau pour les autres joueurs actifs
+            for p in self.players:
+                if p.id != current_player.id and not p.folded and not p.all_in:
+                    p.has_acted = False
+        elif action == 'check':
+            if self.current_bet > current_player.current_bet:
+                return 'Vous devez suivre ou relancer', False, False
+            current_player.has_acted = True
+        self.log_action(current_player.id, action, stack_before - current_player.stack)
+
+        # Déterminer fin de main ou passage au joueur suivant / phase suivante
+        active_players = [p for p in self.players if not p.folded]
+        hand_ended = False
+        all_in_auto = False
+        if len(active_players) <= 1:
+            # Fin de main par abandon des autres
+            if active_players:
+                winner = active_players[0]
+                amount = self.pot
+                winner.stack += self.pot
+                self.pot = 0
+                self.phase = GamePhase.SHOWDOWN
+                # Construire un résultat enrichi similaire à showdown()
+                hands_info = self.build_hands_info(require_board=False)
+                # Gagnant selon la règle de fold: le seul restant
+                winners = [winner.id]
+                self.last_winner = {
+                    'player_id': winner.id,
+                    'name': winner.name,
+                    'amount': amount,
+                    'reason': 'all_folded',
+                    'winners': winners,
+                    'hands': hands_info,
+                    'community': [str(c) for c in self.community_cards],
+                }
+            else:
+                self.phase = GamePhase.SHOWDOWN
+                self.last_winner = {}
+            hand_ended = True
+        else:
+            # Si le tour d'enchères est complet, avancer de phase (et potentiellement fast-forward si all-in)
+            if self.is_betting_round_complete():
+                # Détecter si tout le monde est all-in avant d'avancer (sera utilisé pour message global)
+                became_all_in = self.all_active_all_in()
+                self.advance_phase_after_betting_if_needed()
+                if self.phase == GamePhase.SHOWDOWN and (self.last_winner or self.pending_showdown is not None):
+                    hand_ended = True
+                    if became_all_in:
+                        all_in_auto = True
+            else:
+                # Passer au joueur suivant en sautant ceux qui sont fold/all-in
+                self.current_player = (self.current_player + 1) % len(self.players)
+                while self.players[self.current_player].folded or self.players[self.current_player].all_in:
+                    self.current_player = (self.current_player + 1) % len(self.players)
+
+        return None, hand_ended, all_in_auto
+
+    def log_action(self, player_id: str, action: str, amount: int):
+        """Ajouter une action au journal de la main (siège au départ de la main, action, montant, phase)."""
+        seats = self.hand_log.get('seats')
+        if seats is None:
+            return
+        seat = next((i for i, s in enumerate(seats) if s[0] == player_id), -1)
+        self.hand_log['actions'].append((seat, action, amount, self.phase.value))
+
+    def hand_record(self) -> Dict:
+        """Résumé complet de la main terminée, destiné à l'historique des mains."""
+        log = self.hand_log
+        by_id = {p.id: p for p in self.players}
+        seats = []
+        for player_id, name, stack, connected, eligible_from_hand in log.get('seats', []):
+            p = by_id.get(player_id)
+            seats.append({
+                'player_id': player_id,
+                'name': name,
+                'stack': stack,
+                'connected': connected,
+                'eligible_from_hand': eligible_from_hand,
+                'cards': [str(c) for c in p.hand] if p else [],
+                'final_stack': p.stack if p else 0,
+                'folded': p.folded if p else True,
+            })
+        seat_of = {s['player_id']: i for i, s in enumerate(seats)}
+        result = self.last_winner or {}
+        return {
+            'game_id': self.id,
+            'hand_number': self.hand_number,
+            'started_at': log.get('started_at', 0.0),
+            'dealer_pos': log.get('dealer_pos', self.dealer_pos),
+            'seed': log.get('seed'),
+            'small_blind': self.small_blind,
+            'big_blind': self.big_blind,
+            'ante': self.ante,
+            'seats': seats,
+            'board': [str(c) for c in self.community_cards],
+            'actions': list(log.get('actions', [])),
+            'pot': result.get('amount', 0),
+            'reason': result.get('reason', ''),
+            'winners': [seat_of[w] for w in result.get('winners', []) if w in seat_of],
+        }
+
+    def result_summary(self) -> Dict:
+        """Résultat compact de la main terminée (événement hand_result): gagnants, montant et mains
+        abattues seulement. Le détail complet est servi à la demande (hand_detail())."""
+        result = self.last_winner or {}
+        summary = {
+            'hand_number': self.hand_number,
+            'player_id': result.get('player_id'),
+            'name': result.get('name', ''),
+            'amount': result.get('amount', 0),
+            'reason': result.get('reason', ''),
+            'winners': result.get('winners', []),
+        }
+        if result.get('reason') == 'showdown':
+            summary['hands'] = [{'player_id': h['player_id'], 'cards': h['cards'], 'best': h['best']}
+                                for h in result.get('hands', ()) if not h['folded'] and h['cards']]
+        return summary
+
+    def hand_detail(self, record: Optional[Dict] = None) -> Dict:
+        """Détail complet de la main terminée: mains évaluées (cartes des joueurs couchés non montrées),
+        board et actions nommées. `record`: hand_record() déjà calculé, le cas échéant."""
+        record = record or self.hand_record()
+        result = self.last_winner or {}
+        names = [seat['name'] for seat in record['seats']]
+        hands = []
+        for h in result.get('hands', ()):
+            shown = not h['folded'] and result.get('reason') == 'showdown'
+            hands.append({'player_id': h['player_id'], 'name': h['name'], 'folded': h['folded'], 'all_in': h['all_in'],
+                          'cards': h['cards'] if shown else [], 'best': h['best'] if shown else None,
+                          'category': h['category'] if shown else None,
+                          'rank_key': h['rank_key'] if shown else None})
+        return {
+            'game_id': self.id,
+            'hand_number': record['hand_number'],
+            'small_blind': record['small_blind'],
+            'big_blind': record['big_blind'],
+            'ante': record.get('ante', 0),
+            'dealer': names[record['dealer_pos']] if record['dealer_pos'] < len(names) else None,
+            'board': record['board'],
+            'actions': [{'name': names[seat] if 0 <= seat < len(names) else None, 'action': action,
+                         'amount': amount, 'phase': phase} for seat, action, amount, phase in record['actions']],
+            'pot': record['pot'],
+            'reason': record['reason'],
+            'winners': result.get('winners', []),
+            'hands': hands,
+        }
+
+    def private_overlay(self, player_id: str) -> Optional[Dict]:
+        """Part privée de l'état pour un joueur (ses cartes), en complément de to_dict() public. None sans cartes."""
+        for seat, p in enumerate(self.players):
+            if p.id == player_id:
+                if not p.hand:
+                    return None
+                return {'hand': [str(c) for c in p.hand], 'seat': seat, 'hand_number': self.hand_number}
+        return None
+
     def get_active_players(self):
         return [p for p in self.players if not p.folded and p.stack > 0]
 
@@ -638,24 +1146,49 @@ def cleanup_games():
 
     print(f"✅ Nettoyage terminé: {players_removed} joueurs automatiques supprimés, {len(games_to_remove)} parties vides supprimées")
 
+def _serve_asset(relpath: str):
+    """Servir un fichier du build depuis l'index: variante précompressée, validateurs HTTP et envoi
+    par le serveur (wsgi.file_wrapper / sendfile, ou X-Sendfile). None si le fichier n'est pas dans le build."""
+    asset = static_index.get(relpath)
+    if asset is None:
+        return None
+    encoding, path, size, etag = asset.select(request.accept_encodings)
+    if not is_resource_modified(request.environ, etag=etag, last_modified=asset.last_modified):
+        resp = app.response_class(status=304)
+    elif app.config['USE_X_SENDFILE']:
+        resp = app.response_class(mimetype=asset.mimetype, headers={'X-Sendfile': path})
+        resp.content_length = size
+    else:
+        resp = app.response_class(wrap_file(request.environ, open(path, 'rb')), mimetype=asset.mimetype,
+                                  direct_passthrough=True)
+        resp.content_length = size
+    if encoding is not None and resp.status_code != 304:
+        resp.headers['Content-Encoding'] = encoding
+    if asset.variants:
+        resp.headers['Vary'] = 'Accept-Encoding'
+    resp.set_etag(etag)
+    resp.last_modified = asset.last_modified
+    # Nom haché: contenu immuable, cache d'un an; sinon revalidation à chaque chargement (ETag -> 304)
+    resp.headers['Cache-Control'] = (f'public, max-age={IMMUTABLE_MAX_AGE}, immutable' if asset.immutable
+                                     else 'no-cache')
+    if resp.status_code == 200 and not app.config['USE_X_SENDFILE']:
+        resp = resp.make_conditional(request.environ, accept_ranges=True, complete_length=size)
+    return resp
+
 @app.route('/')
 def index():
     # Si le build React existe, le servir à la racine
-    index_path = os.path.join(BUILD_DIR, 'index.html')
-    if os.path.exists(index_path):
-        return send_from_directory(BUILD_DIR, 'index.html')
+    resp = _serve_asset('index.html')
+    if resp is not None:
+        return resp
     # Sinon, fallback sur le template existant
     return render_template('index.html')
 
 # Servir les assets du build React si présents (sans capturer /socket.io/)
 @app.route('/static/<path:filename>')
 def react_static(filename):
-    static_dir = os.path.join(BUILD_DIR, 'static')
-    file_path = os.path.join(static_dir, filename)
-    if os.path.exists(file_path):
-        return send_from_directory(static_dir, filename)
     # 404 si non présent (la route Flask /static des templates n’est pas utilisée ici)
-    return ('', 404)
+    return _serve_asset(f'static/{filename}') or ('', 404)
 
 @app.route('/manifest.json')
 @app.route('/asset-manifest.json')
@@ -664,11 +1197,7 @@ def react_static(filename):
 @app.route('/logo512.png')
 def react_assets():
     # Servir certains assets à la racine du build React
-    requested = request.path.lstrip('/')
-    file_path = os.path.join(BUILD_DIR, requested)
-    if os.path.exists(file_path):
-        return send_from_directory(BUILD_DIR, requested)
-    return ('', 404)
+    return _serve_asset(request.path.lstrip('/')) or ('', 404)
 
 @app.route('/healthz')
 def healthz():
@@ -676,28 +1205,48 @@ def healthz():
 
 @app.route('/game/<game_id>')
 def game(game_id):
-    if game_id not in games:
+    if game_id not in games and not (hibernated is not None and game_id in hibernated):
         return redirect(url_for('index'))
     return render_template('game.html', game_id=game_id)
 
+@app.get('/api/games/<game_id>/hands/<int:hand_number>')
+def hand_detail_api(game_id, hand_number):
+    """Détail d'une main terminée (en cache), avec ETag: une main terminée ne change plus."""
+    cached = hand_details.get((game_id, hand_number))
+    if cached is None:
+        return jsonify({'error': 'Main inconnue ou trop ancienne'}), 404
+    _, body, etag = cached
+    if request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(body, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'public, max-age=86400, immutable'
+    return resp
+
 @app.get('/api/games')
 def list_games():
-    """Lister les parties ouvertes (au moins 1 joueur)."""
-    result = []
-    for gid, game in games.items():
-        if not game.players:
-            continue
-        result.append({
-            'id': gid,
-            'players': len(game.players),
-            'connected': sum(1 for p in game.players if p.connected),
-            'phase': game.phase.value,
-            'host': (game.players[0].name if game.players else ''),
-            'can_join': len(game.players) < game.max_players,
-        })
-    # Trier: plus de connectés d'abord, puis nb joueurs, puis id
-    result.sort(key=lambda g: (-g['connected'], -g['players'], g['id']))
-    return jsonify({'games': result})
+    """Lister les parties ouvertes (au moins 1 joueur): corps pré-encodé, ETag/Last-Modified et 304."""
+    cache = lobby.refresh()
+    etag = cache.etag
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag) or request.if_none_match.contains(f'{etag}-gz')
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and cache.last_modified <= since
+    use_gzip = 0 < LOBBY_GZIP_MIN_BYTES <= len(cache.body) and request.accept_encodings.quality('gzip') > 0
+    if not_modified:
+        resp = app.response_class(status=304)
+    elif use_gzip:
+        resp = app.response_class(cache.gzip_body(), mimetype='application/json')
+        resp.headers['Content-Encoding'] = 'gzip'
+    else:
+        resp = app.response_class(cache.body, mimetype='application/json')
+    resp.set_etag(f'{etag}-gz' if use_gzip else etag)
+    resp.last_modified = cache.last_modified
+    resp.headers['Cache-Control'] = 'no-cache'
+    resp.headers['Vary'] = 'Accept-Encoding'
+    return resp
 
 # --- NEW: helpers & sockets pour push open games ---
 
@@ -714,25 +1263,324 @@ def _compute_open_games():
             'host': (game.players[0].name if game.players else ''),
             'can_join': len(game.players) < game.max_players,
         })
+    # Tables hibernées: toujours rejoignables depuis le lobby (réveillées au join_game)
+    if hibernated is not None:
+        try:
+            asleep_ids = [gid for gid in hibernated if gid not in games]
+        except Exception as e:
+            print(f"[HIBERNATE] liste des tables hibernées indisponible: {e}")
+            asleep_ids = []
+        for gid in asleep_ids:
+            result.append(_asleep.get(gid) or {
+                'id': gid, 'players': 0, 'connected': 0, 'phase': 'waiting',
+                'host': '', 'can_join': True, 'asleep': True,
+            })
+    # Trier: plus de connectés d'abord, puis nb joueurs, puis id
     result.sort(key=lambda g: (-g['connected'], -g['players'], g['id']))
     return result
 
 
+# Liste du lobby calculée et encodée une fois par version (voir lobby.py)
+lobby = LobbyCache(_compute_open_games)
+
+
+def _emit_event(event: str, payload, room: Optional[str] = None):
+    """Émettre vers une room (ou à tous): JSON par défaut, MessagePack pour les clients qui l'ont demandé.
+
+    Les clients binaires sont cherchés parmi les participants de la room (O(taille de la room)), pas
+    parmi toutes les connexions. La répartition est propre à chaque worker: avec une file de messages
+    (REDIS_URL), seules les connexions locales sont connues; un client binaire servi par un autre worker
+    reçoit alors le JSON, qu'il doit donc aussi accepter.
+    """
+    if not _wire_formats:
+        binary = []
+    elif room is None:
+        binary = [sid for sid, fmt in list(_wire_formats.items()) if fmt == 'msgpack']
+    else:
+        binary = [sid for sid, _ in socketio.server.manager.get_participants('/', room)
+                  if _wire_formats.get(sid) == 'msgpack']
+    if not binary:
+        socketio.emit(event, payload, room=room)
+        return
+    socketio.emit(event, payload, room=room, skip_sid=binary)
+    data = wire.encode(payload)  # encodé une seule fois pour tous les clients binaires
+    for sid in binary:
+        socketio.emit(event, data, to=sid)
+
+
+def _fan_out_state(game_id: str, game: PokerGame, overlays=False):
+    """Synchroniser la table: l'état public (cartes masquées) est sérialisé une seule fois pour la room,
+    puis chaque joueur reçoit dans sa room personnelle le petit complément privé (ses cartes, `hand_dealt`).
+
+    `overlays`: False (état public seul), True (tous les joueurs servis) ou liste d'ids de joueurs.
+    """
+    state = game.to_dict()
+    _emit_event('game_update', state, room=game_id)
+    lobby.invalidate()  # phase et connectés affichés dans le lobby
+    channel = _spectators.get(game_id)
+    if channel is not None:
+        channel.update(state)
+        _arm_spectator_flush(game_id, channel)
+    if not overlays:
+        return
+    wanted = None if overlays is True else set(overlays)
+    for player in game.players:
+        if wanted is not None and player.id not in wanted:
+            continue
+        overlay = game.private_overlay(player.id)
+        if overlay:
+            socketio.emit('hand_dealt', overlay, room=player.id)
+
+
+def _watch_room(game_id: str) -> str:
+    """Room des spectateurs d'une table (distincte de la room des joueurs: aucun événement privé)."""
+    return f'watch:{game_id}'
+
+
+def _arm_spectator_flush(game_id: str, channel: SpectatorChannel):
+    """Regrouper les mises à jour pour les spectateurs: un seul delta par intervalle et par table."""
+    key = ('spectators', game_id)
+    if channel.watchers <= 0 or scheduler.pending(key) is not None:
+        return
+    scheduler.schedule(key, SPECTATOR_UPDATE_SECONDS, _flush_spectators, game_id)
+    _ensure_scheduler()
+
+
+def _flush_spectators(game_id: str):
+    channel = _spectators.get(game_id)
+    if channel is None or channel.watchers <= 0:
+        return
+    delta = channel.delta()
+    if delta is None:
+        return
+    delta['game_id'] = game_id
+    try:
+        _emit_event('spectator_delta', delta, room=_watch_room(game_id))
+    except Exception as e:
+        print(f"[EMIT] spectator_delta error: {e}")
+
+
+def _stop_spectating(sid: str):
+    game_id = _spectating.pop(sid, None)
+    if game_id is None:
+        return
+    try:
+        leave_room(_watch_room(game_id), sid=sid)
+    except Exception:
+        pass
+    channel = _spectators.get(game_id)
+    if channel is not None:
+        channel.watchers -= 1
+        if channel.watchers <= 0:
+            del _spectators[game_id]
+            scheduler.cancel(('spectators', game_id))
+
+
+def _emit_self(event: str, payload):
+    """Répondre au client courant dans le format qu'il a négocié."""
+    emit(event, wire.encode(payload) if _wire_formats.get(request.sid) == 'msgpack' else payload)
+
+
+# Dernière version du lobby diffusée à tous les sockets
+_broadcast_lobby_version = 0
+
+
 def _broadcast_open_games():
+    """Diffuser `open_games` à tous, seulement si la liste a changé depuis la dernière diffusion."""
+    global _broadcast_lobby_version
     try:
-        payload = {'games': _compute_open_games()}
-        socketio.emit('open_games', payload)
+        lobby.invalidate()
+        cache = lobby.refresh()
+        if cache.version == _broadcast_lobby_version:
+            return
+        _broadcast_lobby_version = cache.version
+        _emit_event('open_games', {'games': cache.games, 'version': cache.version})
     except Exception as e:
         print(f"[EMIT] open_games broadcast error: {e}")
 
 
+def _emit_blinds_update(game_id: str, game: PokerGame):
+    """Pousser le niveau de blinds à la room s'il a changé au démarrage de la main (delta, pas dans game_update)."""
+    if game.blind_structure is None:
+        return
+    _arm_blind_timer(game_id, game)
+    if not game.blinds_changed:
+        return
+    game.blinds_changed = False
+    try:
+        _emit_event('blinds_update', game.blinds_info(), room=game_id)
+    except Exception as e:
+        print(f"[EMIT] blinds_update error: {e}")
+
+
+def _emit_self_blinds(game: PokerGame):
+    """Niveau de blinds courant pour un joueur qui (re)joint une table à structure de tournoi."""
+    if game.blind_structure is not None and game.hand_number > 0:
+        _emit_self('blinds_update', game.blinds_info())
+
+
+def _arm_blind_timer(game_id: str, game: PokerGame):
+    """Programmer la prochaine montée de niveau au temps (une échéance par table dans l'ordonnanceur partagé)."""
+    structure = game.blind_structure
+    key = ('blinds', game_id)
+    # Tables de tournoi: niveau imposé par le directeur (horloge unique, cf. _arm_tournament_blinds)
+    if structure is None or game.tournament_id or structure.seconds_per_level <= 0 or structure.is_last(game.blind_level_due) \
+            or scheduler.pending(key) is not None:
+        return
+    scheduler.schedule(key, structure.seconds_per_level, _on_blind_level_up, game_id)
+    _ensure_scheduler()
+
+
+def _on_blind_level_up(game_id: str):
+    """Échéance de niveau atteinte: les nouvelles blinds s'appliquent à la prochaine main (post_blinds)."""
+    game = games.get(game_id)
+    if not game or game.blind_structure is None:
+        return
+    game.blind_level_due = max(game.blind_level_due, game.blind_level) + 1
+    level = game.blind_structure.level(game.blind_level_due)
+    try:
+        socketio.emit('table_message', {'text': f"⏫ Blinds {level.small_blind}/{level.big_blind}"
+                                                + (f" (ante {level.ante})" if level.ante else '')
+                                                + " à partir de la prochaine main"}, room=game_id)
+    except Exception as e:
+        print(f"[EMIT] table_message (blinds) error: {e}")
+    _arm_blind_timer(game_id, game)
+
+
+def _emit_hand_result(game_id: str, game: PokerGame, all_in_auto: bool = False):
+    """Diffuser le résultat de la main terminée et l'archiver dans l'historique des mains."""
+    if all_in_auto:
+        try:
+            socketio.emit('table_message', {'text': 'All‑in — révélation automatique des cartes'}, room=game_id)
+        except Exception as e:
+            print(f"[EMIT] table_message error: {e}")
+    try:
+        summary = game.result_summary()
+        _emit_event('hand_result', summary, room=game_id)
+        if game_id in _spectators:
+            _emit_event('hand_result', summary, room=_watch_room(game_id))
+    except Exception as e:
+        print(f"[EMIT] hand_result error: {e}")
+    if game.last_winner:
+        record = game.hand_record()
+        _cache_hand_detail(game, record)
+        if hand_history is not None:
+            try:
+                hand_history.write(record)
+            except Exception as e:
+                print(f"[HISTORY] enregistrement de la main impossible: {e}")
+    if game.tournament_id:
+        _tournament_hand_finished(game_id, game)
+
+
+def _cache_hand_detail(game: PokerGame, record: Dict):
+    """Garder le détail de la main terminée, encodé une fois (JSON + ETag), pour les demandes à venir."""
+    try:
+        detail = game.hand_detail(record)
+        body = json.dumps(detail, separators=(',', ':')).encode('utf-8')
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        hand_details.put((game.id, record['hand_number']), (detail, body, etag))
+    except Exception as e:
+        print(f"[DETAIL] mise en cache du détail impossible ({game.id}): {e}")
+
+
+def _finish_hand(game_id: str, game: PokerGame, all_in_auto: bool = False):
+    """Main terminée: publier le résultat, ou lancer l'évaluation déportée du showdown s'il est en attente."""
+    if game.pending_showdown is None:
+        _emit_hand_result(game_id, game, all_in_auto=all_in_auto)
+        return
+    if game_id in _showdown_jobs:
+        return
+    request = game.pending_showdown
+    future = showdown_pool.submit(evaluate_labels, request['hands'], request['board'])
+    _showdown_jobs[game_id] = (future, game, all_in_auto)
+    _arm_showdown_poll()
+
+
+def _arm_showdown_poll():
+    """Une seule échéance de l'ordonnanceur surveille toutes les évaluations en cours (pas de tâche par main)."""
+    key = ('showdowns',)
+    if _showdown_jobs and scheduler.pending(key) is None:
+        scheduler.schedule(key, SHOWDOWN_POLL_SECONDS, _poll_showdowns)
+        _ensure_scheduler()
+
+
+def _poll_showdowns():
+    """Conclure et diffuser les mains dont l'évaluation déportée du showdown est terminée."""
+    for game_id, (future, game, all_in_auto) in list(_showdown_jobs.items()):
+        if not future.done():
+            continue
+        del _showdown_jobs[game_id]
+        try:
+            evaluations = future.result()
+        except Exception as e:
+            print(f"[SHOWDOWN] évaluation déportée impossible ({game_id}), calcul local: {e}")
+            evaluations = None
+        if game.pending_showdown is None:
+            continue
+        game.finish_showdown(evaluations)
+        _emit_hand_result(game_id, game, all_in_auto=all_in_auto)
+        _fan_out_state(game_id, game)
+    _arm_showdown_poll()
+
+
+def _start_runout(game_id: str, game: PokerGame):
+    """All-in de tous les joueurs restants: révéler les rues une à une, avec les équités de chacun."""
+    key = ('runout', game_id)
+    if not game.paced_runout or not game.in_runout() or scheduler.pending(key) is not None:
+        return
+    try:
+        socketio.emit('table_message', {'text': 'All‑in — révélation des cartes rue par rue'}, room=game_id)
+    except Exception as e:
+        print(f"[EMIT] table_message error: {e}")
+    _emit_runout_equity(game_id, game)
+    scheduler.schedule(key, ALLIN_RUNOUT_SECONDS, _runout_tick, game_id, game.hand_number)
+    _ensure_scheduler()
+
+
+def _runout_tick(game_id: str, hand_number: int):
+    game = games.get(game_id)
+    if game is None or game.hand_number != hand_number or not game.runout_step():
+        return
+    _fan_out_state(game_id, game)
+    if game.phase == GamePhase.SHOWDOWN:
+        _finish_hand(game_id, game)
+        return
+    _emit_runout_equity(game_id, game)
+    scheduler.schedule(('runout', game_id), ALLIN_RUNOUT_SECONDS, _runout_tick, game_id, hand_number)
+
+
+def _emit_runout_equity(game_id: str, game: PokerGame):
+    try:
+        payload = game.runout_equity(ALLIN_EQUITY_BUDGET_MS / 1000)
+    except Exception as e:
+        print(f"[EQUITY] calcul impossible ({game_id}): {e}")
+        return
+    if payload:
+        _emit_event('allin_equity', payload, room=game_id)
+
+
 @socketio.on('request_open_games')
 def handle_request_open_games():
     try:
-        emit('open_games', {'games': _compute_open_games()})
+        cache = lobby.refresh()
+        _emit_self('open_games', {'games': cache.games, 'version': cache.version})
     except Exception as e:
         emit('error', {'message': f'Impossible de lister les parties: {e}'})
 
+@socketio.on('set_wire_format')
+def handle_set_wire_format(data):
+    """Négocier le format des événements d'état pour cette connexion: 'json' (défaut) ou 'msgpack'."""
+    fmt = (data or {}).get('format', 'json')
+    if fmt not in wire.FORMATS:
+        emit('error', {'message': f"Format inconnu: {fmt} (attendu: {', '.join(wire.FORMATS)})"})
+        return
+    if fmt == 'json':
+        _wire_formats.pop(request.sid, None)
+    else:
+        _wire_formats[request.sid] = fmt
+    emit('wire_format', {'format': fmt})
+
 @socketio.on('connect')
 def handle_connect():
     """Gérer la connexion d'un client"""
@@ -750,6 +1598,8 @@ def handle_connect():
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    _wire_formats.pop(request.sid, None)
+    _stop_spectating(request.sid)
     player_id = sio_session.get('player_id')
     if player_id:
         # Mark player as disconnected in all games
@@ -761,6 +1611,43 @@ def handle_disconnect():
         # NEW: mettre à jour le lobby par push
         _broadcast_open_games()
 
+@socketio.on('spectate_game')
+def handle_spectate_game(data):
+    """Regarder une table sans y prendre de siège: état public seulement (room séparée, deltas groupés)."""
+    game_id = (data or {}).get('game_id')
+    game = _get_game(game_id)
+    if game is None:
+        emit('error', {'message': 'Partie non trouvée'})
+        return
+    if _spectating.get(request.sid) != game_id:
+        _stop_spectating(request.sid)
+        join_room(_watch_room(game_id))
+        _spectating[request.sid] = game_id
+        channel = _spectators.setdefault(game_id, SpectatorChannel())
+        channel.watchers += 1
+    channel = _spectators[game_id]
+    if channel.snapshot is None:
+        channel.update(game.to_dict())
+    _emit_self('spectator_state', dict(channel.subscribe(), game_id=game_id))
+
+
+@socketio.on('request_hand_detail')
+def handle_request_hand_detail(data):
+    """Détail d'une main terminée, à la demande (le résultat diffusé à la room est compact)."""
+    data = data or {}
+    cached = hand_details.get((data.get('game_id'), data.get('hand_number')))
+    if cached is None:
+        emit('error', {'message': 'Détail de la main indisponible'})
+        return
+    _emit_self('hand_detail', cached[0])
+
+
+@socketio.on('stop_spectating')
+def handle_stop_spectating(data=None):
+    _stop_spectating(request.sid)
+    emit('spectating_stopped', {})
+
+
 @socketio.on('create_game')
 def handle_create_game(data):
     player_id = sio_session.get('player_id')
@@ -782,8 +1669,10 @@ def handle_create_game(data):
 
     # Créer une nouvelle partie
     game_id = str(uuid.uuid4())[:8]
-    game = PokerGame(id=game_id)
+    game = PokerGame(id=game_id, defer_showdown=showdown_pool is not None, paced_runout=ALLIN_RUNOUT_SECONDS > 0,
+                     blind_structure=blind_structure)
     games[game_id] = game
+    _arm_reaper()
 
     # Ajouter le joueur créateur
     result = game.add_player(player_id, player_name.strip())
@@ -795,10 +1684,9 @@ def handle_create_game(data):
         # Envoyer les événements au créateur
         emit('game_created', {'game_id': game_id, 'player_id': player_id})
         emit('game_joined', {'game_id': game_id, 'player_id': player_id})
-        emit('game_update', game.to_dict(player_id))
 
-        # Aussi envoyer à toute la room
-        socketio.emit('game_update', game.to_dict(), room=game_id)
+        # État public à la room (le créateur vient d'y entrer)
+        _fan_out_state(game_id, game)
         print(f"PARTIE CRÉÉE: {player_name} ({player_id}) a créé la partie {game_id}")
         # NEW: pousser la liste des parties
         _broadcast_open_games()
@@ -825,13 +1713,14 @@ def handle_join_game(data):
     if not player_name or player_name.strip() == '':
         emit('error', {'message': 'Nom de joueur requis'})
         return
+    # Un spectateur qui prend un siège quitte la room des spectateurs
+    _stop_spectating(request.sid)
 
-    if game_id not in games:
+    game = _get_game(game_id)
+    if game is None:
         emit('error', {'message': 'Partie non trouvée'})
         return
 
-    game = games[game_id]
-
     # Vérifier si le joueur existe déjà dans cette partie
     existing_player = next((p for p in game.players if p.id == player_id), None)
     if existing_player:
@@ -840,7 +1729,9 @@ def handle_join_game(data):
         join_room(game_id)
         player_game_mapping[player_id] = game_id
         emit('game_joined', {'game_id': game_id, 'player_id': player_id})
-        socketio.emit('game_update', game.to_dict(), room=game_id)
+        # Rendre au joueur reconnecté ses cartes de la main en cours
+        _fan_out_state(game_id, game, overlays=[player_id])
+        _emit_self_blinds(game)
         print(f"RECONNEXION: {player_name} ({player_id}) s'est reconnecté à la partie {game_id}")
         # NEW: mettre à jour le lobby (compte des connectés)
         _broadcast_open_games()
@@ -865,7 +1756,8 @@ def handle_join_game(data):
         join_room(game_id)
         player_game_mapping[player_id] = game_id
         emit('game_joined', {'game_id': game_id, 'player_id': player_id})
-        socketio.emit('game_update', game.to_dict(), room=game_id)
+        _fan_out_state(game_id, game)
+        _emit_self_blinds(game)
         print(f"NOUVEAU JOUEUR: {player_name} ({player_id}) a rejoint la partie {game_id}")
         # NEW: pousser la liste des parties
         _broadcast_open_games()
@@ -879,14 +1771,13 @@ def handle_join_game(data):
 def handle_start_game(data):
     game_id = data['game_id']
 
-    if game_id not in games:
+    game = _get_game(game_id)
+    if game is None:
         emit('error', {'message': 'Partie non trouvée'})
         return
 
-    game = games[game_id]
-
-    # Empêcher le démarrage si une main est déjà en cours
-    if game.phase not in (GamePhase.WAITING, GamePhase.SHOWDOWN):
+    # Empêcher le démarrage si une main est déjà en cours (ou si son résultat est encore en calcul)
+    if game.phase not in (GamePhase.WAITING, GamePhase.SHOWDOWN) or game.pending_showdown is not None:
         emit('error', {'message': 'Une main est déjà en cours'})
         return
 
@@ -894,27 +1785,18 @@ def handle_start_game(data):
     eligible = [p for p in game.players if p.stack > 0 and p.connected]
     if len(eligible) < 2:
         emit('error', {'message': "Impossible de démarrer: pas assez de joueurs capables de miser"})
-        socketio.emit('game_update', game.to_dict(), room=game_id)
+        _fan_out_state(game_id, game)
         return
 
     if game.start_hand():
         socketio.emit('game_started', room=game_id)
-        socketio.emit('game_update', game.to_dict(), room=game_id)
-        for player in game.players:
-            if player.hand:
-                socketio.emit('hand_dealt', {
-                    'hand': [str(card) for card in player.hand]
-                }, room=player.id)
+        _fan_out_state(game_id, game, overlays=True)
+        _emit_blinds_update(game_id, game)
+        _start_runout(game_id, game)
         # En cas de fin instantanée (all-in), ne pas auto-démarrer une nouvelle main
-        if game.phase == GamePhase.SHOWDOWN and game.last_winner:
-            try:
-                socketio.emit('table_message', {'text': 'All‑in — révélation automatique des cartes'}, room=game_id)
-            except Exception as e:
-                print(f"[EMIT] table_message (instant) error: {e}")
-            try:
-                socketio.emit('hand_result', game.last_winner, room=game_id)
-            except Exception as e:
-                print(f"[EMIT] hand_result (instant) error: {e}")
+        if game.phase == GamePhase.SHOWDOWN and (game.last_winner or game.pending_showdown is not None):
+            _finish_hand(game_id, game, all_in_auto=True)
+        _arm_action_timer(game_id, game)
         print(f"Partie {game_id} commencée")
     else:
         emit('error', {'message': "Impossible de démarrer: pas assez de joueurs capables de miser"})
@@ -925,167 +1807,71 @@ def handle_player_action(data):
     action = data['action']
     amount = data.get('amount', 0)
 
-    if game_id not in games:
+    game = _get_game(game_id)
+    if game is None:
         emit('error', {'message': 'Partie non trouvée'})
         return
 
-    game = games[game_id]
-
-    # Interdire toute action si aucune main n'est en cours
-    if game.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN):
-        emit('error', {'message': "La main n'est pas en cours. Lancez 'Nouvelle main' pour distribuer."})
+    error, hand_ended, all_in_auto = game.apply_action(sio_session.get('player_id'), action, amount)
+    if error:
+        emit('error', {'message': error})
         return
 
-    player_id = sio_session.get('player_id')
+    _broadcast_after_action(game_id, game, hand_ended, all_in_auto)
 
-    # Trouver le joueur
-    current_player = None
-    player_index = None
-    for i, player in enumerate(game.players):
-        if player.id == player_id:
-            current_player = player
-            player_index = i
-            break
-
-    if not current_player or current_player.folded:
-        emit('error', {'message': 'Action impossible'})
-        return
 
-    # Interdire l'action si le joueur ne peut pas miser (stack 0 ou all-in)
-    if current_player.stack <= 0 or current_player.all_in:
-        emit('error', {'message': 'Vous ne pouvez plus miser dans cette main'})
-        return
+def _broadcast_after_action(game_id: str, game: PokerGame, hand_ended: bool, all_in_auto: bool):
+    """Notifications et mises à jour après une action acceptée (joueur ou action automatique)."""
+    if hand_ended:
+        _finish_hand(game_id, game, all_in_auto=all_in_auto)
+        # Ne pas auto-planifier la prochaine main; laisser le bouton "Nouvelle main"
+    _fan_out_state(game_id, game)
+    _start_runout(game_id, game)
+    _arm_action_timer(game_id, game)
+
+
+def _action_token(game: PokerGame) -> tuple:
+    """Identifie un tour de parole: un minuteur dont le jeton ne correspond plus est périmé."""
+    return game.hand_number, game.current_player, len(game.hand_log.get('actions', ()))
 
-    if player_index != game.current_player:
-        emit('error', {'message': "Ce n'est pas votre tour"})
+
+def _arm_action_timer(game_id: str, game: PokerGame):
+    """(Re)programmer le délai de parole du joueur courant, ou l'annuler si personne n'a la parole."""
+    key = ('action', game_id)
+    if ACTION_TIMEOUT_SECONDS <= 0 or game.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN) or not game.players \
+            or game.in_runout():
+        scheduler.cancel(key)
         return
+    scheduler.schedule(key, ACTION_TIMEOUT_SECONDS, _on_action_timeout, game_id, _action_token(game))
+    _ensure_scheduler()
 
-    # Traiter l'action
-    if action == 'fold':
-        current_player.folded = True
-        current_player.has_acted = True
-    elif action == 'call':
-        call_amount = min(game.current_bet - current_player.current_bet, current_player.stack)
-        current_player.current_bet += call_amount
-        current_player.stack -= call_amount
-        current_player.total_bet += call_amount
-        current_player.has_acted = True
-        if current_player.stack == 0:
-            current_player.all_in = True
-        game.pot += call_amount
-    elif action == 'raise':
-        if amount > 0:
-            bet_amount = min(amount, current_player.stack)
-            current_player.current_bet += bet_amount
-            current_player.stack -= bet_amount
-            current_player.total_bet += bet_amount
-            current_player.has_acted = True
-            if current_player.stack == 0:
-                current_player.all_in = True
-            game.pot += bet_amount
-            game.current_bet = current_player.current_bet
-            # Requérir une action à nouveau pour les autres joueurs actifs
-            for p in game.players:
-                if p.id != current_player.id and not p.folded and not p.all_in:
-                    p.has_acted = False
-    elif action == 'check':
-        if game.current_bet > current_player.current_bet:
-            emit('error', {'message': 'Vous devez suivre ou relancer'})
-            return
-        current_player.has_acted = True
-
-    # Déterminer fin de main ou passage au joueur suivant / phase suivante
-    active_players = [p for p in game.players if not p.folded]
-    hand_ended = False
-    all_in_auto = False
-    if len(active_players) <= 1:
-        # Fin de main par abandon des autres
-        if active_players:
-            winner = active_players[0]
-            amount = game.pot
-            winner.stack += game.pot
-            game.pot = 0
-            game.phase = GamePhase.SHOWDOWN
-            # Construire un résultat enrichi similaire à showdown()
-            hands_info = []
-            can_eval = (evaluate_best is not None)
-            for p in game.players:
-                info = {
-                    'player_id': p.id,
-                    'name': p.name,
-                    'cards': [str(c) for c in p.hand],
-                    'folded': p.folded,
-                    'all_in': p.all_in,
-                    'best': None,
-                    'category': None,
-                    'rank_key': None,
-                }
-                if can_eval and p.hand:
-                    try:
-                        res = evaluate_best(game.community_cards + p.hand)
-                        info['best'] = res.get('name')
-                        info['category'] = res.get('category')
-                        info['rank_key'] = res.get('key')
-                    except Exception:
-                        pass
-                hands_info.append(info)
-            # Gagnant selon la règle de fold: le seul restant
-            winners = [winner.id]
-            game.last_winner = {
-                'player_id': winner.id,
-                'name': winner.name,
-                'amount': amount,
-                'reason': 'all_folded',
-                'winners': winners,
-                'hands': hands_info,
-                'community': [str(c) for c in game.community_cards],
-            }
-        else:
-            game.phase = GamePhase.SHOWDOWN
-            game.last_winner = {}
-        hand_ended = True
-    else:
-        # Si le tour d'enchères est complet, avancer de phase (et potentiellement fast-forward si all-in)
-        if game.is_betting_round_complete():
-            # Détecter si tout le monde est all-in avant d'avancer (sera utilisé pour message global)
-            became_all_in = game.all_active_all_in()
-            game.advance_phase_after_betting_if_needed()
-            if game.phase == GamePhase.SHOWDOWN and game.last_winner:
-                hand_ended = True
-                if became_all_in:
-                    all_in_auto = True
-        else:
-            # Passer au joueur suivant en sautant ceux qui sont fold/all-in
-            game.current_player = (game.current_player + 1) % len(game.players)
-            while game.players[game.current_player].folded or game.players[game.current_player].all_in:
-                game.current_player = (game.current_player + 1) % len(game.players)
 
-    # Notifications et mises à jour
-    if hand_ended:
-        if all_in_auto:
-            try:
-                socketio.emit('table_message', {'text': 'All‑in — révélation automatique des cartes'}, room=game_id)
-            except Exception as e:
-                print(f"[EMIT] table_message error: {e}")
-        try:
-            socketio.emit('hand_result', game.last_winner, room=game_id)
-        except Exception as e:
-            print(f"[EMIT] hand_result error: {e}")
-        # Ne pas auto-planifier la prochaine main; laisser le bouton "Nouvelle main"
-        socketio.emit('game_update', game.to_dict(), room=game_id)
-    else:
-        socketio.emit('game_update', game.to_dict(), room=game_id)
+def _on_action_timeout(game_id: str, token: tuple):
+    """Délai de parole écoulé: check si possible, sinon fold, pour ne pas bloquer la table."""
+    game = games.get(game_id)
+    if not game or game.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN) or _action_token(game) != token:
+        return
+    player = game.players[game.current_player]
+    action = 'check' if player.current_bet >= game.current_bet else 'fold'
+    error, hand_ended, all_in_auto = game.apply_action(player.id, action)
+    if error:
+        print(f"[TIMER] action automatique impossible pour {player.name} ({game_id}): {error}")
+        return
+    try:
+        socketio.emit('table_message', {'text': f"⏱️ {player.name}: temps écoulé — {action} automatique"}, room=game_id)
+    except Exception as e:
+        print(f"[EMIT] table_message (timer) error: {e}")
+    _broadcast_after_action(game_id, game, hand_ended, all_in_auto)
 
 @socketio.on('leave_game')
 def handle_leave_game(data):
     game_id = data['game_id']
     player_id = sio_session.get('player_id')
 
-    if game_id not in games:
+    game = _get_game(game_id)
+    if game is None:
         emit('error', {'message': 'Partie non trouvée'})
         return
-
-    game = games[game_id]
     game.remove_player(player_id)
 
     if player_id in player_game_mapping:
@@ -1093,51 +1879,357 @@ def handle_leave_game(data):
 
     leave_room(game_id)
     emit('left_game', {'message': 'Vous avez quitté la partie'})
-    socketio.emit('game_update', game.to_dict(), room=game_id)
+    _fan_out_state(game_id, game)
+    _arm_action_timer(game_id, game)
     print(f"Joueur {player_id} a quitté la partie {game_id}")
     # NEW: pousser la liste des parties
     _broadcast_open_games()
 
-# Supprimer les auto‑enchaînements dans schedule_next_hand et ne plus l'appeler automatiquement
-# (Conservé pour référence, mais non utilisé)
+# Enchaînement automatique des mains: utilisé par les tables de tournoi (lancement, fin de main,
+# regroupement des mises à jour); les parties libres démarrent leurs mains à la demande (start_game)
 def schedule_next_hand(game_id: str, delay: int = None):
-    """Attendre un délai avant de préparer et éventuellement démarrer la prochaine main."""
+    """Programmer (via l'ordonnanceur partagé) la préparation et éventuellement le démarrage de la prochaine main."""
     d = delay if delay is not None else NEXT_HAND_DELAY_SECONDS
-    try:
-        socketio.sleep(d)
-    except Exception as e:
-        print(f"[SLEEP] erreur: {e}")
+    scheduler.schedule(('next_hand', game_id), d, _run_next_hand, game_id)
+    _ensure_scheduler()
+
+
+def _run_next_hand(game_id: str):
     game = games.get(game_id)
     if not game:
         return
+    if game.pending_showdown is not None:
+        # Résultat de la main précédente encore en calcul: réessayer un peu plus tard
+        schedule_next_hand(game_id, 1)
+        return
     # Préparer la main suivante puis éventuellement la démarrer automatiquement
     if game.prepare_next_hand():
         if game.start_new_hand():
             socketio.emit('game_started', room=game_id)
-            socketio.emit('game_update', game.to_dict(), room=game_id)
-            for player in game.players:
-                if player.hand:
-                    socketio.emit('hand_dealt', {
-                        'hand': [str(card) for card in player.hand]
-                    }, room=player.id)
+            _fan_out_state(game_id, game, overlays=True)
+            _emit_blinds_update(game_id, game)
+            _start_runout(game_id, game)
             # Si la nouvelle main se termine instantanément (all-in), message + résultat + replanifier
-            if game.phase == GamePhase.SHOWDOWN and game.last_winner:
-                try:
-                    socketio.emit('table_message', {'text': 'All‑in — révélation automatique des cartes'}, room=game_id)
-                except Exception as e:
-                    print(f"[EMIT] table_message (auto) error: {e}")
-                try:
-                    socketio.emit('hand_result', game.last_winner, room=game_id)
-                except Exception as e:
-                    print(f"[EMIT] hand_result (auto) error: {e}")
-                try:
-                    socketio.start_background_task(schedule_next_hand, game_id, NEXT_HAND_DELAY_SECONDS)
-                except Exception as e:
-                    print(f"[TASK] schedule_next_hand (chain) error: {e}")
+            if game.phase == GamePhase.SHOWDOWN and (game.last_winner or game.pending_showdown is not None):
+                _finish_hand(game_id, game, all_in_auto=True)
+                schedule_next_hand(game_id, NEXT_HAND_DELAY_SECONDS)
+            _arm_action_timer(game_id, game)
         else:
-            socketio.emit('game_update', game.to_dict(), room=game_id)
+            _fan_out_state(game_id, game)
     else:
-        socketio.emit('game_update', game.to_dict(), room=game_id)
+        _fan_out_state(game_id, game)
+
+# --- Tournois multi-tables (mtt.py) ---
+
+# Délai de regroupement des mises à jour d'un tournoi: les tables finissant leur main dans cette fenêtre
+# ne donnent qu'un game_update par table touchée
+TOURNAMENT_FLUSH_SECONDS = 0.05
+
+
+def create_tournament(table_size: int = 6, buy_in: int = 1000):
+    """Ouvrir les inscriptions d'un tournoi multi-tables (blinds de BLIND_STRUCTURE, niveau commun à toutes
+    les tables). Retourne le directeur (mtt.TournamentDirector), à lancer avec launch_tournament."""
+    from mtt import TournamentDirector
+    tournament_id = 'mtt' + str(uuid.uuid4())[:6]
+
+    def new_table(table_id: str) -> PokerGame:
+        game = PokerGame(id=table_id, defer_showdown=showdown_pool is not None,
+                         paced_runout=ALLIN_RUNOUT_SECONDS > 0, tournament_id=tournament_id)
+        games[table_id] = game
+        return game
+
+    director = TournamentDirector(tournament_id, new_table, table_size=table_size, buy_in=buy_in,
+                                  structure=blind_structure)
+    tournaments[tournament_id] = director
+    return director
+
+
+def launch_tournament(director, seed: Optional[int] = None):
+    """Répartir les inscrits et lancer la première main de chaque table. Les joueurs connectés sont
+    déplacés dans la room de leur table (événement `table_moved`)."""
+    tournament_id = director.id
+    director.seat_players(seed)
+    for table_id, game in director.tables.items():
+        for player in game.players:
+            _seat_player_room(player.id, player_game_mapping.get(player.id), table_id, tournament_id)
+        schedule_next_hand(table_id, 0)
+    director.flush()
+    _arm_tournament_blinds(director)
+    _arm_reaper()
+    _broadcast_open_games()
+    print(f"🏆 Tournoi {tournament_id}: {len(director.entrants)} inscrits sur {len(director.tables)} tables")
+    return director
+
+
+def start_tournament(entrants: List[tuple], table_size: int = 6, buy_in: int = 1000,
+                     seed: Optional[int] = None):
+    """Créer et lancer d'un coup un tournoi pour les joueurs `entrants` [(player_id, nom), ...]."""
+    director = create_tournament(table_size, buy_in)
+    for player_id, name in entrants:
+        director.register(player_id, name)
+    return launch_tournament(director, seed)
+
+
+def _arm_tournament_blinds(director):
+    """Horloge de blinds unique du tournoi (montée au temps): une échéance pour toutes ses tables."""
+    structure = director.structure
+    key = ('mtt_blinds', director.id)
+    if structure is None or structure.seconds_per_level <= 0 or structure.is_last(director.blind_level) \
+            or scheduler.pending(key) is not None:
+        return
+    scheduler.schedule(key, structure.seconds_per_level, _on_tournament_level_up, director.id)
+    _ensure_scheduler()
+
+
+def _on_tournament_level_up(tournament_id: str):
+    director = tournaments.get(tournament_id)
+    if director is None or not director.level_up():
+        return
+    level = director.structure.level(director.blind_level)
+    text = f"⏫ Blinds {level.small_blind}/{level.big_blind}" + (f" (ante {level.ante})" if level.ante else '') \
+        + " à partir de la prochaine main"
+    for table_id in director.tables:
+        try:
+            socketio.emit('table_message', {'text': text}, room=table_id)
+        except Exception as e:
+            print(f"[EMIT] table_message (blinds) error: {e}")
+    _arm_tournament_blinds(director)
+
+
+def _tournament_room(tournament_id: str) -> str:
+    """Room des inscrits d'un tournoi (avant le lancement)."""
+    return f'mtt:{tournament_id}'
+
+
+def _emit_tournament_registration(director):
+    entrants = list(director.entrants.values())
+    socketio.emit('tournament_registration', {'tournament_id': director.id, 'host': entrants[0] if entrants else '',
+                                              'entrants': entrants, 'table_size': director.table_size,
+                                              'buy_in': director.buy_in},
+                  room=_tournament_room(director.id))
+
+
+@socketio.on('create_tournament')
+def handle_create_tournament(data):
+    """Ouvrir un tournoi multi-tables; le créateur est inscrit et seul lui peut le lancer."""
+    data = data or {}
+    player_id = sio_session.get('player_id')
+    player_name = (data.get('player_name') or '').strip()
+    if not player_id or not player_name:
+        emit('error', {'message': 'Nom de joueur requis'})
+        return
+    if player_game_mapping.get(player_id):
+        emit('error', {'message': 'Quittez votre table avant de créer un tournoi'})
+        return
+    try:
+        director = create_tournament(int(data.get('table_size', 6)), int(data.get('buy_in', 1000)))
+    except (TypeError, ValueError) as e:
+        emit('error', {'message': f'Tournoi invalide: {e}'})
+        return
+    director.register(player_id, player_name)
+    join_room(_tournament_room(director.id))
+    emit('tournament_created', {'tournament_id': director.id})
+    _emit_tournament_registration(director)
+
+
+@socketio.on('register_tournament')
+def handle_register_tournament(data):
+    data = data or {}
+    player_id = sio_session.get('player_id')
+    player_name = (data.get('player_name') or '').strip()
+    director = tournaments.get(data.get('tournament_id'))
+    if director is None or director.started:
+        emit('error', {'message': 'Tournoi introuvable ou déjà commencé'})
+        return
+    if not player_id or not player_name:
+        emit('error', {'message': 'Nom de joueur requis'})
+        return
+    if player_game_mapping.get(player_id):
+        emit('error', {'message': 'Quittez votre table avant de vous inscrire'})
+        return
+    director.register(player_id, player_name)
+    join_room(_tournament_room(director.id))
+    _emit_tournament_registration(director)
+
+
+@socketio.on('start_tournament')
+def handle_start_tournament(data):
+    director = tournaments.get((data or {}).get('tournament_id'))
+    if director is None or director.started:
+        emit('error', {'message': 'Tournoi introuvable ou déjà commencé'})
+        return
+    if next(iter(director.entrants), None) != sio_session.get('player_id'):
+        emit('error', {'message': "Seul l'organisateur peut lancer le tournoi"})
+        return
+    if len(director.entrants) < 2:
+        emit('error', {'message': 'Il faut au moins 2 inscrits'})
+        return
+    socketio.close_room(_tournament_room(director.id))
+    launch_tournament(director)
+
+
+def _seat_player_room(player_id: str, old_table: Optional[str], new_table: str, tournament_id: str):
+    """Faire passer les connexions d'un joueur dans la room de sa nouvelle table et l'en avertir."""
+    player_game_mapping[player_id] = new_table
+    try:
+        for sid, _ in list(socketio.server.manager.get_participants('/', player_id)):
+            if old_table:
+                socketio.server.leave_room(sid, old_table, namespace='/')
+            socketio.server.enter_room(sid, new_table, namespace='/')
+        socketio.emit('table_moved', {'tournament_id': tournament_id, 'game_id': new_table}, room=player_id)
+    except Exception as e:
+        print(f"[MTT] changement de room impossible pour {player_id}: {e}")
+
+
+def _tournament_hand_finished(game_id: str, game: PokerGame):
+    """Fin de main d'une table de tournoi: éliminations et déplacements tout de suite, diffusion regroupée."""
+    director = tournaments.get(game.tournament_id)
+    if director is None:
+        return
+    director.hand_finished(game_id)
+    key = ('mtt', director.id)
+    if scheduler.pending(key) is None:
+        scheduler.schedule(key, TOURNAMENT_FLUSH_SECONDS, _flush_tournament, director.id)
+        _ensure_scheduler()
+    if game_id in director.tables and not director.finished:
+        schedule_next_hand(game_id)
+
+
+def _flush_tournament(tournament_id: str):
+    """Diffuser les changements accumulés d'un tournoi: un game_update par table touchée."""
+    director = tournaments.get(tournament_id)
+    if director is None:
+        return
+    updates = director.flush()
+    for move in updates.moves:
+        _seat_player_room(move.player_id, move.from_table, move.to_table, tournament_id)
+    for player_id, place in updates.eliminated:
+        player_game_mapping.pop(player_id, None)
+        socketio.emit('tournament_eliminated', {'tournament_id': tournament_id, 'place': place}, room=player_id)
+    for table_id in updates.broken:
+        games.pop(table_id, None)
+        for kind in ('action', 'next_hand', 'runout', 'blinds'):
+            scheduler.cancel((kind, table_id))
+    for table_id in updates.tables:
+        game = games.get(table_id)
+        if game is None:
+            continue
+        _fan_out_state(table_id, game)
+        # Table en attente de joueurs (moins de 2 à la dernière main): la relancer avec les arrivants
+        if game.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN) and scheduler.pending(('next_hand', table_id)) is None \
+                and not director.finished:
+            schedule_next_hand(table_id)
+    if director.finished:
+        standings = director.standings()
+        for table_id in director.tables:
+            socketio.emit('tournament_finished', {'tournament_id': tournament_id, 'standings': standings[:10]},
+                          room=table_id)
+        del tournaments[tournament_id]
+        scheduler.cancel(('mtt_blinds', tournament_id))
+        print(f"🏆 Tournoi {tournament_id} terminé: vainqueur {standings[0]['name']}")
+    if updates.broken:
+        _broadcast_open_games()
+
+# --- Hibernation des tables inactives ---
+
+def _get_game(game_id: str) -> Optional[PokerGame]:
+    """Partie en mémoire, ou réveillée depuis le stockage d'hibernation si elle y dort."""
+    game = games.get(game_id)
+    if game is not None or hibernated is None or not game_id:
+        return game
+    try:
+        data = hibernated.load(game_id)
+        if not data:
+            return None
+        game = loads_game(data)
+    except Exception as e:
+        print(f"[HIBERNATE] réveil impossible de la partie {game_id}: {e}")
+        return None
+    games[game_id] = game
+    hibernated.delete(game_id)
+    _asleep.pop(game_id, None)
+    lobby.invalidate()
+    print(f"☀️ Partie {game_id} réveillée ({len(data)} octets)")
+    _arm_reaper()
+    _arm_action_timer(game_id, game)
+    _start_runout(game_id, game)
+    if game.hand_number > 0:
+        _arm_blind_timer(game_id, game)
+    return game
+
+
+def _hibernate_game(game_id: str, game: PokerGame) -> bool:
+    """Ranger une table inactive dans le stockage d'hibernation et la retirer de la mémoire."""
+    try:
+        data = dumps_game(game)
+        hibernated.save(game_id, data)
+    except Exception as e:
+        print(f"[HIBERNATE] hibernation impossible de la partie {game_id}: {e}")
+        return False
+    # Un joueur a pu revenir pendant la sauvegarde: garder la table en mémoire
+    if games.get(game_id) is not game or any(p.connected for p in game.players):
+        hibernated.delete(game_id)
+        return False
+    del games[game_id]
+    for kind in ('action', 'next_hand', 'runout', 'blinds'):
+        scheduler.cancel((kind, game_id))
+    _asleep[game_id] = {
+        'id': game_id,
+        'players': len(game.players),
+        'connected': 0,
+        'phase': game.phase.value,
+        'host': game.players[0].name,
+        'can_join': len(game.players) < game.max_players,
+        'asleep': True,
+    }
+    lobby.invalidate()
+    print(f"💤 Partie {game_id} hibernée ({len(data)} octets)")
+    return True
+
+
+def _reap_idle_tables(now: Optional[float] = None) -> int:
+    """Hiberner les tables sans joueur connecté depuis IDLE_TABLE_TTL_SECONDS (les tables vides sont supprimées).
+
+    Retourne le nombre de tables retirées de la mémoire.
+    """
+    now = time.monotonic() if now is None else now
+    removed = 0
+    for game_id, game in list(games.items()):
+        # Les tables d'un tournoi en cours restent en mémoire: le directeur (mtt.py) les référence
+        if any(p.connected for p in game.players) or game.pending_showdown is not None \
+                or game.tournament_id in tournaments or game_id in _spectators:
+            _idle_since.pop(game_id, None)
+            continue
+        if now - _idle_since.setdefault(game_id, now) < IDLE_TABLE_TTL_SECONDS:
+            continue
+        _idle_since.pop(game_id, None)
+        if not game.players:
+            del games[game_id]
+            for kind in ('action', 'next_hand', 'blinds'):
+                scheduler.cancel((kind, game_id))
+            print(f"🗑️ Partie vide supprimée: {game_id}")
+            removed += 1
+        elif _hibernate_game(game_id, game):
+            removed += 1
+    for game_id in [gid for gid in _idle_since if gid not in games]:
+        del _idle_since[game_id]
+    if removed:
+        _broadcast_open_games()
+    return removed
+
+
+def _run_reaper():
+    _reap_idle_tables()
+    if games:
+        _arm_reaper()
+
+
+def _arm_reaper():
+    """Programmer le prochain passage du ramasseur (s'il n'est pas déjà programmé)."""
+    if hibernated is None or scheduler.pending(('reaper',)) is not None:
+        return
+    scheduler.schedule(('reaper',), max(1, min(60, IDLE_TABLE_TTL_SECONDS // 4)), _run_reaper)
+    _ensure_scheduler()
 
 # Nettoyage des parties et joueurs fantômes au démarrage
 cleanup_games()
@@ -0,0 +1,88 @@
+"""
+Structures de blinds de tournoi: table des niveaux (small blind, big blind, ante) et montée de niveau
+toutes les N mains et/ou toutes les N secondes.
+
+Le niveau d'une main se calcule en O(1) au moment de poser les blinds (PokerGame.post_blinds):
+- montée par mains: niveau = (numéro de main - 1) // hands_per_level;
+- montée au temps: le serveur (app.py) incrémente `PokerGame.blind_level_due` par l'ordonnanceur
+  partagé (une échéance par table, aucune tâche endormie), appliqué à la main suivante.
+Au-delà du dernier niveau, la structure reste au dernier niveau.
+
+Format texte d'une structure (variable BLIND_STRUCTURE): niveaux séparés par des virgules,
+chacun 'small/big' ou 'small/big/ante', par exemple '10/20,15/30,25/50/5,50/100/10'.
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class BlindLevel:
+    small_blind: int
+    big_blind: int
+    ante: int = 0
+
+    def to_dict(self):
+        return {'small_blind': self.small_blind, 'big_blind': self.big_blind, 'ante': self.ante}
+
+
+@dataclass(frozen=True, slots=True)
+class BlindStructure:
+    levels: Tuple[BlindLevel, ...]
+    # Montée de niveau toutes les `hands_per_level` mains (0 = pas de montée par mains)
+    hands_per_level: int = 0
+    # Montée de niveau toutes les `seconds_per_level` secondes (0 = pas de montée au temps)
+    seconds_per_level: float = 0
+
+    def __post_init__(self):
+        if not self.levels:
+            raise ValueError("structure de blinds vide")
+
+    def level(self, index: int) -> BlindLevel:
+        """Niveau `index`, borné au dernier niveau de la table."""
+        return self.levels[min(max(index, 0), len(self.levels) - 1)]
+
+    def level_index(self, hand_number: int, level_due: int = 0) -> int:
+        """Niveau applicable à la main `hand_number` (1-indexée), `level_due` niveaux atteints au temps."""
+        index = level_due
+        if self.hands_per_level > 0:
+            index = max(index, (hand_number - 1) // self.hands_per_level)
+        return min(max(index, 0), len(self.levels) - 1)
+
+    def is_last(self, index: int) -> bool:
+        return index >= len(self.levels) - 1
+
+
+def parse_structure(spec: str, hands_per_level: int = 0, seconds_per_level: float = 0) -> BlindStructure:
+    """Lire une structure au format '10/20,15/30,25/50/5' (cf. docstring du module)."""
+    levels = []
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            values = [int(v) for v in item.split('/')]
+        except ValueError:
+            raise ValueError(f"niveau de blinds invalide: {item!r}") from None
+        if len(values) not in (2, 3) or min(values) < 0 or values[0] > values[1] or values[1] <= 0:
+            raise ValueError(f"niveau de blinds invalide: {item!r}")
+        levels.append(BlindLevel(*values))
+    return BlindStructure(tuple(levels), hands_per_level, seconds_per_level)
+
+
+def geometric_structure(small_blind: int, big_blind: int, multiplier: int = 2, levels: int = 30,
+                        hands_per_level: int = 0, seconds_per_level: float = 0,
+                        ante_ratio: Optional[float] = None) -> BlindStructure:
+    """Structure à progression géométrique (blinds multipliées par `multiplier` à chaque niveau),
+    comme celle de l'arbitre CodinGame (`hand_nb_by_level`, `level_blind_multiplier`).
+    `ante_ratio`: ante en fraction de la big blind (aucun ante si None)."""
+    table = []
+    for i in range(levels):
+        factor = multiplier ** i
+        bb = big_blind * factor
+        table.append(BlindLevel(small_blind * factor, bb, int(bb * ante_ratio) if ante_ratio else 0))
+    return BlindStructure(tuple(table), hands_per_level, seconds_per_level)
+
+
+def describe(structure: Sequence[BlindLevel]) -> str:
+    """Forme texte d'une table de niveaux (inverse de parse_structure)."""
+    return ','.join(f'{lv.small_blind}/{lv.big_blind}' + (f'/{lv.ante}' if lv.ante else '') for lv in structure)
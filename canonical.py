@@ -0,0 +1,70 @@
+"""
+Isomorphisme des couleurs: forme canonique d'une situation (cartes privées, board, ...) et sa multiplicité.
+
+Au poker, les couleurs sont interchangeables: deux situations qui ne diffèrent que par un renommage des
+couleurs ont les mêmes forces de mains et les mêmes équités. Il suffit donc de calculer une seule
+situation par classe, pondérée par le nombre de situations réelles qu'elle représente:
+- 1326 mains de départ -> 169 classes (13 paires, 78 assorties, 78 dépareillées);
+- 22100 flops -> 1755 classes.
+
+Les cartes sont encodées en entiers 0..51 (13 * couleur + valeur - 2, cf. hand_eval.card_index).
+La forme canonique est la plus petite image (ordre lexicographique) parmi les 24 permutations des couleurs;
+la multiplicité est le nombre d'images distinctes.
+"""
+import itertools
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+from hand_eval import VALUE_CHARS
+
+Group = Tuple[int, ...]
+
+# Table de chaque permutation des couleurs: code carte -> code carte
+_PERMUTATIONS: List[Tuple[int, ...]] = [
+    tuple(13 * perm[c // 13] + c % 13 for c in range(52)) for perm in itertools.permutations(range(4))
+]
+
+
+def canonical_form(*groups: Sequence[int]) -> Tuple[Tuple[Group, ...], int]:
+    """Forme canonique de groupes de cartes (ex: main, board) et nombre de situations équivalentes.
+
+    L'ordre des groupes est conservé (seules les couleurs sont renommées); l'ordre des cartes dans un
+    groupe ne compte pas.
+    """
+    return _canonical(tuple(tuple(sorted(g)) for g in groups))
+
+
+@lru_cache(maxsize=65536)
+def _canonical(groups: Tuple[Group, ...]) -> Tuple[Tuple[Group, ...], int]:
+    images = {
+        tuple(tuple(sorted(perm[c] for c in g)) for g in groups) for perm in _PERMUTATIONS
+    }
+    return min(images), len(images)
+
+
+def preflop_class(hole: Sequence[int]) -> str:
+    """Nom de la classe d'une main de départ: 'AA', 'AKs' (assortie), 'AKo' (dépareillée)."""
+    a, b = sorted(hole, key=lambda c: c % 13, reverse=True)
+    high, low = VALUE_CHARS[a % 13], VALUE_CHARS[b % 13]
+    if high == low:
+        return high + low
+    return high + low + ('s' if a // 13 == b // 13 else 'o')
+
+
+def preflop_classes() -> Dict[str, Tuple[Group, int]]:
+    """Les 169 classes de mains de départ: nom -> (main canonique, nombre de combinaisons)."""
+    return {preflop_class(hole): (hole, mult) for hole, mult in _classes(2)}
+
+
+def flop_classes() -> List[Tuple[Group, int]]:
+    """Les 1755 classes de flops: (flop canonique, nombre de flops réels)."""
+    return _classes(3)
+
+
+@lru_cache(maxsize=None)
+def _classes(size: int) -> List[Tuple[Group, int]]:
+    seen = {}
+    for cards in itertools.combinations(range(52), size):
+        (group,), mult = canonical_form(cards)
+        seen[group] = mult
+    return sorted(seen.items())
@@ -0,0 +1,44 @@
+"""
+Écriture de résultats tabulaires au format colonne (.npz), sans dépendance à numpy.
+
+Chaque colonne est écrite comme un tableau .npy dans une archive zip: le fichier se relit
+directement avec `numpy.load(path)` ou `pandas.DataFrame(dict(numpy.load(path)))`.
+Types pris en charge: entiers (int64), flottants (float64) et chaînes (unicode de largeur fixe).
+"""
+import struct
+import zipfile
+from array import array
+from typing import Dict, Sequence
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+
+def _npy_bytes(descr: str, shape: int, payload: bytes) -> bytes:
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (descr, shape)
+    # En-tête aligné sur 64 octets, terminé par '\n' (cf. format NPY v1.0)
+    pad = 64 - (len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = header + ' ' * pad + '\n'
+    return _NPY_MAGIC + struct.pack('<H', len(header)) + header.encode('latin1') + payload
+
+
+def _encode_column(values: Sequence) -> bytes:
+    if all(isinstance(v, bool) or isinstance(v, int) for v in values):
+        arr = array('q', (int(v) for v in values))
+        return _npy_bytes('<i8', len(arr), arr.tobytes())
+    if all(isinstance(v, (int, float)) for v in values):
+        arr = array('d', (float(v) for v in values))
+        return _npy_bytes('<f8', len(arr), arr.tobytes())
+    texts = ['' if v is None else str(v) for v in values]
+    width = max((len(t) for t in texts), default=1) or 1
+    payload = b''.join(t.ljust(width, '\0').encode('utf-32-le') for t in texts)
+    return _npy_bytes(f'<U{width}', len(texts), payload)
+
+
+def write_npz(path: str, columns: Dict[str, Sequence]) -> None:
+    """Écrire un dictionnaire {nom_colonne: valeurs} dans une archive .npz compressée."""
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Colonnes de longueurs différentes: { {k: len(v) for k, v in columns.items()} }")
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, values in columns.items():
+            zf.writestr(f'{name}.npy', _encode_column(values))
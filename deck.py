@@ -0,0 +1,57 @@
+"""
+Deck de 52 cartes encodées en entiers 0..51 (cf. hand_eval.card_index), sans allocation par main.
+
+- Le tableau des cartes est préalloué une fois; `reset()` le remet dans l'ordre par simple copie.
+- Le mélange est un Fisher-Yates paresseux: chaque `deal()` tire une seule position parmi les cartes
+  restantes, on ne mélange donc que les cartes réellement distribuées.
+- Le générateur est un xorshift64* initialisé par une graine de 64 bits tirée de `secrets`
+  (ou fournie pour rejouer une main): la graine suffit à reconstituer toute la donne.
+"""
+import secrets
+from array import array
+from typing import Optional
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_IDENTITY = array('B', range(52))
+
+
+class Deck:
+    __slots__ = ('seed', '_cards', '_next', '_state')
+
+    def __init__(self, seed: Optional[int] = None):
+        self._cards = array('B', _IDENTITY)
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Remettre les 52 cartes dans le deck et ré-initialiser le générateur."""
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self._cards[:] = _IDENTITY
+        self._next = 0
+        # splitmix64 de la graine: évite l'état nul (interdit en xorshift) et décorrèle les graines proches
+        z = (self.seed + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        self._state = (z ^ (z >> 31)) or 1
+
+    def _below(self, n: int) -> int:
+        x = self._state
+        x ^= x >> 12
+        x ^= (x << 25) & _MASK64
+        x ^= x >> 27
+        self._state = x
+        # Réduction multiplicative (biais < n / 2**64, négligeable pour n <= 52)
+        return (((x * 0x2545F4914F6CDD1D) & _MASK64) * n) >> 64
+
+    def deal(self) -> int:
+        """Tirer la prochaine carte (entier 0..51)."""
+        i = self._next
+        if i >= 52:
+            raise IndexError('deck vide')
+        cards = self._cards
+        j = i + self._below(52 - i)
+        cards[i], cards[j] = cards[j], cards[i]
+        self._next = i + 1
+        return cards[i]
+
+    def __len__(self) -> int:
+        return 52 - self._next
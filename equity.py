@@ -0,0 +1,113 @@
+"""
+Équité (probabilité de gain, partages compris) de mains connues face à un board incomplet.
+
+- Énumération exacte de toutes les fins de board quand le nombre d'évaluations reste raisonnable
+  (ex: après le flop, 990 tirages turn + river), sinon tirages aléatoires (Monte-Carlo).
+- Le calcul est borné: au plus `max_exact_evals` évaluations en mode exact, et en mode échantillonné
+  au plus `max_samples` tirages ou `time_budget` secondes. Il ne bloque donc jamais longtemps la boucle
+  d'événements du serveur.
+
+Les résultats exacts sont mémorisés par classe d'isomorphisme des couleurs (canonical.py): une situation
+qui ne diffère d'une autre que par les couleurs réutilise son résultat.
+
+Les cartes sont encodées en entiers 0..51 (cf. hand_eval.card_index) et évaluées par hand_eval.rank_codes.
+"""
+import itertools
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from canonical import canonical_form
+from hand_eval import LRUCache, rank_codes
+
+# Résultats exacts par forme canonique (mains, board, cartes mortes)
+EXACT_CACHE = LRUCache(4096)
+
+
+def equities(hands: Sequence[Sequence[int]], board: Sequence[int] = (), dead: Sequence[int] = (),
+             time_budget: float = 0.03, max_exact_evals: int = 6000, max_samples: int = 20000,
+             rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """Équité de chaque main.
+
+    Retourne {'equity': [...], 'win': [...], 'tie': [...], 'exact': bool, 'samples': n}: `equity` compte
+    une victoire partagée à k joueurs pour 1/k, `win` et `tie` sont les fréquences de victoire seule et de partage.
+    """
+    n = len(hands)
+    board = list(board)
+    missing = 5 - len(board)
+    used = set(board) | set(dead)
+    for hand in hands:
+        used.update(hand)
+    remaining = [c for c in range(52) if c not in used]
+    exact = math.comb(len(remaining), missing) * n <= max_exact_evals
+    if exact:
+        key = canonical_form(*hands, board, dead)[0]
+        cached = EXACT_CACHE.get(key)
+        if cached is not None:
+            return {k: list(v) if isinstance(v, list) else v for k, v in cached.items()}
+
+    shares = [0.0] * n
+    wins = [0] * n
+    ties = [0] * n
+
+    def score(runout) -> None:
+        full = board + list(runout)
+        ranks = [rank_codes(list(hand) + full) for hand in hands]
+        best = max(ranks)
+        winners = [i for i, r in enumerate(ranks) if r == best]
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+            shares[winners[0]] += 1.0
+        else:
+            for i in winners:
+                ties[i] += 1
+                shares[i] += 1.0 / len(winners)
+
+    samples = 0
+    if exact:
+        for runout in itertools.combinations(remaining, missing):
+            score(runout)
+            samples += 1
+    else:
+        rng = rng or random.Random()
+        deadline = time.perf_counter() + time_budget
+        while samples < max_samples:
+            score(rng.sample(remaining, missing))
+            samples += 1
+            if samples % 64 == 0 and time.perf_counter() >= deadline:
+                break
+
+    total = samples or 1
+    result = {
+        'equity': [s / total for s in shares],
+        'win': [w / total for w in wins],
+        'tie': [t / total for t in ties],
+        'exact': exact,
+        'samples': samples,
+    }
+    if exact:
+        EXACT_CACHE.put(key, {k: list(v) if isinstance(v, list) else v for k, v in result.items()})
+    return result
+
+
+def equity_vs_random(hole: Sequence[int], board: Sequence[int] = (), opponents: int = 1, samples: int = 2000,
+                     rng: Optional[random.Random] = None) -> float:
+    """Équité (Monte-Carlo) d'une main contre `opponents` mains aléatoires, partages compris."""
+    rng = rng or random.Random()
+    board = list(board)
+    missing = 5 - len(board)
+    used = set(hole) | set(board)
+    remaining = [c for c in range(52) if c not in used]
+    hole = list(hole)
+    share = 0.0
+    for _ in range(samples):
+        drawn = rng.sample(remaining, 2 * opponents + missing)
+        full = board + drawn[2 * opponents:]
+        mine = rank_codes(hole + full)
+        best = max(rank_codes(drawn[2 * i:2 * i + 2] + full) for i in range(opponents))
+        if mine > best:
+            share += 1.0
+        elif mine == best:
+            share += 1.0 / (1 + sum(rank_codes(drawn[2 * i:2 * i + 2] + full) == mine for i in range(opponents)))
+    return share / samples if samples else 0.0
@@ -25,8 +25,14 @@ function App() {
   const [error, setError] = useState('');
   const [raiseAmount, setRaiseAmount] = useState(20);
   const [handResult, setHandResult] = useState(null);
+  const [handDetail, setHandDetail] = useState(null); // détail complet, demandé à la volée
   const [tableMessage, setTableMessage] = useState(null);
+  const [allinEquity, setAllinEquity] = useState(null); // { phase, players: [{player_id, cards, equity}] }
+  const [blinds, setBlinds] = useState(null); // { level, small_blind, big_blind, ante, next?, next_at_hand? }
   const listenersReady = useRef(false);
+  // Mode spectateur: état public seulement, mis à jour par deltas versionnés
+  const [spectating, setSpectating] = useState(false);
+  const spectatorVersion = useRef(0);
   // Nouvelles: liste des parties ouvertes
   const [openGames, setOpenGames] = useState([]);
 
@@ -120,6 +126,7 @@ function App() {
       });
 
       socket.on('game_joined', ({ game_id, player_id }) => {
+        setSpectating(false);
         setGameId(game_id);
         setPlayerId(player_id);
         setError('');
@@ -129,6 +136,8 @@ function App() {
         // Reset my hand state will be updated by 'hand_dealt'
         setMyHand([]);
         setHandResult(null);
+        setHandDetail(null);
+        setAllinEquity(null);
       });
 
       socket.on('hand_dealt', ({ hand }) => {
@@ -140,17 +149,88 @@ function App() {
         setGame(null);
         setMyHand([]);
         setHandResult(null);
+        setBlinds(null);
         // Demander la liste mise à jour du lobby
         socket.emit('request_open_games');
       });
 
+      socket.on('spectator_state', ({ game_id, version, state }) => {
+        spectatorVersion.current = version;
+        setSpectating(true);
+        setGameId(game_id);
+        setPlayerId('');
+        setGame(state || null);
+        setError('');
+      });
+
+      socket.on('spectator_delta', (delta) => {
+        if (!delta || delta.base !== spectatorVersion.current) {
+          // Delta manqué: redemander l'état complet
+          if (delta?.game_id) socket.emit('spectate_game', { game_id: delta.game_id });
+          return;
+        }
+        spectatorVersion.current = delta.version;
+        setGame((prev) => {
+          const next = { ...(prev || {}), ...(delta.changes || {}) };
+          if (delta.seats) {
+            const players = [...(next.players || [])];
+            Object.entries(delta.seats).forEach(([i, p]) => { players[Number(i)] = p; });
+            next.players = players;
+          }
+          return next;
+        });
+      });
+
+      socket.on('spectating_stopped', () => {
+        setSpectating(false);
+        setGameId('');
+        setGame(null);
+        setHandResult(null);
+        setBlinds(null);
+        socket.emit('request_open_games');
+      });
+
       socket.on('game_update', (gameState) => {
         setGame(gameState);
       });
 
       socket.on('hand_result', (result) => {
-        // result: { player_id, name, amount, reason, winners?:[], hands?:[], community?:[] }
+        // Résumé compact: { hand_number, player_id, name, amount, reason, winners, hands?: [{player_id, cards, best}] }
         setHandResult(result || null);
+        setHandDetail(null);
+      });
+
+      socket.on('hand_detail', (detail) => {
+        setHandDetail(detail || null);
+      });
+
+      socket.on('allin_equity', (payload) => {
+        // Équités des joueurs all-in, rue par rue
+        setAllinEquity(payload || null);
+      });
+
+      socket.on('table_moved', ({ game_id }) => {
+        // Tournoi multi-tables: le serveur nous a placé à une autre table (rooms déjà changées)
+        if (!game_id) return;
+        setGameId(game_id);
+        setMyHand([]);
+        setHandResult(null);
+        setAllinEquity(null);
+        setTableMessage(`Changement de table: ${game_id}`);
+      });
+
+      socket.on('tournament_eliminated', ({ place }) => {
+        setTableMessage(`Éliminé du tournoi — place ${place}`);
+      });
+
+      socket.on('tournament_finished', ({ standings }) => {
+        const winner = Array.isArray(standings) && standings.length ? standings[0].name : '';
+        setTableMessage(winner ? `Tournoi terminé — vainqueur: ${winner}` : 'Tournoi terminé');
+      });
+
+      socket.on('blinds_update', (payload) => {
+        // Niveau de blinds (structure de tournoi): envoyé seulement quand il change
+        setBlinds(payload || null);
       });
 
       socket.on('table_message', (payload) => {
@@ -222,6 +302,15 @@ function App() {
     socket.emit('join_game', { player_name: playerName.trim(), game_id: gameIdInput.trim() });
   };
 
+  const spectate = () => {
+    setError('');
+    if (!gameIdInput.trim()) {
+      setError('ID de partie requis');
+      return;
+    }
+    socket.emit('spectate_game', { game_id: gameIdInput.trim() });
+  };
+
   const startGame = () => {
     if (!gameId) return;
     socket.emit('start_game', { game_id: gameId });
@@ -229,6 +318,10 @@ function App() {
 
   const leaveGame = () => {
     if (!gameId) return;
+    if (spectating) {
+      socket.emit('stop_spectating');
+      return;
+    }
     socket.emit('leave_game', { game_id: gameId });
   };
 
@@ -327,13 +420,11 @@ function App() {
                 {handResult.hands.map((h) => (
                   <li key={h.player_id} style={{ padding: '4px 0', borderBottom: '1px dashed #cfe9cf' }}>
                     <span style={{ display: 'inline-block', minWidth: 120 }}>
-                      {h.name || h.player_id}
+                      {(game?.players || []).find((p) => p.id === h.player_id)?.name || h.player_id}
                       {Array.isArray(handResult.winners) && handResult.winners.includes(h.player_id) ? ' (gagnant)' : ''}
                     </span>
-                    <span style={{ marginLeft: 8, color: h.folded ? '#a00' : '#070' }}>
-                      {h.folded ? 'Abandon' : (h.best || '—')}
-                    </span>
-                    {!h.folded && Array.isArray(h.cards) && h.cards.length > 0 && (
+                    <span style={{ marginLeft: 8, color: '#070' }}>{h.best || '—'}</span>
+                    {Array.isArray(h.cards) && h.cards.length > 0 && (
                       <span style={{ marginLeft: 10, color: '#555' }}>
                         [{h.cards.join(' ')}]
                       </span>
@@ -343,6 +434,25 @@ function App() {
               </ul>
             </div>
           )}
+          {!handDetail && handResult.hand_number ? (
+            <button
+              type="button"
+              style={{ marginTop: 8 }}
+              onClick={() => socket.emit('request_hand_detail', { game_id: gameId, hand_number: handResult.hand_number })}
+            >
+              Détails de la main
+            </button>
+          ) : null}
+          {handDetail && (
+            <div style={{ marginTop: 8, fontSize: 13, color: '#333' }}>
+              <div>Board: {(handDetail.board || []).join(' ') || '—'}</div>
+              <ol style={{ margin: '4px 0', paddingLeft: 20 }}>
+                {(handDetail.actions || []).map((a, i) => (
+                  <li key={i}>[{a.phase}] {a.name}: {a.action}{a.amount ? ` ${a.amount}` : ''}</li>
+                ))}
+              </ol>
+            </div>
+          )}
         </div>
       )}
 
@@ -387,7 +497,7 @@ function App() {
                   <option value="">— Sélectionner une partie —</option>
                   {openGames.map((g) => (
                     <option key={g.id} value={g.id}>
-                      {g.id} — {g.host || 'hôte ?'} — {g.connected}/{g.players} — {g.phase}
+                      {g.id} — {g.host || 'hôte ?'} — {g.connected}/{g.players} — {g.asleep ? 'en sommeil' : g.phase}
                     </option>
                   ))}
                 </select>
@@ -408,6 +518,7 @@ function App() {
               />
             </div>
             <button type="submit" disabled={!connected}>Rejoindre</button>
+            <button type="button" onClick={spectate} disabled={!connected} style={{ marginLeft: 8 }}>Regarder</button>
           </form>
         </div>
       )}
@@ -418,14 +529,24 @@ function App() {
           <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
             <h2 style={{ margin: 0 }}>Partie: {gameId}</h2>
             <div style={{ display: 'flex', alignItems: 'center', gap: 12 }}>
-              {myName ? <div style={{ fontSize: 14, color: '#555' }}>Joueur: <strong>{myName}</strong></div> : null}
+              {spectating
+                ? <div style={{ fontSize: 14, color: '#555' }}>Spectateur</div>
+                : (myName ? <div style={{ fontSize: 14, color: '#555' }}>Joueur: <strong>{myName}</strong></div> : null)}
               <button onClick={leaveGame} style={{ marginRight: 8 }}>Quitter</button>
-              <button onClick={startGame} disabled={!game?.can_start_new_hand}>Nouvelle main</button>
+              {!spectating && <button onClick={startGame} disabled={!game?.can_start_new_hand}>Nouvelle main</button>}
             </div>
           </div>
 
           <div style={{ margin: '8px 0' }}>Phase: {game?.phase}</div>
           <div style={{ margin: '8px 0' }}>Pot: {game?.pot ?? 0}</div>
+          {blinds && (
+            <div style={{ margin: '8px 0', color: '#555' }}>
+              Niveau {blinds.level} — Blinds {blinds.small_blind}/{blinds.big_blind}
+              {blinds.ante ? ` (ante ${blinds.ante})` : ''}
+              {blinds.next ? ` · ensuite ${blinds.next.small_blind}/${blinds.next.big_blind}` : ''}
+              {blinds.next && blinds.next_at_hand ? ` à la main ${blinds.next_at_hand}` : ''}
+            </div>
+          )}
           {!!game?.hand_number && (
             <div style={{ margin: '8px 0', color: '#777' }}>Main n° {game.hand_number}</div>
           )}
@@ -486,6 +607,14 @@ function App() {
                       {nextHandFlag ? ' - [prochaine main]' : (!p.can_bet ? ' - [hors mise]' : '')}
                     </div>
                     <div>Stack: {p.stack} | Mise courante: {p.current_bet}</div>
+                    {(() => {
+                      const eq = allinEquity?.players?.find((e) => e.player_id === p.id);
+                      return eq ? (
+                        <div style={{ color: '#0b5394' }}>
+                          All‑in [{(eq.cards || []).join(' ')}] — {Math.round((eq.equity || 0) * 100)}%
+                        </div>
+                      ) : null;
+                    })()}
                   </div>
                 );
               })}
@@ -1,5 +1,8 @@
 # filepath: /Users/display/PycharmProjects/Poker/hand_eval.py
-from typing import List, Dict, Tuple, Any
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from typing import List, Dict, Optional, Tuple, Any
 
 # Réutilisable avec tout objet possédant des attributs .value (2..14) et .suit ('D','H','S','C')
 
@@ -10,6 +13,20 @@ CARD_LABELS_FR = {
 
 HandRank = Tuple[int, Tuple]  # (category, tie-break tuple)
 
+# Encodage compact des cartes en entiers 0..51 (même ordre que le deck de poker.py: 13 * couleur + valeur - 2)
+SUITS = ('D', 'H', 'S', 'C')
+VALUE_CHARS = '23456789TJQKA'
+
+
+def card_index(card: Any) -> int:
+    return 13 * SUITS.index(card.suit) + card.value - 2
+
+
+def card_label(index: int) -> str:
+    """Libellé d'une carte encodée (ex: 51 -> 'AC'), identique au repr des objets Card."""
+    return VALUE_CHARS[index % 13] + SUITS[index // 13]
+
+
 # Catégories (ordre croissant)
 HIGH_CARD = 0
 ONE_PAIR = 1
@@ -43,10 +60,6 @@ def longest_consecutive_sequence(values: List[int]) -> List[int]:
 def straight_high(values: List[int]) -> int:
     """Retourne la plus haute carte d'une suite, 0 si aucune. Prend en charge l'As bas (A-2-3-4-5)."""
     uniq = sorted(set(values))
-    # Cas particulier: A-2-3-4-5 (As bas)
-    if {14, 2, 3, 4, 5}.issubset(uniq):
-        return 5
-    # Général
     best = 0
     run = 1
     for i in range(1, len(uniq)):
@@ -56,6 +69,9 @@ def straight_high(values: List[int]) -> int:
             run = 1
         if run >= 5:
             best = uniq[i]
+    # Cas particulier: A-2-3-4-5 (As bas), seulement s'il n'y a pas de suite plus haute (ex: 2-3-4-5-6)
+    if not best and {14, 2, 3, 4, 5}.issubset(uniq):
+        return 5
     return best
 
 
@@ -74,8 +90,81 @@ def straight_flush_high(cards: List[Any]) -> int:
     return best
 
 
+class LRUCache:
+    """Cache LRU borné (OrderedDict), partagé entre threads, avec compteurs de succès / échecs."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Any, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Valeur associée à `key` (et marquée récente), None si absente."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {'size': len(self._data), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': (self.hits / total) if total else 0.0}
+
+
+# Résultats d'évaluation partagés par le serveur, les simulateurs et le rejeu (0 = pas de cache)
+EVAL_CACHE = LRUCache(int(os.environ.get('HAND_EVAL_CACHE_SIZE', '16384')))
+
+_SUIT_INDEX = {s: i for i, s in enumerate(SUITS)}
+
+
+def canonical_mask(cards: List[Any]) -> int:
+    """Clé canonique d'un ensemble de cartes, invariante par permutation des couleurs.
+
+    Un masque de 13 bits (valeurs) par couleur; les 4 masques triés puis concaténés (52 bits). Deux
+    ensembles qui ne diffèrent que par un renommage des couleurs ont la même clé, et donc la même force.
+    """
+    masks = [0, 0, 0, 0]
+    for c in cards:
+        masks[_SUIT_INDEX[c.suit]] |= 1 << (c.value - 2)
+    masks.sort(reverse=True)
+    return (masks[0] << 39) | (masks[1] << 26) | (masks[2] << 13) | masks[3]
+
+
 def evaluate_7cards(cards: List[Any]) -> Tuple[HandRank, str]:
-    """Évalue les 7 cartes: retourne ((cat, tie), nom_fr)."""
+    """Évalue les 7 cartes: retourne ((cat, tie), nom_fr). Résultat mémorisé (EVAL_CACHE) par clé canonique."""
+    if EVAL_CACHE.maxsize <= 0:
+        return _evaluate_7cards(cards)
+    key = canonical_mask(cards)
+    result = EVAL_CACHE.get(key)
+    if result is None:
+        result = _evaluate_7cards(cards)
+        EVAL_CACHE.put(key, result)
+    return result
+
+
+def _evaluate_7cards(cards: List[Any]) -> Tuple[HandRank, str]:
     # Comptes par valeur et par couleur
     counts: Dict[int, int] = {}
     by_suit: Dict[str, List[int]] = {}
@@ -168,3 +257,113 @@ def evaluate_best(cards: List[Any]) -> Dict[str, Any]:
         'name': name,
     }
 
+
+
+LabelCard = namedtuple('LabelCard', 'value suit')
+
+
+def label_card(label: str) -> LabelCard:
+    """Carte légère à partir de son libellé (ex: 'TD' -> LabelCard(10, 'D'))."""
+    return LabelCard(VALUE_CHARS.index(label[0]) + 2, label[1])
+
+
+def evaluate_labels(hands: List[List[str]], board: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Évaluer plusieurs mains (libellés) avec le même board; None pour une main vide.
+
+    Fonction pure sur des données simples: exécutable dans un thread ou un processus séparé
+    (cf. SHOWDOWN_OFFLOAD dans app.py).
+    """
+    board_cards = [label_card(c) for c in board]
+    return [evaluate_best(board_cards + [label_card(c) for c in hand]) if hand else None for hand in hands]
+
+
+# --- Évaluateur rapide sur cartes encodées (0..51), pour les calculs d'équité en masse ---
+
+def _straight_high_of_mask(mask: int) -> int:
+    """Hauteur de la meilleure suite dans un masque de valeurs (bit 0 = '2' .. bit 12 = 'A'), 0 sinon."""
+    for high in range(14, 5, -1):
+        run = 0b11111 << (high - 6)
+        if mask & run == run:
+            return high
+    wheel = (1 << 12) | 0b1111  # A-2-3-4-5
+    return 5 if mask & wheel == wheel else 0
+
+
+_STRAIGHT_HIGH = [_straight_high_of_mask(m) for m in range(1 << 13)]
+_TOP_VALUES = [[v + 2 for v in range(12, -1, -1) if m >> v & 1] for m in range(1 << 13)]
+
+
+def _pack(category: int, values) -> int:
+    key = category
+    for i in range(5):
+        key = (key << 4) | (values[i] if i < len(values) else 0)
+    return key
+
+
+def pack_key(key: HandRank) -> int:
+    """Clé evaluate_7cards ((catégorie, départage)) -> entier de même ordre que rank_codes()."""
+    return _pack(key[0], key[1])
+
+
+def rank_codes(cards) -> int:
+    """Force d'une main de 5 à 7 cartes encodées, sous forme d'entier comparable.
+
+    Même ordre que les clés de evaluate_7cards (cf. pack_key), sans objets ni tris par carte:
+    masques de valeurs par couleur et comptes par valeur.
+    """
+    counts = [0] * 13
+    suit_masks = [0, 0, 0, 0]
+    for c in cards:
+        r = c % 13
+        counts[r] += 1
+        suit_masks[c // 13] |= 1 << r
+
+    for m in suit_masks:
+        if m.bit_count() >= 5:
+            sf = _STRAIGHT_HIGH[m]
+            if sf == 14:
+                return ROYAL_FLUSH << 20
+            if sf:
+                return _pack(STRAIGHT_FLUSH, (sf,))
+            flush = _TOP_VALUES[m][:5]
+            break
+    else:
+        flush = None
+
+    quads = trips = pairs = 0
+    any_mask = 0
+    for r in range(13):
+        n = counts[r]
+        if n:
+            any_mask |= 1 << r
+            if n == 4:
+                quads |= 1 << r
+            elif n == 3:
+                trips |= 1 << r
+            elif n == 2:
+                pairs |= 1 << r
+
+    if quads:
+        v4 = _TOP_VALUES[quads][0]
+        return _pack(FOUR_OF_A_KIND, (v4, _TOP_VALUES[any_mask & ~quads][0]))
+    if trips and (trips & (trips - 1) or pairs):
+        top_trips = _TOP_VALUES[trips]
+        t = top_trips[0]
+        p = _TOP_VALUES[pairs][0] if pairs else top_trips[1]
+        return _pack(FULL_HOUSE, (t, p))
+    if flush:
+        return _pack(FLUSH, flush)
+    st = _STRAIGHT_HIGH[any_mask]
+    if st:
+        return _pack(STRAIGHT, (st,))
+    if trips:
+        t = _TOP_VALUES[trips][0]
+        return _pack(THREE_OF_A_KIND, (t, *_TOP_VALUES[any_mask & ~trips][:2]))
+    if pairs & (pairs - 1):
+        p1, p2 = _TOP_VALUES[pairs][:2]
+        rest = _TOP_VALUES[any_mask & ~(1 << (p1 - 2)) & ~(1 << (p2 - 2))]
+        return _pack(TWO_PAIR, (p1, p2, rest[0] if rest else 0))
+    if pairs:
+        p = _TOP_VALUES[pairs][0]
+        return _pack(ONE_PAIR, (p, *_TOP_VALUES[any_mask & ~pairs][:3]))
+    return _pack(HIGH_CARD, _TOP_VALUES[any_mask][:5])
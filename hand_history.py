@@ -0,0 +1,281 @@
+"""
+Historique des mains: format binaire compact, écriture en tâche de fond et lecture en flux.
+
+Format de fichier (un fichier par jour UTC: hands-AAAAMMJJ.phh):
+  - en-tête de fichier: MAGIC (4 octets)
+  - puis une suite d'enregistrements: longueur (uint32 LE) + charge utile
+Charge utile d'une main (entiers little-endian, chaînes = longueur uint16 + UTF-8):
+  version u8, game_id str, hand_number u32, started_at f64, dealer_pos u8, small_blind u32, big_blind u32
+  seed u64 (graine du mélange, cf. PokerGame.create_deck), ante u32
+  nb_sièges u8, puis par siège: player_id str, name str, stack i32, final_stack i32,
+      eligible_from_hand u32, flags u8 (connecté, couché), nb_cartes u8, cartes u8 (0..51)
+  nb_board u8, cartes u8
+  nb_actions u16, puis par action: siège u8, code action u8, phase u8, montant u32
+  pot u32, raison u8, nb_gagnants u8, sièges gagnants u8
+
+Les cartes sont encodées comme dans hand_eval.card_index (13 * couleur + valeur - 2).
+"""
+import atexit
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from hand_eval import SUITS, VALUE_CHARS, card_label
+
+MAGIC = b'PHH1'
+FORMAT_VERSION = 1
+
+ACTIONS = ('fold', 'check', 'call', 'raise', 'sb', 'bb', 'ante')
+PHASES = ('waiting', 'preflop', 'flop', 'turn', 'river', 'showdown')
+REASONS = ('', 'showdown', 'all_folded')
+
+_HEADER = struct.Struct('<IdBII')      # hand_number, started_at, dealer_pos, small_blind, big_blind
+_SEAT = struct.Struct('<iiIB')         # stack, final_stack, eligible_from_hand, flags
+_ACTION = struct.Struct('<BBBI')       # siège, action, phase, montant
+_RESULT = struct.Struct('<IB')         # pot, raison
+_SEED = struct.Struct('<Q')
+_ANTE = struct.Struct('<I')
+_LEN = struct.Struct('<I')
+
+_FLAG_CONNECTED = 1
+_FLAG_FOLDED = 2
+
+
+def _card_code(label: str) -> int:
+    return 13 * SUITS.index(label[1]) + VALUE_CHARS.index(label[0])
+
+
+def _pack_str(out: bytearray, text: str) -> None:
+    raw = (text or '').encode('utf-8')[:0xFFFF]
+    out += struct.pack('<H', len(raw))
+    out += raw
+
+
+def _pack_cards(out: bytearray, cards: List[str]) -> None:
+    out.append(len(cards))
+    out += bytes(_card_code(c) for c in cards)
+
+
+def encode_hand(record: Dict[str, Any]) -> bytes:
+    """Encoder un enregistrement de main (cf. PokerGame.hand_record) en octets."""
+    out = bytearray()
+    out.append(FORMAT_VERSION)
+    _pack_str(out, record['game_id'])
+    out += _HEADER.pack(record['hand_number'], record['started_at'], record['dealer_pos'],
+                        record['small_blind'], record['big_blind'])
+    out += _SEED.pack(record.get('seed') or 0)
+    out += _ANTE.pack(record.get('ante', 0))
+    out.append(len(record['seats']))
+    for seat in record['seats']:
+        _pack_str(out, seat['player_id'])
+        _pack_str(out, seat['name'])
+        flags = (_FLAG_CONNECTED if seat['connected'] else 0) | (_FLAG_FOLDED if seat['folded'] else 0)
+        out += _SEAT.pack(seat['stack'], seat['final_stack'], seat['eligible_from_hand'], flags)
+        _pack_cards(out, seat['cards'])
+    _pack_cards(out, record['board'])
+    out += struct.pack('<H', len(record['actions']))
+    for seat, action, amount, phase in record['actions']:
+        out += _ACTION.pack(seat & 0xFF, ACTIONS.index(action), PHASES.index(phase), amount)
+    out += _RESULT.pack(record['pot'], REASONS.index(record['reason']))
+    out.append(len(record['winners']))
+    out += bytes(record['winners'])
+    return bytes(out)
+
+
+def decode_hand(payload: bytes) -> Dict[str, Any]:
+    """Décoder une charge utile produite par encode_hand."""
+    pos = 0
+
+    def read_str() -> str:
+        nonlocal pos
+        (n,) = struct.unpack_from('<H', payload, pos)
+        pos += 2
+        text = payload[pos:pos + n].decode('utf-8')
+        pos += n
+        return text
+
+    def read_cards() -> List[str]:
+        nonlocal pos
+        n = payload[pos]
+        cards = [card_label(c) for c in payload[pos + 1:pos + 1 + n]]
+        pos += 1 + n
+        return cards
+
+    version = payload[pos]
+    pos += 1
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Version d'historique non supportée: {version}")
+    game_id = read_str()
+    hand_number, started_at, dealer_pos, small_blind, big_blind = _HEADER.unpack_from(payload, pos)
+    pos += _HEADER.size
+    (seed,) = _SEED.unpack_from(payload, pos)
+    pos += _SEED.size
+    (ante,) = _ANTE.unpack_from(payload, pos)
+    pos += _ANTE.size
+    seats = []
+    n_seats = payload[pos]
+    pos += 1
+    for _ in range(n_seats):
+        player_id = read_str()
+        name = read_str()
+        stack, final_stack, eligible_from_hand, flags = _SEAT.unpack_from(payload, pos)
+        pos += _SEAT.size
+        seats.append({
+            'player_id': player_id,
+            'name': name,
+            'stack': stack,
+            'final_stack': final_stack,
+            'eligible_from_hand': eligible_from_hand,
+            'connected': bool(flags & _FLAG_CONNECTED),
+            'folded': bool(flags & _FLAG_FOLDED),
+            'cards': read_cards(),
+        })
+    board = read_cards()
+    (n_actions,) = struct.unpack_from('<H', payload, pos)
+    pos += 2
+    actions = []
+    for _ in range(n_actions):
+        seat, action, phase, amount = _ACTION.unpack_from(payload, pos)
+        pos += _ACTION.size
+        actions.append((seat, ACTIONS[action], amount, PHASES[phase]))
+    pot, reason = _RESULT.unpack_from(payload, pos)
+    pos += _RESULT.size
+    n_winners = payload[pos]
+    winners = list(payload[pos + 1:pos + 1 + n_winners])
+    return {
+        'game_id': game_id,
+        'hand_number': hand_number,
+        'started_at': started_at,
+        'dealer_pos': dealer_pos,
+        'small_blind': small_blind,
+        'big_blind': big_blind,
+        'ante': ante,
+        'seed': seed,
+        'seats': seats,
+        'board': board,
+        'actions': actions,
+        'pot': pot,
+        'reason': REASONS[reason],
+        'winners': winners,
+    }
+
+
+def file_for_day(directory: str, timestamp: float) -> str:
+    """Chemin du fichier d'historique du jour (UTC) correspondant à l'horodatage."""
+    return os.path.join(directory, time.strftime('hands-%Y%m%d.phh', time.gmtime(timestamp)))
+
+
+class HandHistoryWriter:
+    """Écrivain d'historique: `write()` ne fait qu'empiler, un thread dédié encode et ajoute par lots.
+
+    Les écritures disque se font hors de la boucle d'événements (thread système): les mains arrivées
+    pendant `flush_interval` secondes (au plus `batch_size`) sont ajoutées en une écriture. Un fichier par jour UTC.
+    """
+
+    def __init__(self, directory: str, batch_size: int = 64, flush_interval: float = 1.0):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: 'queue.Queue[Optional[Dict[str, Any]]]' = queue.Queue()
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name='hand-history-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Empiler une main terminée (non bloquant)."""
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """Vider la file et fermer le fichier courant."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            batch: List[Dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_interval
+            # Regrouper les mains arrivées pendant flush_interval (ou jusqu'à batch_size) en une seule écriture
+            while item is not None:
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            else:
+                stop = True
+            if batch:
+                try:
+                    self._append(batch)
+                except Exception as e:
+                    print(f"[HISTORY] écriture impossible ({len(batch)} main(s) perdue(s)): {e}")
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _append(self, batch: List[Dict[str, Any]]) -> None:
+        chunks: List[bytes] = []
+        for record in batch:
+            path = file_for_day(self.directory, record['started_at'])
+            if path != self._path:
+                # Rotation quotidienne: écrire le lot en cours avant de changer de fichier
+                self._flush(chunks)
+                chunks = []
+                self._open(path)
+            try:
+                payload = encode_hand(record)
+            except Exception as e:
+                # Une main mal formée est écartée seule, sans faire perdre le reste du lot
+                print(f"[HISTORY] main {record.get('game_id')}#{record.get('hand_number')} ignorée: {e}")
+                continue
+            chunks.append(_LEN.pack(len(payload)))
+            chunks.append(payload)
+        self._flush(chunks)
+
+    def _open(self, path: str) -> None:
+        if self._file:
+            self._file.close()
+        self._file = open(path, 'ab')
+        self._path = path
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+
+    def _flush(self, chunks: List[bytes]) -> None:
+        if chunks and self._file:
+            self._file.write(b''.join(chunks))
+            self._file.flush()
+
+
+def iter_hands(path: str) -> Iterator[Dict[str, Any]]:
+    """Itérer paresseusement sur les mains d'un fichier (ou de tous les fichiers d'un dossier).
+
+    Un enregistrement incomplet en fin de fichier (écriture en cours) est ignoré.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.startswith('hands-') and name.endswith('.phh'):
+                yield from iter_hands(os.path.join(path, name))
+        return
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Fichier d'historique invalide: {path}")
+        while True:
+            head = f.read(_LEN.size)
+            if len(head) < _LEN.size:
+                return
+            (size,) = _LEN.unpack(head)
+            payload = f.read(size)
+            if len(payload) < size:
+                return
+            yield decode_hand(payload)
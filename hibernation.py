@@ -0,0 +1,98 @@
+"""
+Hibernation des tables inactives: forme sérialisée compacte (pickle + zlib) sur disque ou dans Redis.
+
+Le serveur (app.py) y range les tables sans joueur connecté depuis IDLE_TABLE_TTL_SECONDS et les
+réveille à la demande (join_game, ...). Une table hibernée est restaurée telle quelle, y compris une
+main en cours (deck, mises, journal de la main).
+
+Les données ne sont relues que depuis le stockage du serveur lui-même (dossier local ou Redis de
+l'application): pickle n'est jamais appliqué à des données venant des clients.
+"""
+import os
+import pickle
+import zlib
+from typing import Any, Iterator, Optional
+
+# Préfixe des clés Redis / suffixe des fichiers
+_REDIS_PREFIX = 'poker:hibernated:'
+_SUFFIX = '.table'
+
+
+def dumps_game(game: Any) -> bytes:
+    """Sérialiser une table (PokerGame) en octets compressés."""
+    return zlib.compress(pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL), 6)
+
+
+def loads_game(data: bytes) -> Any:
+    """Restaurer une table sérialisée par dumps_game."""
+    return pickle.loads(zlib.decompress(data))
+
+
+class DiskStore:
+    """Un fichier par table hibernée (<game_id>.table) dans `directory`."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, game_id: str) -> str:
+        # Les ids de partie sont des préfixes d'UUID; refuser tout ce qui sortirait du dossier
+        if not game_id or os.sep in game_id or (os.altsep and os.altsep in game_id) or game_id.startswith('.'):
+            raise ValueError(f"id de partie invalide: {game_id!r}")
+        return os.path.join(self.directory, game_id + _SUFFIX)
+
+    def save(self, game_id: str, data: bytes) -> None:
+        path = self._path(game_id)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)  # écriture atomique: jamais de fichier à moitié écrit
+
+    def load(self, game_id: str) -> Optional[bytes]:
+        try:
+            with open(self._path(game_id), 'rb') as f:
+                return f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def delete(self, game_id: str) -> None:
+        try:
+            os.remove(self._path(game_id))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def __contains__(self, game_id: str) -> bool:
+        try:
+            return os.path.exists(self._path(game_id))
+        except ValueError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        for name in os.listdir(self.directory):
+            if name.endswith(_SUFFIX):
+                yield name[:-len(_SUFFIX)]
+
+
+class RedisStore:
+    """Tables hibernées dans Redis (partagées entre workers)."""
+
+    def __init__(self, url: str):
+        import redis  # dépendance optionnelle (cf. requirements.txt)
+        self._redis = redis.from_url(url)
+
+    def save(self, game_id: str, data: bytes) -> None:
+        self._redis.set(_REDIS_PREFIX + game_id, data)
+
+    def load(self, game_id: str) -> Optional[bytes]:
+        return self._redis.get(_REDIS_PREFIX + game_id)
+
+    def delete(self, game_id: str) -> None:
+        self._redis.delete(_REDIS_PREFIX + game_id)
+
+    def __contains__(self, game_id: str) -> bool:
+        return bool(self._redis.exists(_REDIS_PREFIX + game_id))
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._redis.scan_iter(match=_REDIS_PREFIX + '*'):
+            key = key.decode() if isinstance(key, bytes) else key
+            yield key[len(_REDIS_PREFIX):]
@@ -0,0 +1,66 @@
+"""
+Cache de la liste des parties ouvertes (lobby): liste calculée, corps JSON pré-encodé et version.
+
+Le serveur (app.py) marque le cache comme périmé à chaque changement susceptible de modifier le lobby
+(`invalidate()`: partie créée/rejointe/quittée, changement de phase, hibernation...). La liste n'est
+recalculée qu'à la lecture suivante, et la version n'augmente que si la liste a réellement changé:
+un sondage HTTP répété (`GET /api/games`) renvoie alors les mêmes octets, ou `304 Not Modified`.
+- `body`: JSON encodé une seule fois par version;
+- `gzip_body()`: variante gzip, compressée paresseusement une seule fois par version;
+- `etag` / `last_modified`: validateurs HTTP (l'ETag porte un jeton de démarrage, la version
+  repartant de 1 à chaque redémarrage du serveur).
+Par sécurité, la liste est aussi recalculée au-delà de `max_age` secondes (changement non signalé).
+"""
+import gzip
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+class LobbyCache:
+    __slots__ = ('compute', 'max_age', 'games', 'version', 'body', 'last_modified', 'boot',
+                 '_gzip', '_dirty', '_computed_at')
+
+    def __init__(self, compute: Callable[[], List[Dict[str, Any]]], max_age: float = 1.0):
+        self.compute = compute
+        self.max_age = max_age
+        self.games: List[Dict[str, Any]] = []
+        self.version = 0
+        self.body = b''
+        self.last_modified: Optional[datetime] = None
+        self.boot = uuid.uuid4().hex[:8]
+        self._gzip: Optional[bytes] = None
+        self._dirty = True
+        self._computed_at = 0.0
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def refresh(self) -> 'LobbyCache':
+        """Recalculer la liste si elle est périmée; nouvelle version seulement si elle a changé."""
+        now = time.monotonic()
+        if not self._dirty and now - self._computed_at < self.max_age:
+            return self
+        self._dirty = False
+        self._computed_at = now
+        games = self.compute()
+        if self.version and games == self.games:
+            return self
+        self.games = games
+        self.version += 1
+        self.body = json.dumps({'games': games, 'version': self.version}, separators=(',', ':')).encode()
+        self._gzip = None
+        # Résolution HTTP: la seconde (l'ETag départage deux versions dans la même seconde)
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+        return self
+
+    @property
+    def etag(self) -> str:
+        return f'{self.boot}-{self.version}'
+
+    def gzip_body(self) -> bytes:
+        if self._gzip is None:
+            self._gzip = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzip
@@ -0,0 +1,309 @@
+"""
+Directeur de tournoi multi-tables (MTT): répartition des inscrits, suivi des tapis, cassage et
+équilibrage des tables au fil des éliminations, déplacements de joueurs d'une table à l'autre.
+
+Le directeur ne pilote pas les mains: le serveur (app.py) ou le simulateur (tournament_sim.py) joue
+chaque table et appelle `hand_finished(table_id)` à la fin de chaque main. Seule la table qui vient
+de finir (donc entre deux mains) cède des joueurs:
+- les éliminés sont retirés et classés (à égalité, le plus gros tapis de départ finit devant);
+- si les joueurs restants tiennent sur une table de moins, cette table est cassée et ses joueurs
+  répartis un à un sur les plus petites tables;
+- sinon, tant qu'elle a au moins 2 joueurs de plus que la plus petite table, elle y envoie le joueur
+  qui serait de big blind à la main suivante.
+Les tailles des tables sont tenues dans deux tas (plus petite / plus grande) à invalidation paresseuse:
+chaque déplacement coûte O(log tables), sans parcourir les tables.
+
+Les changements (tables touchées, déplacements, tables cassées) s'accumulent jusqu'à `flush()`:
+l'appelant émet alors un seul `game_update` par table touchée, quel que soit le nombre de déplacements.
+
+Les tables sont créées par `game_factory(table_id)` (PokerGame ou équivalent: players, dealer_pos,
+hand_number, hand_log, add_player(), max_players).
+
+Structure de blinds (`structure`, blinds.BlindStructure): le niveau est celui du tournoi, pas de chaque
+table. Les tables reçoivent la même table de niveaux sans montée propre et suivent `blind_level`, imposé
+par le directeur (`PokerGame.blind_level_due`): montée par mains selon la table la plus avancée
+(`hand_finished`), montée au temps par une seule horloge de tournoi qui appelle `level_up()`.
+"""
+import dataclasses
+import heapq
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class Move:
+    player_id: str
+    name: str
+    from_table: str
+    to_table: str
+    stack: int
+
+
+@dataclass(slots=True)
+class Updates:
+    """Changements accumulés depuis le dernier flush(), à diffuser par table."""
+    tables: List[str] = field(default_factory=list)
+    moves: List[Move] = field(default_factory=list)
+    broken: List[str] = field(default_factory=list)
+    eliminated: List[Tuple[str, int]] = field(default_factory=list)  # (player_id, place)
+
+
+class TableSizes:
+    """Tailles des tables dans deux tas (min et max) à invalidation paresseuse.
+
+    Une entrée (taille, table) n'est valide que si elle correspond à la taille courante de la table:
+    une mise à jour pousse une nouvelle entrée et les anciennes sont écartées à la lecture.
+    """
+
+    def __init__(self):
+        self.size: Dict[str, int] = {}
+        self._min: List[Tuple[int, str]] = []
+        self._max: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.size)
+
+    def set(self, table_id: str, size: int) -> None:
+        self.size[table_id] = size
+        heapq.heappush(self._min, (size, table_id))
+        heapq.heappush(self._max, (-size, table_id))
+        if len(self._min) > 4 * len(self.size) + 64:
+            self._compact()
+
+    def remove(self, table_id: str) -> None:
+        self.size.pop(table_id, None)
+
+    def smallest(self) -> Optional[str]:
+        return self._top(self._min, 1)
+
+    def largest(self) -> Optional[str]:
+        return self._top(self._max, -1)
+
+    def _top(self, heap: List[Tuple[int, str]], sign: int) -> Optional[str]:
+        while heap:
+            size, table_id = heap[0]
+            if self.size.get(table_id) == sign * size:
+                return table_id
+            heapq.heappop(heap)
+        return None
+
+    def _compact(self) -> None:
+        self._min = [(s, t) for t, s in self.size.items()]
+        self._max = [(-s, t) for t, s in self.size.items()]
+        heapq.heapify(self._min)
+        heapq.heapify(self._max)
+
+
+class TournamentDirector:
+    def __init__(self, tournament_id: str, game_factory: Callable[[str], object], table_size: int = 6,
+                 buy_in: int = 1000, structure=None):
+        if table_size < 2:
+            raise ValueError("il faut au moins 2 places par table")
+        self.id = tournament_id
+        self.game_factory = game_factory
+        self.table_size = table_size
+        self.buy_in = buy_in
+        self.structure = structure
+        self.blind_level = 0                            # niveau de blinds du tournoi (index dans structure)
+        self.entrants: Dict[str, str] = {}              # player_id -> nom
+        self.stacks: Dict[str, int] = {}                # tapis connu de chaque inscrit (0 = éliminé)
+        self.table_of: Dict[str, str] = {}              # player_id -> table des joueurs encore en lice
+        self.places: Dict[str, int] = {}                # player_id -> place finale des éliminés
+        self.tables: Dict[str, object] = {}
+        self.sizes = TableSizes()
+        self.started = False
+        self._pending = Updates()
+        self._dirty: set = set()
+
+    # --- Inscriptions et placement ---
+
+    def register(self, player_id: str, name: str) -> bool:
+        if self.started or player_id in self.entrants:
+            return False
+        self.entrants[player_id] = name
+        return True
+
+    def seat_players(self, seed: Optional[int] = None) -> Dict[str, object]:
+        """Tirer les places au sort et répartir les inscrits sur le minimum de tables, à un joueur près."""
+        if self.started:
+            return self.tables
+        if len(self.entrants) < 2:
+            raise ValueError("il faut au moins 2 inscrits")
+        self.started = True
+        order = list(self.entrants)
+        random.Random(seed).shuffle(order)
+        n_tables = -(-len(order) // self.table_size)
+        # Mêmes niveaux pour toutes les tables, sans montée propre: le niveau est imposé par le directeur
+        table_structure = None if self.structure is None else \
+            dataclasses.replace(self.structure, hands_per_level=0, seconds_per_level=0)
+        for t in range(n_tables):
+            table_id = f'{self.id}-{t + 1}'
+            game = self.game_factory(table_id)
+            game.max_players = self.table_size
+            if table_structure is not None:
+                game.blind_structure = table_structure
+                game.blind_level_due = self.blind_level
+            self.tables[table_id] = game
+        table_ids = list(self.tables)
+        for i, player_id in enumerate(order):
+            table_id = table_ids[i % n_tables]
+            self.tables[table_id].add_player(player_id, self.entrants[player_id], buy_in=self.buy_in)
+            self.stacks[player_id] = self.buy_in
+            self.table_of[player_id] = table_id
+        for table_id, game in self.tables.items():
+            self.sizes.set(table_id, len(game.players))
+            self._touch(table_id)
+        return self.tables
+
+    # --- Fin de main: éliminations, cassage, équilibrage ---
+
+    def hand_finished(self, table_id: str) -> List[Move]:
+        """À appeler quand la main de `table_id` est terminée. Retourne les déplacements décidés."""
+        game = self.tables.get(table_id)
+        if game is None:
+            return []
+        for p in game.players:
+            self.stacks[p.id] = p.stack
+        if self.structure is not None and self.structure.hands_per_level > 0:
+            # Montée par mains: la table la plus avancée fait monter tout le tournoi
+            self._set_level(self.structure.level_index(game.hand_number + 1))
+        self._eliminate(table_id, game)
+        moves: List[Move] = []
+        if len(self.sizes) > 1 and self.players_left <= (len(self.sizes) - 1) * self.table_size:
+            moves += self._break_table(table_id, game)
+        else:
+            smallest = self.sizes.smallest()
+            while smallest is not None and smallest != table_id \
+                    and self.sizes.size[table_id] - self.sizes.size[smallest] > 1:
+                moves.append(self._move(game, self._next_big_blind(game), table_id, smallest))
+                smallest = self.sizes.smallest()
+        return moves
+
+    def _eliminate(self, table_id: str, game) -> None:
+        busted = [i for i, p in enumerate(game.players) if p.stack <= 0]
+        if not busted:
+            return
+        started_with = {seat[0]: seat[2] for seat in game.hand_log.get('seats', ())}
+        # Plusieurs éliminés dans la même main: le plus gros tapis de départ prend la meilleure place
+        ranked = sorted(busted, key=lambda i: started_with.get(game.players[i].id, 0))
+        place = self.players_left
+        for i in ranked:
+            player_id = game.players[i].id
+            self.places[player_id] = place
+            self.stacks[player_id] = 0
+            self.table_of.pop(player_id, None)
+            self._pending.eliminated.append((player_id, place))
+            place -= 1
+        for i in sorted(busted, reverse=True):
+            _remove_seat(game, i)
+        self.sizes.set(table_id, len(game.players))
+        self._touch(table_id)
+
+    def _break_table(self, table_id: str, game) -> List[Move]:
+        self.sizes.remove(table_id)
+        moves = []
+        while game.players:
+            target = self.sizes.smallest()
+            moves.append(self._move(game, self._next_big_blind(game), table_id, target))
+        del self.tables[table_id]
+        self._pending.broken.append(table_id)
+        self._dirty.discard(table_id)
+        return moves
+
+    def _next_big_blind(self, game) -> int:
+        """Siège du joueur qui paierait la big blind à la main suivante (déplacé en priorité)."""
+        return (game.dealer_pos + 3) % len(game.players)
+
+    def _move(self, game, seat: int, from_table: str, to_table: str) -> Move:
+        player = game.players[seat]
+        _remove_seat(game, seat)
+        target = self.tables[to_table]
+        target.add_player(player.id, player.name, buy_in=player.stack)
+        seated = target.players[-1]
+        seated.connected = player.connected
+        if _hand_in_progress(target):
+            # Arrivé en cours de main: hors jeu jusqu'à la suivante (comme un join_game en cours de main)
+            seated.folded = True
+            seated.all_in = False
+            seated.has_acted = True
+            seated.hand = []
+        self.table_of[player.id] = to_table
+        if from_table in self.sizes.size:
+            self.sizes.set(from_table, len(game.players))
+        self.sizes.set(to_table, len(target.players))
+        move = Move(player.id, player.name, from_table, to_table, player.stack)
+        self._pending.moves.append(move)
+        self._touch(from_table)
+        self._touch(to_table)
+        return move
+
+    def _touch(self, table_id: str) -> None:
+        if table_id not in self._dirty:
+            self._dirty.add(table_id)
+            self._pending.tables.append(table_id)
+
+    def flush(self) -> Updates:
+        """Changements accumulés depuis le dernier appel (une entrée par table touchée), puis remise à zéro."""
+        updates = self._pending
+        updates.tables = [t for t in updates.tables if t in self.tables]
+        self._pending = Updates()
+        self._dirty = set()
+        return updates
+
+    # --- Niveau de blinds du tournoi ---
+
+    def level_up(self) -> bool:
+        """Échéance de l'horloge du tournoi: niveau suivant pour toutes les tables (à leur prochaine main)."""
+        return self.structure is not None and self._set_level(self.blind_level + 1)
+
+    def _set_level(self, index: int) -> bool:
+        index = min(index, len(self.structure.levels) - 1)
+        if index <= self.blind_level:
+            return False
+        self.blind_level = index
+        for game in self.tables.values():
+            game.blind_level_due = index
+        return True
+
+    # --- Classement ---
+
+    @property
+    def players_left(self) -> int:
+        return len(self.table_of)
+
+    @property
+    def finished(self) -> bool:
+        return self.started and self.players_left <= 1
+
+    def standings(self) -> List[Dict]:
+        """Classement: joueurs en lice par tapis décroissant, puis éliminés par place."""
+        alive = sorted(self.table_of, key=lambda pid: -self.stacks.get(pid, 0))
+        rows = [{'player_id': pid, 'name': self.entrants[pid], 'stack': self.stacks.get(pid, 0),
+                 'table': self.table_of[pid], 'place': i + 1} for i, pid in enumerate(alive)]
+        rows += [{'player_id': pid, 'name': self.entrants[pid], 'stack': 0, 'table': None, 'place': place}
+                 for pid, place in sorted(self.places.items(), key=lambda kv: kv[1])]
+        return rows
+
+    def table_sizes(self) -> Dict[str, int]:
+        return dict(self.sizes.size)
+
+    def imbalance(self) -> int:
+        """Écart entre la plus grande et la plus petite table (O(log tables))."""
+        largest, smallest = self.sizes.largest(), self.sizes.smallest()
+        return self.sizes.size[largest] - self.sizes.size[smallest] if largest is not None else 0
+
+
+def _hand_in_progress(game) -> bool:
+    phase = getattr(game.phase, 'value', game.phase)
+    return phase not in ('waiting', 'showdown')
+
+
+def _remove_seat(game, seat: int) -> None:
+    """Retirer un siège en gardant le bouton sur le même joueur (ou le suivant si c'est lui qui part)."""
+    del game.players[seat]
+    if seat < game.dealer_pos:
+        game.dealer_pos -= 1
+    if game.dealer_pos >= len(game.players):
+        game.dealer_pos = 0
+
@@ -5,11 +5,17 @@ import random
 
 from dataclasses import dataclass
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import os
 import sys
 import math
 
+try:  # hors CodinGame (fichier unique): équité contre les ranges des adversaires (ranges.py)
+    from ranges import range_equities
+except ImportError:
+    range_equities = None
+
 
 def idebug(*args):
     return
@@ -47,28 +53,27 @@ class Player:
     chip_in_pot: int
     hand: List[Card] = None
     last_action: str = ''
+    me: bool = False
 
     def __repr__(self):
-        player: str = 'ME' if self.id == player_id else 'OP'
+        player: str = 'ME' if self.me else 'OP'
         return f'{player} #{self.id} - last action = {self.last_action} stack: {self.stack} - chip_in_pot: {self.chip_in_pot}'
 
     def get_numeric_hand(self) -> List[int]:
         return [i for i, c in deck.items() if c in self.hand]
 
-    def evaluate_hand(self, table_cards: List[Card], list_functions: List) -> int:
-        cards: List[Card] = table_cards + player.hand
-        winning_hands = [f for f in list_functions if f(cards) is not None]
-        return max(winning_hands, key=lambda f: f(cards)) if winning_hands else None
+    def evaluate_hand(self, table_cards: List[int]) -> int:
+        return classify(table_cards, self.get_numeric_hand())[0]
 
 
-def simulate_holdem(players: List[Player]):
+def simulate_holdem(players: List[Player], table_cards: List[int], board_cards: List[Card], deadline: float):
     wins = 0
-    player = players[player_id]
-    opponents = [p for p in players if p.id != player_id]
+    player = next(p for p in players if p.me)
+    opponents = [p for p in players if not p.me]
     player_num_hand = player.get_numeric_hand()
 
     i = 0
-    while perf_counter() - tic < MAX_TIME_OUT / 1000:
+    while perf_counter() < deadline:
         # Simuler une situation de jeu (deux cartes en main et cinq sur la table)
         # table_cards = random.sample(list(set(range(52)) - set(player_num_hand)), 5)
         # board_cards = [deck[i] for i in table_cards]
@@ -87,8 +92,8 @@ def simulate_holdem(players: List[Player]):
             opponent.hand = [deck[i] for i in opponent_num_hand]
 
         # Évaluation des mains et détermination du gagnant
-        player_score = player.evaluate_hand(new_board_cards, list_functions)
-        best_opponent_score = max([p.evaluate_hand(new_board_cards, list_functions) for p in opponents])
+        player_score = player.evaluate_hand(new_table_cards)
+        best_opponent_score = max([p.evaluate_hand(new_table_cards) for p in opponents])
         if player_score > best_opponent_score:
             wins += 1
         i += 1
@@ -97,169 +102,79 @@ def simulate_holdem(players: List[Player]):
     return win_probability, i
 
 
-def longest_consecutive_sequence(nums):
-    if not nums:
-        return []
-
-    nums_set = set(nums)
-    longest_sequence = []
-
-    for num in nums:
-        if num - 1 not in nums_set:  # Start of a new sequence
-            current_sequence = [num]
-            current_num = num + 1
-
-            while current_num in nums_set:
-                current_sequence.append(current_num)
-                current_num += 1
-
-            # Update the longest sequence if needed
-            if len(current_sequence) > len(longest_sequence):
-                longest_sequence = current_sequence
-
-    return longest_sequence[-5:]
-
-
-def all_cards_in_table(cards_sets: List[tuple]):
-    for t in cards_sets:
-        for c in t:
-            if c in player.hand:
-                return False
-    return True
-
-
-def switch_ace(values: List[int]) -> List[int]:
-    new_values: List[int] = []
-    for v in values:
-        new_values += [1] if v == 14 else [v]
-    return new_values
-
-
-def strait_flush(cards: List[Card]) -> float:
-    """Straight of the same suit"""
-    success = 1000
-    for s in suits:
-        values: List[int] = [c.value for c in cards if c.suit == s]
-        sequence: List[int] = longest_consecutive_sequence(values)
-        if len(sequence) == 5:
-            return success  # + sequence[-1]
-        sequence: List[int] = longest_consecutive_sequence(switch_ace(values))
-        if len(sequence) == 5:
-            return success  # + sequence[-1]
-
-
-def get_four_of_a_kind(cards: List[Card]) -> List[tuple]:
-    """Four cards of the same value"""
-    four_of_a_kind: List[tuple] = []
-    for v in range(len(card_values)):
-        cards_candidates = [c for c in cards if c.value == v + 2]
-        if len(cards_candidates) == 4:
-            four_of_a_kind.append(tuple(cards_candidates))
-    return four_of_a_kind
-
-
-def four_of_a_kind(cards: List[Card]) -> float:
-    success = 900
-    four_sets = get_four_of_a_kind(cards)
-    if len(four_sets) >= 1 and not all_cards_in_table(four_sets):
-        return success
-
-
-def full_house(cards: List[Card]) -> float:
-    """	Combination of three of a kind and a pair"""
-    success = 800
-    three_sets: List[tuple] = get_three_of_a_kind(cards)
-    pairs: List[tuple] = get_pairs(cards)
-    for pair in pairs:
-        for three_set in three_sets:
-            cards = [pair] + [three_set]
-            if not all_cards_in_table(cards):
-                return success
-
-
-def flush(cards: List[Card]) -> float:
-    """5 cards of the same suit, not in sequential order"""
-    success = 700
-    for s in suits:
-        cards_candidates = [c for c in cards if c.suit == s]
-        s1, s2 = set(cards_candidates), set(board_cards)
-        cards_in_table = s1 - s2
-        if len(cards_candidates) == 5 and len(cards_in_table) != 5:
-            return success
-
-
-def straight(cards: List[Card]) -> float:
-    """Sequence of 5 cards in increasing value (Ace can precede 2 and follow up King), not of the same suit"""
-    success = 600
-    values = list(set([c.value for c in cards]))
-    sequence: List[int] = longest_consecutive_sequence(values)
-    if len(sequence) == 5:
-        return success  # + sequence[-1]
-    sequence: List[int] = longest_consecutive_sequence(switch_ace(values))
-    if len(sequence) == 5:
-        return success  # + sequence[-1]
-
-
-# def all_three_sets_in_table(three_sets: List[tuple]):
-#     for c1, c2, c3 in three_sets:
-#         if c1 in player.hand or c2 in player.hand or c3 in player.hand:
-#             return False
-#     return True
-
-
-def get_three_of_a_kind(cards: List[Card]) -> List[tuple]:
-    """Three cards with the same value"""
-    three_sets: List[tuple] = []
-    for v in range(1, len(card_values) + 1):
-        cards_candidates = [c for c in cards if c.value == v]
-        if len(cards_candidates) == 3:
-            three_sets.append(tuple(cards_candidates))
-    return three_sets
-
-
-def three_of_a_kind(cards: List[Card]) -> float:
-    three_sets = get_three_of_a_kind(cards)
-    if len(three_sets) >= 1 and not all_cards_in_table(three_sets):
-        return 500
-
-
-# def all_pairs_in_table(pairs: List[tuple]):
-#     for c1, c2 in pairs:
-#         if c1 in player.hand or c2 in player.hand:
-#             return False
-#     return True
-
-
-def get_pairs(cards: List[Card]) -> List[tuple]:
-    """Two times two cards with the same value"""
-    pairs: List[tuple] = []
-    for v in range(len(card_values)):
-        cards_candidates = [c for c in cards if c.value == v + 2]
-        if len(cards_candidates) == 2:
-            pairs.append(tuple(cards_candidates))
-    return pairs
-
-
-def two_pairs(cards: List[Card]) -> float:
-    pairs = get_pairs(cards)
-    if len(pairs) >= 2 and not all_cards_in_table(pairs):
-        return 400
-
-
-def one_pair(cards: List[Card]) -> float:
-    success = 300
-    pairs = get_pairs(cards)
-    if len(pairs) >= 1 and not all_cards_in_table(pairs):
-        bonus: int = pairs[0][0].value - 13 # don't fold if I own a pair of (J, Q, Q, A)
-        return success + bonus
-
-
-def high_card(cards: List[Card]) -> float:
-    """	Simple value of the card. Lowest: 2 – Highest: Ace (King in the example)"""
-    success = 200
-    highest_card: Card = max(cards, key=lambda c: c.value)
-    if highest_card.value == 14 and highest_card not in board_cards:
-        return success  # + highest_card_value
+# --- Classement des mains en une passe (masques de bits) ---
+
+def _has_straight(mask: int) -> bool:
+    """5 valeurs consécutives dans un masque de 13 bits (bit 0 = 2, bit 12 = As), As bas compris."""
+    mask = (mask << 1) | (mask >> 12)  # l'As (bit 12) compte aussi sous le 2 (bit 0)
+    return bool(mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4))
+
+
+STRAIGHT_MASKS = [_has_straight(m) for m in range(1 << 13)]
+POPCOUNT = [bin(m).count('1') for m in range(1 << 13)]
+ACE = 1 << 12
+
+# Scores et noms des catégories, dans l'ordre des anciennes fonctions de détection
+STRAIT_FLUSH, FOUR_OF_A_KIND, FULL_HOUSE, FLUSH, STRAIGHT, THREE_OF_A_KIND, TWO_PAIRS, ONE_PAIR, HIGH_CARD = \
+    'strait_flush', 'four_of_a_kind', 'full_house', 'flush', 'straight', 'three_of_a_kind', 'two_pairs', \
+    'one_pair', 'high_card'
+
+
+def classify(board: List[int], hole: List[int]) -> Tuple[int, Optional[str], bool]:
+    """Meilleure combinaison (score, nom, utilise une carte privée), cartes en codes 0..51.
+
+    Une seule passe sur les cartes construit les masques par couleur et par nombre d'exemplaires de
+    chaque valeur; chaque catégorie se teste ensuite en O(1). Même barème que le bot: 1000 (quinte flush)
+    .. 200 (As en main), (0, None, False) si rien. Comme avant, brelans, carrés, full et paires ne comptent
+    que s'ils utilisent une carte privée; couleur et quinte comptent même entièrement sur la table; un
+    brelan d'As n'est pas compté et une couleur exige exactement 5 cartes de la couleur.
+    """
+    suit_masks = [0, 0, 0, 0]
+    seen = once = twice = thrice = 0  # valeurs présentes au moins 1, 2, 3, 4 fois
+    hole_mask = board_mask = 0
+    for c in board:
+        board_mask |= 1 << c % 13
+    for c in hole:
+        hole_mask |= 1 << c % 13
+    for c in board + hole:
+        suit, bit = divmod(c, 13)
+        bit = 1 << bit
+        suit_masks[suit] |= bit
+        if thrice & bit:
+            seen |= bit << 13  # 4 exemplaires: marqué au-delà des 13 bits
+        elif twice & bit:
+            thrice |= bit
+        elif once & bit:
+            twice |= bit
+        else:
+            once |= bit
+    quads = seen >> 13
+    trips = thrice & ~quads & ~ACE  # exactement 3 (2..Roi: le brelan d'As n'était pas détecté)
+    pairs = twice & ~thrice        # exactement 2
+    values = once
+
+    for mask in suit_masks:
+        if STRAIGHT_MASKS[mask]:
+            return 1000, STRAIT_FLUSH, not STRAIGHT_MASKS[board_mask] or bool(hole_mask & mask)
+    if quads & hole_mask:
+        return 900, FOUR_OF_A_KIND, True
+    if trips and pairs and (trips | pairs) & hole_mask:
+        return 800, FULL_HOUSE, True
+    for suit, mask in enumerate(suit_masks):
+        if POPCOUNT[mask] == 5:
+            return 700, FLUSH, any(c // 13 == suit for c in hole)
+    if STRAIGHT_MASKS[values]:
+        return 600, STRAIGHT, not STRAIGHT_MASKS[board_mask]
+    if trips & hole_mask:
+        return 500, THREE_OF_A_KIND, True
+    if pairs & hole_mask:
+        if POPCOUNT[pairs] >= 2:
+            return 400, TWO_PAIRS, True
+        low = (pairs & -pairs).bit_length() + 1  # valeur de la plus petite paire
+        return 300 + low - 13, ONE_PAIR, True
+    if hole_mask & ACE and not board_mask & ACE:
+        return 200, HIGH_CARD, True
+    return 0, None, False
 
 
 def game_state(table_cards_count):
@@ -280,6 +195,138 @@ def get_bet_action(actions: List[str]) -> Optional[int]:
         bet_action = list_actions[0]
         return int(bet_action.split('_')[1])
 
+@dataclass
+class Turn:
+    """Entrées d'un tour de jeu, lues et converties une seule fois (cartes en codes 0..51)."""
+    round: int
+    hand_nb: int
+    stacks: List[Tuple[int, int]]  # (stack, chip_in_pot) par joueur
+    board: List[int]
+    hand: List[int]
+    actions: List[Tuple[int, int, int, str, str]]  # (round, hand_nb, player_id, action, board)
+    showdowns: List[Tuple[int, str, str]]  # (hand_nb, board, cartes des joueurs)
+    possible_actions: List[str]
+
+
+def card_codes(text: str) -> List[int]:
+    """'AD_QH_2S_X_X' -> codes des cartes visibles ('X' / 'E' ignorés)."""
+    return [CARD_CODES[v] for v in text.split('_') if v in CARD_CODES]
+
+
+class ProtocolReader:
+    """Lecture du protocole de l'arbitre: une ligne = un readline du flux (tamponné), sans input()."""
+
+    def __init__(self, stream):
+        self._readline = stream.readline
+
+    def line(self) -> str:
+        line = self._readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\r\n')
+
+    def int(self) -> int:
+        return int(self.line())
+
+    def header(self) -> List[int]:
+        """Les 8 entiers d'initialisation (blinds, niveaux, cave, nombre de joueurs, id)."""
+        return [self.int() for _ in range(8)]
+
+    def turn(self, _round: int, player_nb: int) -> Turn:
+        """Le reste d'un tour, une fois le numéro de round lu (il débloque le chronomètre du tour)."""
+        line = self.line
+        hand_nb = int(line())
+        stacks = []
+        for _ in range(player_nb):
+            stack, chip_in_pot = line().split()
+            stacks.append((int(stack), int(chip_in_pot)))
+        board = card_codes(line())
+        hand = card_codes(line())
+        actions = []
+        for _ in range(int(line())):
+            a_round, a_hand, a_player, action, a_board = line().split()
+            actions.append((int(a_round), int(a_hand), int(a_player), action, a_board))
+        showdowns = []
+        for _ in range(int(line())):
+            s_hand, s_board, s_cards = line().split()
+            showdowns.append((int(s_hand), s_board, s_cards))
+        possible_actions = [line() for _ in range(int(line()))]
+        return Turn(_round, hand_nb, stacks, board, hand, actions, showdowns, possible_actions)
+
+
+class OpponentStats:
+    """Statistiques cumulées par joueur sur toute la partie, mises à jour en O(1) par ligne lue.
+
+    Tableaux de taille fixe (un emplacement par joueur), conservés d'un tour à l'autre:
+    - VPIP: % des mains où le joueur a mis de l'argent volontairement préflop (CALL, BET, ALL-IN);
+    - PFR: % des mains où il a relancé préflop;
+    - AF (aggression factor): (BET + ALL-IN) / CALL, toutes rues confondues;
+    - abattages: nombre de mains montrées et dernière main montrée.
+    """
+    MIN_HANDS = 8  # en dessous, les pourcentages ne sont pas significatifs
+
+    def __init__(self, nb_players: int):
+        self.hands = [0] * nb_players
+        self.vpip = [0] * nb_players
+        self.pfr = [0] * nb_players
+        self.aggressive = [0] * nb_players
+        self.calls = [0] * nb_players
+        self.showdowns = [0] * nb_players
+        self.last_shown: List[Optional[str]] = [None] * nb_players
+        self._last_hand = [0] * nb_players       # dernière main comptée dans hands
+        self._last_vpip_hand = [0] * nb_players  # dernière main comptée dans vpip
+        self._last_pfr_hand = [0] * nb_players   # dernière main comptée dans pfr
+
+    def record_action(self, hand_nb: int, pid: int, action: str, board: str):
+        if self._last_hand[pid] != hand_nb:
+            self._last_hand[pid] = hand_nb
+            self.hands[pid] += 1
+        preflop = board.startswith('X')
+        if action == 'CALL':
+            self.calls[pid] += 1
+        elif action.startswith('BET') or action == 'ALL-IN':
+            self.aggressive[pid] += 1
+            if preflop and self._last_pfr_hand[pid] != hand_nb:
+                self._last_pfr_hand[pid] = hand_nb
+                self.pfr[pid] += 1
+        else:
+            return
+        if preflop and self._last_vpip_hand[pid] != hand_nb:
+            self._last_vpip_hand[pid] = hand_nb
+            self.vpip[pid] += 1
+
+    def record_showdown(self, cards: str):
+        """Ligne d'abattage: 2 cartes par joueur ('QH_3S_X_X_...'), 'X' ou 'E' pour une main non montrée."""
+        values = cards.split('_')
+        for pid in range(min(len(values) // 2, len(self.hands))):
+            hand = values[2 * pid:2 * pid + 2]
+            if hand[0] not in ('X', 'E'):
+                self.showdowns[pid] += 1
+                self.last_shown[pid] = '_'.join(hand)
+
+    def vpip_rate(self, pid: int) -> float:
+        return self.vpip[pid] / self.hands[pid] if self.hands[pid] else 0.0
+
+    def pfr_rate(self, pid: int) -> float:
+        return self.pfr[pid] / self.hands[pid] if self.hands[pid] else 0.0
+
+    def aggression_factor(self, pid: int) -> float:
+        return self.aggressive[pid] / self.calls[pid] if self.calls[pid] else float(self.aggressive[pid])
+
+    def range_for(self, pid: int, has_bet: bool) -> str:
+        """Range probable d'un adversaire encore en jeu, pour le calcul d'équité (cf. ranges.py)."""
+        if self.hands[pid] < self.MIN_HANDS:
+            return 'top 20%' if has_bet else 'random'
+        # Un joueur qui mise a une range proche de son PFR, sauf s'il est très agressif (bluffeur)
+        rate = self.vpip_rate(pid) if not has_bet or self.aggression_factor(pid) > 3 else self.pfr_rate(pid)
+        return f'top {min(100, max(5, round(100 * rate)))}%'
+
+    def __repr__(self):
+        return ' | '.join(f'#{p}: VPIP {self.vpip_rate(p):.0%} PFR {self.pfr_rate(p):.0%} '
+                          f'AF {self.aggression_factor(p):.1f} SD {self.showdowns[p]}'
+                          for p in range(len(self.hands)))
+
+
 def detect_duplicate_cards(cards: List[str]):
     duplicates = set()
     uniq_cards = set()
@@ -290,193 +337,172 @@ def detect_duplicate_cards(cards: List[str]):
             uniq_cards.add(card)
     return list(duplicates)
 
-# Auto-generated code below aims at helping you parse
-# the standard input according to the problem statement.
-
-small_blind = int(input())  # initial small blind's value
-idebug(small_blind)
-big_blind = int(input())  # initial big blind's value
-idebug(big_blind)
-hand_nb_by_level = int(input())  # number of hands to play to reach next level
-idebug(hand_nb_by_level)
-level_blind_multiplier = int(input())  # blinds are multiply by this coefficient when the level changes
-idebug(level_blind_multiplier)
-buy_in = int(input())  # initial stack for each player
-idebug(buy_in)
-first_big_blind_id = int(input())  # id of the first big blind player
-idebug(first_big_blind_id)
-player_nb = int(input())  # number of players (2 to 4)
-idebug(player_nb)
-player_id = int(input())  # your id
-idebug(player_id)
 
 suits = ['D', 'H', 'S', 'C']
 card_values = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
 
-list_functions: List = [strait_flush, four_of_a_kind, full_house, flush, straight, three_of_a_kind, two_pairs, one_pair,
-                        high_card]
-
 deck = {13 * i + j: Card(value=j + 2, suit=s) for i, s in enumerate(['D', 'H', 'S', 'C']) for j in range(13)}
-
-played_cards: List[Card] = []
-
-is_start = True
-MAX_TIME_OUT = 1000
-
-# game loop
-while True:
-    _round = int(input())  # referee round (starts at 1-game ends when it reaches 600)
-    idebug(_round)
-
-    tic = perf_counter()
-
-    hand_nb = int(input())  # hand number (starts at 1)
-    idebug(hand_nb)
-
-    players: List[Player] = []
-    for i in range(player_nb):
-        # stack: number of chips in the player's stack
-        # chip_in_pot: number of player's chips in the pot
-        stack, chip_in_pot = [int(j) for j in input().split()]
-        idebug(stack, chip_in_pot)
-        players.append(Player(i, stack, chip_in_pot))
-
-    board_cards = input()  # board cards (example : AD_QH_2S_X_X)
-    idebug(board_cards)
-    player_cards = input()  # your cards (example : TC_JH)
-    idebug(player_cards)
-
-    action_nb = int(input())  # number of actions since your last turn
-    idebug(action_nb)
-
-    for i in range(action_nb):
-        line = input()
-        idebug(line)
-        inputs = line.split()
-        action_round = int(inputs[0])  # round of the action
-        # debug(f'action_round = {action_round}')
-        action_hand_nb = int(inputs[1])  # hand number of the action
-        action_player_id = int(inputs[2])  # player id of the action
-        action = inputs[3]  # action (examples : BET_200, FOLD, NONE...)
-        action_board_cards = inputs[4]  # board cards when the action is done (example : AD_QH_2S_4H_X)
-        players[action_player_id].last_action = action
-
-    show_down_nb = int(input())  # number of hands that ended since your last turn
-    idebug(show_down_nb)
-    for i in range(show_down_nb):
-        line = input()
-        idebug(line)
-        inputs = line.split()
-        show_down_hand_nb = int(inputs[0])  # hand number
-        show_down_board_cards = inputs[1]  # board cards at the showdown
-        show_down_player_cards = inputs[2]  # players cards (example : QH_3S_E_E_5C_H_7D_KC player0's cards, followed by player1's cards ...)
-
-    possible_action_nb = int(input())  # number of actions you can do
-    idebug(possible_action_nb)
-
-    possible_actions = []
-    for i in range(possible_action_nb):
-        possible_action = input()  # your possible action (BET_240 means 240 is the minimum raise but you can bet more)
-        idebug(possible_action)
-        possible_actions.append(possible_action)
-
-    # Write an action using print
-    # To debug: print("Debug messages...", file=sys.stderr, flush=True)
-
-    # try to count cards (useless here :-( played cards are resubmitted before end of deck)
-    if show_down_nb:
-        # 4H_7H_4C_TS_9H 6C_9S_QS_5C_KH_6D
-        for v in show_down_board_cards.split('_'):
-            if v not in ('X', 'E'):
-                played_cards.append(Card(*conv(v)))
-        for v in show_down_player_cards.split('_'):
-            if v not in ('X', 'E'):
-                played_cards.append(Card(*conv(v)))
-    debug(f'{len(played_cards)} played cards: {played_cards}')
-    duplicate_cards: List[str] = detect_duplicate_cards(played_cards)
-    debug(f'{len(duplicate_cards)} duplicate played cards: {duplicate_cards}')
-    if len(played_cards) >= 52:
-        played_cards.clear()
-
-    player: Player = players[player_id]
-
-    conv = lambda v: (card_values.index(v[0]) + 2, v[1])
-    board_cards = [Card(*conv(v)) for v in board_cards.split('_') if v != 'X']
-    table_cards: List[int] = [i for i, c in deck.items() if c in board_cards]
-    player.hand = [Card(*conv(v)) for v in player_cards.split('_') if v != 'X']
-
-    visible_cards: List[Card] = board_cards + player.hand
-
-    list_functions: List = [strait_flush, four_of_a_kind, full_house, flush, straight, three_of_a_kind, two_pairs, one_pair, high_card]
-    winning_hands = [f for f in list_functions if f(visible_cards) is not None]
-
-    best_hand = max(winning_hands, key=lambda f: f(visible_cards)) if winning_hands else None
-    # player_score = player.evaluate_hand(board_cards, list_functions)
-    player_score = best_hand(visible_cards) if best_hand else 0
-
-    if best_hand:
-        debug(f'best hand: {best_hand.__name__} - score: {player_score}')
-
-    # win_probability, num_iterations = simulate_holdem(players=players)
-    # debug(f'win probability: {win_probability:.2%} - num_iteration = {num_iterations}')
-
-    if is_start:
-        MAX_TIME_OUT = 49
-        is_start = False
-
-    debug(f'players = {players}')
-
-    bluffing_players: List[Player] = [p for p in players if
-                                      p.id < player_id and ('BET' in p.last_action or 'ALL-IN' in p.last_action)]
-    debug(f'bluffing players = {bluffing_players}')
-
-    # MESSAGE = f'$0 {win_probability:.0%} - {best_hand.__name__}: {player_score}'
-    bluffing_player: Player = None
-    all_in_player: Player = None
-    max_bet = 0
-    for p in bluffing_players:
-        if p.last_action == 'ALL-IN':
-            all_in_player = p
-        else:
-            bet_amount: int = int(p.last_action.split('_')[1])
-            if bet_amount > max_bet:
-                bluffing_player = p
-                max_bet = bet_amount
-    bluffing_player = bluffing_player if not all_in_player else all_in_player
-
-    MESSAGE = f'${player_id} - {best_hand.__name__}' if best_hand else f'You bluff, ${bluffing_player.id}! :-D' if bluffing_player else f'${player_id} is bored :-d'
-    FOLD_MESSAGE = f"${player_id} rage quits"
-    state = game_state(len(board_cards))
-    debug(f'state = {state} - score: {player_score}')
-    debug(f'possible_actions = {possible_actions}')
-    if player_score < 200:
-        if state == 'RIVER':
-            action = f"FOLD;{FOLD_MESSAGE}"
-        elif 'CHECK' in possible_actions:
-            action = f"CHECK;{MESSAGE}"
-        elif 'CALL' in possible_actions and not all_in_player:
-            action = f"CALL;{MESSAGE}"
-        else:
-            action = f"FOLD;{FOLD_MESSAGE}"
-    elif player_score < 400:
-        if 'CALL' in possible_actions:
-            if state == 'RIVER' and player_score > 300: # does not fold if I have a pair of (J, Q, K, A)
+# Libellé -> code carte (0..51), calculé une fois: plus de card_values.index ni de recherche dans le deck
+CARD_CODES = {v + s: 13 * i + j for i, s in enumerate(suits) for j, v in enumerate(card_values)}
+
+
+class Bot:
+    """Moteur de décision: un appel à play() par tour de jeu; l'état (cartes vues, statistiques des
+    adversaires, délai de réponse) est conservé d'un tour à l'autre. Importable pour les rejeux hors ligne."""
+
+    def __init__(self, small_blind: int, big_blind: int, hand_nb_by_level: int, level_blind_multiplier: int,
+                 buy_in: int, first_big_blind_id: int, player_nb: int, player_id: int, use_equity: bool = False):
+        self.small_blind = small_blind  # initial small blind's value
+        self.big_blind = big_blind  # initial big blind's value
+        self.hand_nb_by_level = hand_nb_by_level  # number of hands to play to reach next level
+        self.level_blind_multiplier = level_blind_multiplier  # blinds are multiply by this coefficient when the level changes
+        self.buy_in = buy_in  # initial stack for each player
+        self.first_big_blind_id = first_big_blind_id  # id of the first big blind player
+        self.player_nb = player_nb  # number of players (2 to 4)
+        self.player_id = player_id  # your id
+        self.use_equity = use_equity and range_equities is not None
+        self.played_cards: List[Card] = []
+        self.opponent_stats = OpponentStats(player_nb)
+        self.is_start = True
+        self.max_time_out = 1000  # ms: 1 s au premier tour, puis 49 ms
+
+    def play(self, turn: Turn, tic: float) -> str:
+        """Action à jouer ('CALL;message', 'BET 240;message', ...); `tic` = lecture du numéro de round."""
+        player_id = self.player_id
+        opponent_stats = self.opponent_stats
+        played_cards = self.played_cards
+        players: List[Player] = [Player(i, stack, chip_in_pot, me=i == player_id)
+                                 for i, (stack, chip_in_pot) in enumerate(turn.stacks)]
+
+        for action_round, action_hand_nb, action_player_id, action, action_board_cards in turn.actions:
+            players[action_player_id].last_action = action
+            opponent_stats.record_action(action_hand_nb, action_player_id, action, action_board_cards)
+
+        for show_down_hand_nb, show_down_board_cards, show_down_player_cards in turn.showdowns:
+            opponent_stats.record_showdown(show_down_player_cards)
+
+        possible_actions = turn.possible_actions
+        parse_ms = (perf_counter() - tic) * 1000
+
+        # try to count cards (useless here :-( played cards are resubmitted before end of deck)
+        for _, show_down_board_cards, show_down_player_cards in turn.showdowns:
+            # 4H_7H_4C_TS_9H 6C_9S_QS_5C_KH_6D
+            played_cards += [deck[c] for c in card_codes(show_down_board_cards)]
+            played_cards += [deck[c] for c in card_codes(show_down_player_cards)]
+        debug(f'{len(played_cards)} played cards: {played_cards}')
+        duplicate_cards: List[str] = detect_duplicate_cards(played_cards)
+        debug(f'{len(duplicate_cards)} duplicate played cards: {duplicate_cards}')
+        if len(played_cards) >= 52:
+            played_cards.clear()
+
+        player: Player = players[player_id]
+
+        table_cards: List[int] = turn.board
+        board_cards = [deck[c] for c in table_cards]
+        player.hand = [deck[c] for c in turn.hand]
+
+        player_score, best_hand, uses_hole_card = classify(table_cards, turn.hand)
+
+        if best_hand:
+            debug(f'best hand: {best_hand} - score: {player_score}{"" if uses_hole_card else " (table)"}')
+
+        # win_probability, num_iterations = simulate_holdem(players, table_cards, board_cards, tic + self.max_time_out / 1000)
+        # debug(f'win probability: {win_probability:.2%} - num_iteration = {num_iterations}')
+
+        if self.is_start:
+            self.max_time_out = 49
+            self.is_start = False
+
+        debug(f'players = {players}')
+        debug(f'stats = {opponent_stats}')
+
+        bluffing_players: List[Player] = [p for p in players if
+                                          p.id < player_id and ('BET' in p.last_action or 'ALL-IN' in p.last_action)]
+        debug(f'bluffing players = {bluffing_players}')
+
+        # Diagnostic seulement (aucune décision ne l'utilise encore): coûteux, désactivé par défaut
+        if self.use_equity and len(player.hand) == 2:
+            # Range déduite des statistiques du joueur (cf. OpponentStats.range_for)
+            opponent_ranges = [opponent_stats.range_for(p.id, p in bluffing_players) for p in players
+                               if p.id != player_id and p.last_action != 'FOLD']
+            budget = self.max_time_out / 1000 - (perf_counter() - tic) - 0.01
+            if opponent_ranges and budget > 0:
+                result = range_equities([turn.hand] + opponent_ranges, board=table_cards,
+                                        time_budget=budget)
+                debug(f"range equity: {result['equity'][0]:.1%} ({result['samples']} samples vs {opponent_ranges})")
+
+        # MESSAGE = f'$0 {win_probability:.0%} - {best_hand}: {player_score}'
+        bluffing_player: Player = None
+        all_in_player: Player = None
+        max_bet = 0
+        for p in bluffing_players:
+            if p.last_action == 'ALL-IN':
+                all_in_player = p
+            else:
+                bet_amount: int = int(p.last_action.split('_')[1])
+                if bet_amount > max_bet:
+                    bluffing_player = p
+                    max_bet = bet_amount
+        bluffing_player = bluffing_player if not all_in_player else all_in_player
+
+        MESSAGE = f'${player_id} - {best_hand}' if best_hand else f'You bluff, ${bluffing_player.id}! :-D' if bluffing_player else f'${player_id} is bored :-d'
+        FOLD_MESSAGE = f"${player_id} rage quits"
+        state = game_state(len(board_cards))
+        debug(f'state = {state} - score: {player_score}')
+        debug(f'possible_actions = {possible_actions}')
+        if player_score < 200:
+            if state == 'RIVER':
+                action = f"FOLD;{FOLD_MESSAGE}"
+            elif 'CHECK' in possible_actions:
+                action = f"CHECK;{MESSAGE}"
+            elif 'CALL' in possible_actions and not all_in_player:
                 action = f"CALL;{MESSAGE}"
             else:
                 action = f"FOLD;{FOLD_MESSAGE}"
-        elif get_bet_action(possible_actions):
-            amount = get_bet_action(possible_actions)
-            action = f"BET {amount};{MESSAGE}"
-        else:
-            action = f"FOLD;{FOLD_MESSAGE}"
-    elif player_score < 600:
-        if get_bet_action(possible_actions):
-            amount = max(get_bet_action(possible_actions), player.stack // 2)
-            action = f"BET {amount};{MESSAGE}"
+        elif player_score < 400:
+            if 'CALL' in possible_actions:
+                if state == 'RIVER' and player_score > 300: # does not fold if I have a pair of (J, Q, K, A)
+                    action = f"CALL;{MESSAGE}"
+                else:
+                    action = f"FOLD;{FOLD_MESSAGE}"
+            elif get_bet_action(possible_actions):
+                amount = get_bet_action(possible_actions)
+                action = f"BET {amount};{MESSAGE}"
+            else:
+                action = f"FOLD;{FOLD_MESSAGE}"
+        elif player_score < 600:
+            if get_bet_action(possible_actions):
+                amount = max(get_bet_action(possible_actions), player.stack // 2)
+                action = f"BET {amount};{MESSAGE}"
+            else:
+                action = f"CALL;{MESSAGE}"
         else:
-            action = f"CALL;{MESSAGE}"
-    else:
-        action = f"ALL_IN;{MESSAGE}"
-
-    debug(f'elapsed time = {round((perf_counter() - tic) * 1000, 2)} ms')
-    print(action)
+            action = f"ALL_IN;{MESSAGE}"
+
+        debug(f'elapsed time = {round((perf_counter() - tic) * 1000, 2)} ms (parse: {parse_ms:.3f} ms)')
+        return action
+
+
+def main():
+    # Auto-generated code below aims at helping you parse
+    # the standard input according to the problem statement.
+    reader = ProtocolReader(sys.stdin)
+    header = reader.header()
+    idebug(*header)
+    # POKER_EQUITY=1: journaliser l'équité contre les ranges (hors CodinGame, ~40 ms par tour)
+    bot = Bot(*header, use_equity=os.environ.get('POKER_EQUITY', '0') == '1')
+
+    # game loop
+    while True:
+        try:
+            _round = reader.int()  # referee round (starts at 1-game ends when it reaches 600)
+        except EOFError:  # fin d'une partie rejouée hors ligne
+            break
+        tic = perf_counter()
+        turn = reader.turn(_round, bot.player_nb)
+        idebug(turn)
+        print(bot.play(turn, tic))
+
+
+if __name__ == '__main__':
+    main()
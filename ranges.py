@@ -0,0 +1,255 @@
+"""
+Équité main/range contre ranges: chaque adversaire est décrit par une range pondérée de mains
+au lieu d'une main aléatoire uniforme.
+
+Syntaxe des ranges (éléments séparés par des virgules, poids optionnel ':w', 1 par défaut):
+- paires: 'QQ', 'QQ+' (QQ, KK, AA), '22-66';
+- mains non paires: 'AKs' (assortie), 'AKo' (dépareillée), 'AK' (les deux), 'ATs+' (ATs..AKs), 'K9o-K6o';
+- combinaisons explicites: 'AHKH', 'AsKd' (couleurs D, H, S, C);
+- pourcentage: '20%' ou 'top 20%' (meilleures mains de départ selon preflop_equity.json, cf. canonical.py);
+- 'random' ou '100%': toutes les mains.
+Ex: 'QQ+, AKs, AKo:0.5, top 10%'.
+
+Tirage: une table d'alias (méthode de Vose) par range, construite une fois sans les combinaisons en
+conflit avec les cartes connues (board, main du héros, cartes mortes): chaque tirage coûte O(1). Les
+conflits entre adversaires sont résolus par rejet. Le calcul est borné par `time_budget`, pour tenir
+dans le délai de réponse du bot (poker.py, 49 ms par tour).
+
+Les cartes sont encodées en entiers 0..51 (cf. hand_eval.card_index) et évaluées par hand_eval.rank_codes.
+"""
+import itertools
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from canonical import preflop_class
+from hand_eval import SUITS, VALUE_CHARS, rank_codes
+
+Combo = Tuple[int, int]
+
+PREFLOP_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'preflop_equity.json')
+
+ALL_COMBOS: List[Combo] = list(itertools.combinations(range(52), 2))
+
+
+class AliasTable:
+    """Tirage en O(1) selon des poids quelconques (méthode d'alias de Vose)."""
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0 or sum(weights) <= 0:
+            raise ValueError('range vide')
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:  # reliquats d'arrondi
+            self.prob[i] = 1.0
+
+    def sample(self, rng: random.Random) -> int:
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+_ORDER: Optional[List[str]] = None
+
+
+def _preflop_order() -> List[str]:
+    """Classes de mains de départ, de la meilleure à la pire (équité contre une main aléatoire)."""
+    global _ORDER
+    if _ORDER is None:
+        with open(PREFLOP_TABLE) as f:
+            table = json.load(f)['equity']
+        _ORDER = sorted(table, key=lambda name: (-table[name], name))
+    return _ORDER
+
+
+def _class_combos(name: str) -> List[Combo]:
+    """Combinaisons d'une classe 'AA', 'AKs', 'AKo' ou 'AK'."""
+    high, low = VALUE_CHARS.index(name[0]), VALUE_CHARS.index(name[1])
+    kind = name[2:]
+    combos = []
+    for s1 in range(4):
+        for s2 in range(4):
+            a, b = 13 * s1 + high, 13 * s2 + low
+            if a == b or (high == low and s1 > s2):
+                continue
+            if high != low and ((kind == 's' and s1 != s2) or (kind == 'o' and s1 == s2)):
+                continue
+            combos.append((min(a, b), max(a, b)))
+    return combos
+
+
+def _card(label: str) -> int:
+    return 13 * SUITS.index(label[1].upper()) + VALUE_CHARS.index(label[0].upper())
+
+
+def _expand(token: str) -> List[str]:
+    """Noms de classes désignés par 'QQ+', '22-66', 'ATs+', 'K9o-K6o', ..."""
+    if token.endswith('+'):
+        base = token[:-1]
+        high, low = VALUE_CHARS.index(base[0]), VALUE_CHARS.index(base[1])
+        if high == low:
+            return [VALUE_CHARS[v] * 2 for v in range(low, 13)]
+        return [VALUE_CHARS[high] + VALUE_CHARS[v] + base[2:] for v in range(low, high)]
+    if '-' in token:
+        first, last = token.split('-')
+        lo, hi = sorted((VALUE_CHARS.index(first[1]), VALUE_CHARS.index(last[1])))
+        if first[0] == first[1]:
+            return [VALUE_CHARS[v] * 2 for v in range(lo, hi + 1)]
+        return [first[0] + VALUE_CHARS[v] + first[2:] for v in range(lo, hi + 1)]
+    return [token]
+
+
+def parse_range(text: str) -> Dict[Combo, float]:
+    """Range textuelle -> {combinaison (a, b) avec a < b: poids}. Lève ValueError si la syntaxe est invalide."""
+    weights: Dict[Combo, float] = {}
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        token, _, weight = item.partition(':')
+        token = token.strip()
+        w = float(weight) if weight else 1.0
+        try:
+            combos = _token_combos(token)
+        except (ValueError, IndexError):
+            raise ValueError(f"élément de range invalide: {item!r}") from None
+        for combo in combos:
+            weights[combo] = w
+    return {c: w for c, w in weights.items() if w > 0}
+
+
+def _token_combos(token: str) -> List[Combo]:
+    lowered = token.lower()
+    if lowered in ('random', 'any'):
+        return list(ALL_COMBOS)
+    if lowered.endswith('%'):
+        percent = float(lowered.replace('top', '').rstrip('%'))
+        target = 1326 * percent / 100.0
+        combos: List[Combo] = []
+        for name in _preflop_order():
+            if len(combos) >= target:
+                break
+            combos += _class_combos(name)
+        return combos
+    if len(token) == 4 and token[1].upper() in SUITS and token[3].upper() in SUITS:
+        a, b = _card(token[:2]), _card(token[2:])
+        if a == b:
+            raise ValueError(token)
+        return [(min(a, b), max(a, b))]
+    token = token[0].upper() + token[1].upper() + token[2:].lower()
+    combos = []
+    for name in _expand(token):
+        if VALUE_CHARS.index(name[0]) < VALUE_CHARS.index(name[1]):
+            name = name[1] + name[0] + name[2:]
+        if name[2:] not in ('', 's', 'o') or (name[0] == name[1] and name[2:]):
+            raise ValueError(token)
+        combos += _class_combos(name)
+    return combos
+
+
+class Range:
+    """Range pondérée d'un joueur, prête au tirage une fois les cartes connues retirées (cf. prepare)."""
+
+    def __init__(self, weights: Dict[Combo, float]):
+        self.weights = weights
+        self.combos: List[Combo] = []
+        self._table: Optional[AliasTable] = None
+
+    @classmethod
+    def parse(cls, text: str) -> 'Range':
+        return cls(parse_range(text))
+
+    @classmethod
+    def of_hand(cls, hand: Sequence[int]) -> 'Range':
+        a, b = hand
+        return cls({(min(a, b), max(a, b)): 1.0})
+
+    def prepare(self, known: Iterable[int]) -> None:
+        """Retirer les combinaisons en conflit avec les cartes connues et construire la table d'alias."""
+        known = set(known)
+        self.combos = [c for c in self.weights if c[0] not in known and c[1] not in known]
+        self._table = AliasTable([self.weights[c] for c in self.combos])
+
+    def sample(self, rng: random.Random) -> Combo:
+        return self.combos[self._table.sample(rng)]
+
+    def classes(self) -> Dict[str, float]:
+        """Poids total par classe de main de départ (utile à l'affichage)."""
+        out: Dict[str, float] = {}
+        for combo, w in self.weights.items():
+            name = preflop_class(combo)
+            out[name] = out.get(name, 0.0) + w
+        return out
+
+
+def range_equities(ranges: Sequence[Any], board: Sequence[int] = (), dead: Sequence[int] = (),
+                   time_budget: float = 0.03, max_samples: int = 20000, max_retries: int = 50,
+                   rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """Équité de chaque range (Range, texte ou main de 2 cartes) contre les autres, partages compris.
+
+    Retourne {'equity': [...], 'samples': n}. Lève ValueError si une range est vide une fois les cartes
+    connues retirées.
+    """
+    rng = rng or random.Random()
+    board = list(board)
+    prepared = []
+    for r in ranges:
+        if isinstance(r, str):
+            r = Range.parse(r)
+        elif not isinstance(r, Range):
+            r = Range.of_hand(r)
+        prepared.append(r)
+    # Les mains connues (range d'une seule combinaison) sont retirées des ranges des autres joueurs
+    fixed = set(board) | set(dead)
+    known_hands = [set(next(iter(r.weights))) if len(r.weights) == 1 else set() for r in prepared]
+    for r, own in zip(prepared, known_hands):
+        r.prepare(fixed.union(*(h for h in known_hands if h is not own)))
+    n = len(prepared)
+    shares = [0.0] * n
+    samples = attempts = 0
+    deadline = time.perf_counter() + time_budget
+
+    while samples < max_samples:
+        attempts += 1
+        if attempts % 32 == 0 and time.perf_counter() >= deadline:
+            break
+        used = set(fixed)
+        hands = []
+        for r in prepared:
+            for _ in range(max_retries):
+                a, b = r.sample(rng)
+                if a not in used and b not in used:
+                    break
+            else:
+                break  # conflit persistant: on retire tout le tirage
+            used.add(a)
+            used.add(b)
+            hands.append([a, b])
+        if len(hands) == n:
+            full = list(board)
+            while len(full) < 5:
+                c = int(rng.random() * 52)
+                if c not in used:
+                    used.add(c)
+                    full.append(c)
+            ranks = [rank_codes(hand + full) for hand in hands]
+            best = max(ranks)
+            winners = [i for i, rk in enumerate(ranks) if rk == best]
+            for i in winners:
+                shares[i] += 1.0 / len(winners)
+            samples += 1
+
+    total = samples or 1
+    return {'equity': [s / total for s in shares], 'samples': samples}
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Arbitre local façon CodinGame: matchs bot contre bot (2 à 4 processus) sur le protocole stdin/stdout
+de poker.py, pour régler le bot sur des milliers de parties au lieu de soumissions manuelles.
+
+- Protocole identique à celui de l'arbitre: en-tête (blinds, `hand_nb_by_level`, multiplicateur, cave,
+  première big blind, nombre de joueurs, id), puis à chaque tour: round, numéro de main, tapis et mises,
+  board ('AD_QH_2S_X_X'), cartes du joueur, actions depuis son dernier tour, abattages depuis son dernier
+  tour ('QH_3S_X_X_...': cartes montrées, 'X' si non montrées, 'E' si éliminé), actions possibles.
+- Réponses acceptées: 'FOLD', 'CHECK', 'CALL', 'BET n', 'ALL_IN' / 'ALL-IN', suivies de ';message'.
+  Une réponse invalide ou hors délai vaut check si possible, sinon fold (et est comptée).
+- Règles de jeu: moteur `PokerGame` du serveur (app.py); blinds multipliées par `level_blind_multiplier`
+  toutes les `hand_nb_by_level` mains; la partie s'arrête quand un seul joueur a des jetons ou après
+  `max_rounds` tours de parole. Classement: ordre d'élimination puis tapis final.
+- Les matchs sont répartis sur un pool de processus (un match = 2 à 4 sous-processus bots reliés par
+  des pipes); les sièges tournent d'un match à l'autre. Statistiques: taux de victoire par bot avec
+  intervalle de confiance de Wilson à 95 %, rang moyen, dépassements de délai.
+
+Exemple:
+  python referee.py --bot "python3 -u poker.py" --bot "python3 -u poker.py" --matches 200 --workers 8
+  python referee.py --bot new="python3 -u poker.py" --bot old="python3 -u /tmp/old/poker.py" --players 4
+"""
+import argparse
+import contextlib
+import math
+import os
+import random
+import select
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.devnull, 'w') as _devnull, contextlib.redirect_stdout(_devnull):
+    # app.py affiche sa configuration à l'import: inutile ici
+    from app import PokerGame, GamePhase  # type: ignore
+from blinds import geometric_structure
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MAX_ACTIONS_PER_HAND = 200
+
+
+class BotProcess:
+    """Un bot en sous-processus: une ligne par réponse sur stdout, trace sur stderr ignorée."""
+
+    def __init__(self, command: str):
+        env = dict(os.environ, PYTHONUNBUFFERED='1')  # print() sans flush dans poker.py
+        self.proc = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL, text=True, bufsize=1, cwd=ROOT, env=env)
+
+    def send(self, lines: List[str]) -> bool:
+        try:
+            self.proc.stdin.write('\n'.join(lines) + '\n')
+            self.proc.stdin.flush()
+            return True
+        except (BrokenPipeError, OSError):
+            return False
+
+    def receive(self, timeout: float, grace: float = 5.0) -> Tuple[Optional[str], bool]:
+        """(ligne de réponse, dans les délais). Une réponse tardive est attendue jusqu'à `grace` secondes
+        puis ignorée, pour ne pas la confondre avec la réponse du tour suivant."""
+        ready, _, _ = select.select([self.proc.stdout], [], [], timeout)
+        if not ready:
+            ready, _, _ = select.select([self.proc.stdout], [], [], grace)
+            if ready:
+                self.proc.stdout.readline()
+            return None, False
+        line = self.proc.stdout.readline()
+        return line.strip() or None, True
+
+    def close(self) -> None:
+        with contextlib.suppress(Exception):
+            self.proc.stdin.close()
+        with contextlib.suppress(Exception):
+            self.proc.kill()
+        with contextlib.suppress(Exception):
+            self.proc.wait(timeout=1)
+
+
+def board_string(game: PokerGame) -> str:
+    cards = [str(c) for c in game.community_cards]
+    return '_'.join(cards + ['X'] * (5 - len(cards)))
+
+
+def possible_actions(game: PokerGame, seat: int) -> List[str]:
+    """Actions proposées au joueur (BET_n: montant minimal d'une relance, suivi compris)."""
+    player = game.players[seat]
+    to_call = max(0, game.current_bet - player.current_bet)
+    actions = ['ALL-IN']
+    min_bet = to_call + game.big_blind
+    if player.stack > min_bet:
+        actions.append(f'BET_{min_bet}')
+    if to_call == 0:
+        actions.append('CHECK')
+    elif player.stack > to_call:
+        actions.append('CALL')
+    actions.append('FOLD')
+    return actions
+
+
+def parse_reply(reply: Optional[str], game: PokerGame, seat: int) -> Tuple[Optional[str], int]:
+    """Réponse du bot -> action du moteur ('fold', 'check', 'call', 'raise', montant); (None, 0) si invalide."""
+    if not reply:
+        return None, 0
+    words = reply.split(';', 1)[0].split()
+    if not words:
+        return None, 0
+    verb = words[0].upper()
+    player = game.players[seat]
+    to_call = max(0, game.current_bet - player.current_bet)
+    if verb == 'FOLD':
+        return 'fold', 0
+    if verb == 'CHECK':
+        return ('check', 0) if to_call == 0 else (None, 0)
+    if verb == 'CALL':
+        return ('call', 0) if to_call > 0 else ('check', 0)
+    if verb in ('ALL_IN', 'ALL-IN'):
+        return 'raise', player.stack
+    if verb == 'BET' and len(words) > 1 and words[1].isdigit():
+        amount = int(words[1])
+        if amount >= player.stack:
+            return 'raise', player.stack
+        return 'raise', max(amount, min(to_call + game.big_blind, player.stack))
+    return None, 0
+
+
+def protocol_action(action: str, amount: int, all_in: bool) -> str:
+    if all_in and action in ('call', 'raise'):
+        return 'ALL-IN'
+    return {'fold': 'FOLD', 'check': 'CHECK', 'call': 'CALL'}.get(action, f'BET_{amount}')
+
+
+def play_match(commands: Sequence[str], seed: int, max_rounds: int = 600, buy_in: int = 2000,
+               small_blind: int = 10, big_blind: int = 20, hand_nb_by_level: int = 10,
+               level_blind_multiplier: int = 2, timeout: float = 0.1, first_timeout: float = 1.0) -> Dict:
+    """Jouer une partie entre les bots `commands` (un par siège) et retourner classement et compteurs."""
+    rng = random.Random(seed)
+    n = len(commands)
+    game = PokerGame(id=f'arena{seed}', small_blind=small_blind, big_blind=big_blind,
+                     blind_structure=geometric_structure(small_blind, big_blind, level_blind_multiplier,
+                                                         hands_per_level=max(1, hand_nb_by_level)))
+    with contextlib.redirect_stdout(_devnull_stream()):
+        for seat in range(n):
+            game.add_player(f'p{seat}', f'Bot{seat}', buy_in=buy_in)
+    bots = [BotProcess(cmd) for cmd in commands]
+    pending_actions: List[List[str]] = [[] for _ in range(n)]
+    pending_showdowns: List[List[str]] = [[] for _ in range(n)]
+    timeouts = [0] * n
+    invalid = [0] * n
+    first_turn = [True] * n
+    busted_at: List[Optional[int]] = [None] * n  # numéro de main de l'élimination
+    rounds = 0
+    # Main 1: bouton au siège 0, big blind au siège 2 (siège 0 en tête-à-tête)
+    first_big_blind_id = 2 % n
+    for seat, bot in enumerate(bots):
+        bot.send([str(v) for v in (small_blind, big_blind, hand_nb_by_level, level_blind_multiplier, buy_in,
+                                   first_big_blind_id, n, seat)])
+    try:
+        while rounds < max_rounds:
+            with contextlib.redirect_stdout(_devnull_stream()):
+                if not game.start_hand(seed=rng.getrandbits(64)):
+                    break
+            actions = 0
+            while game.phase != GamePhase.SHOWDOWN and rounds < max_rounds and actions < MAX_ACTIONS_PER_HAND:
+                seat = game.current_player
+                player = game.players[seat]
+                rounds += 1
+                lines = [str(rounds), str(game.hand_number)]
+                lines += [f'{p.stack} {p.total_bet}' for p in game.players]
+                lines.append(board_string(game))
+                lines.append('_'.join(str(c) for c in player.hand))
+                lines.append(str(len(pending_actions[seat])))
+                lines += pending_actions[seat]
+                lines.append(str(len(pending_showdowns[seat])))
+                lines += pending_showdowns[seat]
+                options = possible_actions(game, seat)
+                lines.append(str(len(options)))
+                lines += options
+                pending_actions[seat], pending_showdowns[seat] = [], []
+
+                reply, in_time = bots[seat].receive(first_timeout if first_turn[seat] else timeout) \
+                    if bots[seat].send(lines) else (None, False)
+                first_turn[seat] = False
+                if not in_time:
+                    timeouts[seat] += 1
+                action, amount = parse_reply(reply, game, seat)
+                if action is None:
+                    invalid[seat] += reply is not None
+                    action, amount = ('check', 0) if 'CHECK' in options else ('fold', 0)
+                board = board_string(game)
+                stack_before = player.stack
+                with contextlib.redirect_stdout(_devnull_stream()):
+                    error, _, _ = game.apply_action(player.id, action, amount)
+                    if error is not None:
+                        error, _, _ = game.apply_action(player.id, 'fold', 0)
+                if error is not None:
+                    break
+                line = f'{rounds} {game.hand_number} {seat} ' \
+                       f'{protocol_action(action, stack_before - player.stack, player.all_in)} {board}'
+                for queue in pending_actions:
+                    queue.append(line)
+                actions += 1
+
+            result = game.last_winner or {}
+            if result.get('reason') == 'showdown':
+                cards = []
+                for p in game.players:
+                    if p.hand and not p.folded:
+                        cards += [str(c) for c in p.hand]
+                    else:
+                        cards += ['E', 'E'] if p.stack == 0 and not p.hand else ['X', 'X']
+                line = f"{game.hand_number} {'_'.join(result.get('community', []))} {'_'.join(cards)}"
+                for queue in pending_showdowns:
+                    queue.append(line)
+            for seat, p in enumerate(game.players):
+                if p.stack == 0 and busted_at[seat] is None:
+                    busted_at[seat] = game.hand_number
+            if sum(1 for p in game.players if p.stack > 0) < 2 or actions >= MAX_ACTIONS_PER_HAND:
+                break
+    finally:
+        for bot in bots:
+            bot.close()
+
+    stacks = [p.stack for p in game.players]
+    # Classement: encore en jeu (par tapis), puis éliminés du plus tardif au plus précoce
+    order = sorted(range(n), key=lambda s: (busted_at[s] is None, busted_at[s] or 0, stacks[s]), reverse=True)
+    ranks = [0] * n
+    for rank, seat in enumerate(order):
+        ranks[seat] = rank
+    return {'stacks': stacks, 'ranks': ranks, 'hands': game.hand_number, 'rounds': rounds,
+            'timeouts': timeouts, 'invalid': invalid}
+
+
+_DEVNULL = None
+
+
+def _devnull_stream():
+    # Le moteur trace chaque main sur stdout: un seul descripteur /dev/null par processus
+    global _DEVNULL
+    if _DEVNULL is None:
+        _DEVNULL = open(os.devnull, 'w')
+    return _DEVNULL
+
+
+def _play_match_job(args: tuple) -> Tuple[List[int], Dict]:
+    match_id, labels_by_seat, commands, kwargs = args
+    return labels_by_seat, play_match(commands, seed=match_id, **kwargs)
+
+
+def wilson_interval(wins: int, total: int, z: float = 1.96) -> Tuple[float, float]:
+    """Intervalle de confiance de Wilson (95 % par défaut) d'une proportion."""
+    if total == 0:
+        return 0.0, 1.0
+    p = wins / total
+    denom = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denom
+    half = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def run_arena(bots: Sequence[Tuple[str, str]], players: int, matches: int, workers: int = 0,
+              seed: Optional[int] = None, **kwargs) -> Dict[str, Dict]:
+    """Jouer `matches` parties à `players` sièges (bots répartis en rotation) et agréger par bot."""
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    jobs = []
+    for m in range(matches):
+        seats = [(m + s) % len(bots) for s in range(players)]  # rotation des places
+        jobs.append((base_seed + m, [bots[i][0] for i in seats], [bots[i][1] for i in seats], kwargs))
+
+    stats: Dict[str, Dict] = {label: {'seats': 0, 'wins': 0, 'rank_sum': 0, 'timeouts': 0, 'invalid': 0}
+                              for label, _ in bots}
+
+    def collect(labels: List[str], result: Dict) -> None:
+        for seat, label in enumerate(labels):
+            s = stats[label]
+            s['seats'] += 1
+            s['wins'] += result['ranks'][seat] == 0
+            s['rank_sum'] += result['ranks'][seat]
+            s['timeouts'] += result['timeouts'][seat]
+            s['invalid'] += result['invalid'][seat]
+
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for labels, result in pool.map(_play_match_job, jobs):
+                collect(labels, result)
+    else:
+        for job in jobs:
+            collect(*_play_match_job(job))
+    for s in stats.values():
+        s['win_rate'] = s['wins'] / s['seats'] if s['seats'] else 0.0
+        s['ci95'] = wilson_interval(s['wins'], s['seats'])
+        s['mean_rank'] = s['rank_sum'] / s['seats'] if s['seats'] else 0.0
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bot', action='append', required=True,
+                        help="commande d'un bot, éventuellement nommée: nom=commande (répéter l'option)")
+    parser.add_argument('--players', type=int, default=2, help='joueurs par partie (2 à 4)')
+    parser.add_argument('--matches', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='0 ou 1 = séquentiel')
+    parser.add_argument('--max-rounds', type=int, default=600)
+    parser.add_argument('--buy-in', type=int, default=2000)
+    parser.add_argument('--small-blind', type=int, default=10)
+    parser.add_argument('--big-blind', type=int, default=20)
+    parser.add_argument('--hand-nb-by-level', type=int, default=10)
+    parser.add_argument('--level-blind-multiplier', type=int, default=2)
+    parser.add_argument('--timeout-ms', type=float, default=100, help='délai de réponse par tour (1 s au premier)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    if not 2 <= args.players <= 4:
+        parser.error('--players doit être entre 2 et 4')
+
+    bots = []
+    for i, spec in enumerate(args.bot):
+        label, sep, command = spec.partition('=')
+        if not sep or ' ' in label:
+            label, command = f'bot{i}', spec
+        bots.append((label, command))
+
+    tic = time.perf_counter()
+    stats = run_arena(bots, args.players, args.matches, workers=args.workers, seed=args.seed,
+                      max_rounds=args.max_rounds, buy_in=args.buy_in, small_blind=args.small_blind,
+                      big_blind=args.big_blind, hand_nb_by_level=args.hand_nb_by_level,
+                      level_blind_multiplier=args.level_blind_multiplier, timeout=args.timeout_ms / 1000)
+    elapsed = time.perf_counter() - tic
+    print(f"✅ {args.matches} parties à {args.players} joueurs en {elapsed:.1f}s")
+    for label, s in sorted(stats.items(), key=lambda kv: -kv[1]['win_rate']):
+        low, high = s['ci95']
+        print(f"  {label}: {s['win_rate']:.1%} de victoires [IC95 {low:.1%} – {high:.1%}] sur {s['seats']} places, "
+              f"rang moyen {s['mean_rank'] + 1:.2f}, {s['timeouts']} dépassement(s), {s['invalid']} réponse(s) invalide(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
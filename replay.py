@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Rejeu déterministe des mains enregistrées dans l'historique (hand_history.py).
+
+Chaque main est reconstruite à partir de sa graine (même deck), des sièges et tapis au départ,
+puis la séquence d'actions enregistrée est rejouée dans le moteur `PokerGame` actuel. Le résultat
+(cartes, board, actions, gagnants, tapis finaux) est comparé à celui qui a été enregistré.
+
+Exemples:
+  # Rejouer une main contestée et afficher son déroulé
+  python replay.py hand_history/hands-20261019.phh --game 1a2b3c4d --hand 12
+  # Vérifier tout un dossier d'historique sur plusieurs processus
+  python replay.py hand_history --workers 4
+"""
+import argparse
+import contextlib
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.devnull, 'w') as _devnull, contextlib.redirect_stdout(_devnull):
+    # app.py affiche sa configuration à l'import: inutile ici
+    from app import PokerGame, PokerPlayer, GamePhase  # type: ignore
+from hand_history import iter_hands
+
+# Actions postées automatiquement par start_hand(): non rejouées mais comparées
+_AUTO_ACTIONS = ('ante', 'sb', 'bb')
+
+
+def rebuild_game(record: Dict[str, Any]) -> PokerGame:
+    """Reconstruire la table telle qu'au début de la main (avant start_hand)."""
+    game = PokerGame(id=record['game_id'], small_blind=record['small_blind'], big_blind=record['big_blind'],
+                     ante=record.get('ante', 0))
+    for seat in record['seats']:
+        game.players.append(PokerPlayer(
+            id=seat['player_id'],
+            name=seat['name'],
+            stack=seat['stack'],
+            connected=seat['connected'],
+            eligible_from_hand=seat['eligible_from_hand'],
+        ))
+    game.hand_number = record['hand_number'] - 1
+    # start_hand() fait tourner le bouton à partir de la deuxième main: se placer un siège avant
+    n = len(game.players)
+    game.dealer_pos = (record['dealer_pos'] - 1) % n if game.hand_number >= 1 and n else record['dealer_pos']
+    return game
+
+
+def replay_hand(record: Dict[str, Any], trace: Optional[List[str]] = None) -> Tuple[PokerGame, List[str]]:
+    """Rejouer une main. Retourne (table finale, liste des écarts avec l'enregistrement; vide si identique)."""
+    if record.get('seed') is None:
+        return PokerGame(id=record['game_id']), ["graine absente: main non rejouable"]
+    game = rebuild_game(record)
+    if not game.start_hand(seed=record['seed']):
+        return game, ["start_hand() a refusé de démarrer la main"]
+
+    mismatches: List[str] = []
+    for seat_no, (player, seat) in enumerate(zip(game.players, record['seats'])):
+        dealt = [str(c) for c in player.hand]
+        if dealt != seat['cards']:
+            mismatches.append(f"siège {seat_no}: cartes {dealt} != {seat['cards']}")
+
+    for seat_no, action, amount, phase in record['actions']:
+        if action in _AUTO_ACTIONS:
+            continue
+        player_id = record['seats'][seat_no]['player_id'] if seat_no < len(record['seats']) else None
+        if trace is not None:
+            trace.append(f"[{phase}] {record['seats'][seat_no]['name'] if player_id else seat_no}: {action} {amount or ''}")
+        error, _, _ = game.apply_action(player_id, action, amount)
+        if error:
+            mismatches.append(f"action refusée ({seat_no}, {action}, {amount}, {phase}): {error}")
+            return game, mismatches
+
+    replayed = game.hand_record()
+    for key in ('actions', 'board', 'pot', 'reason', 'winners'):
+        if replayed[key] != record[key]:
+            mismatches.append(f"{key}: {replayed[key]} != {record[key]}")
+    finals = [s['final_stack'] for s in replayed['seats']]
+    expected = [s['final_stack'] for s in record['seats']]
+    if finals != expected:
+        mismatches.append(f"tapis finaux: {finals} != {expected}")
+    if game.phase != GamePhase.SHOWDOWN:
+        mismatches.append(f"main non terminée après rejeu (phase {game.phase.value})")
+    return game, mismatches
+
+
+def _replay_batch(records: List[Dict[str, Any]]) -> List[Tuple[str, int, List[str]]]:
+    out = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for record in records:
+            _, mismatches = replay_hand(record)
+            out.append((record['game_id'], record['hand_number'], mismatches))
+    return out
+
+
+def _batches(hands: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for hand in hands:
+        batch.append(hand)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def replay_file(path: str, workers: int = 0, batch_size: int = 256) -> Iterator[Tuple[str, int, List[str]]]:
+    """Rejouer toutes les mains d'un fichier (ou dossier) et produire (game_id, hand_number, écarts).
+
+    Le fichier est lu en flux; au plus `workers * 2` lots sont en vol à la fois dans le pool.
+    """
+    batches = _batches(iter_hands(path), batch_size)
+    if not workers or workers <= 1:
+        for batch in batches:
+            yield from _replay_batch(batch)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for batch in batches:
+            pending.append(pool.submit(_replay_batch, batch))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rejeu déterministe de l'historique des mains")
+    parser.add_argument('path', help="fichier hands-AAAAMMJJ.phh ou dossier d'historique")
+    parser.add_argument('--game', help='id de la partie à rejouer (mode main unique)')
+    parser.add_argument('--hand', type=int, help='numéro de la main à rejouer (mode main unique)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='0 ou 1 = séquentiel')
+    args = parser.parse_args()
+
+    if args.game or args.hand is not None:
+        for record in iter_hands(args.path):
+            if (args.game is None or record['game_id'] == args.game) and \
+                    (args.hand is None or record['hand_number'] == args.hand):
+                trace: List[str] = []
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    game, mismatches = replay_hand(record, trace)
+                print(f"🃏 Partie {record['game_id']} — main {record['hand_number']} (graine {record.get('seed')})")
+                for seat in record['seats']:
+                    print(f"  {seat['name']}: {' '.join(seat['cards']) or '-'} (tapis {seat['stack']} -> {seat['final_stack']})")
+                for line in trace:
+                    print(f"  {line}")
+                print(f"  Board: {' '.join(record['board'])} — pot {record['pot']} ({record['reason']})")
+                if mismatches:
+                    for m in mismatches:
+                        print(f"❌ {m}")
+                    return 1
+                print("✅ Rejeu identique à l'enregistrement")
+                return 0
+        print("❌ Main introuvable dans l'historique")
+        return 2
+
+    total = 0
+    failed = 0
+    for game_id, hand_number, mismatches in replay_file(args.path, workers=args.workers):
+        total += 1
+        if mismatches:
+            failed += 1
+            print(f"❌ {game_id} main {hand_number}: {'; '.join(mismatches)}")
+    print(f"{'✅' if not failed else '❌'} {total - failed}/{total} mains reproduites à l'identique")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
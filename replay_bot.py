@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Rejeu hors ligne de transcripts de l'arbitre CodinGame dans le bot (poker.py).
+
+Un transcript contient les lignes reçues par le bot sur l'entrée standard (comme input.txt, sur un ou
+plusieurs tours). Chaque tour est rejoué dans `poker.Bot`: la décision est comparée à celle enregistrée
+(fichier `<transcript>.expected`, une action par ligne, sans le message de chat) et la latence de
+décision est mesurée contre le budget de 49 ms par tour (p50 / p99 / max).
+
+Exemples:
+  # Vérifier les décisions et les latences de tous les transcripts d'un dossier
+  python replay_bot.py bot_transcripts
+  # Enregistrer les décisions actuelles comme référence
+  python replay_bot.py bot_transcripts/synthetic_3p.txt --record
+  # Avec le calcul d'équité contre les ranges (diagnostic, désactivé par défaut dans le bot)
+  python replay_bot.py input.txt --equity
+"""
+import argparse
+import contextlib
+import os
+import sys
+from time import perf_counter
+from typing import Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from poker import Bot, ProtocolReader  # type: ignore
+
+BUDGET_MS = 49
+
+
+def replay_transcript(path: str, use_equity: bool = False) -> Tuple[List[str], List[float]]:
+    """Rejouer un transcript: (décisions complètes 'ACTION;message', latences par tour en ms)."""
+    decisions: List[str] = []
+    latencies: List[float] = []
+    with open(path) as f, open(os.devnull, 'w') as devnull, contextlib.redirect_stderr(devnull):
+        reader = ProtocolReader(f)
+        bot = Bot(*reader.header(), use_equity=use_equity)
+        while True:
+            try:
+                _round = reader.int()
+            except EOFError:
+                break
+            tic = perf_counter()
+            decisions.append(bot.play(reader.turn(_round, bot.player_nb), tic))
+            latencies.append((perf_counter() - tic) * 1000)
+    return decisions, latencies
+
+
+def action_of(decision: str) -> str:
+    """Partie comparée d'une décision: l'action sans le message de chat ('BET 240;...' -> 'BET 240')."""
+    return decision.split(';', 1)[0].strip()
+
+
+def compare(decisions: List[str], expected: List[str]) -> List[str]:
+    """Écarts entre décisions rejouées et attendues (liste vide si aucune régression)."""
+    diffs = [f"tour {i + 1}: attendu {e!r}, obtenu {action_of(d)!r}"
+             for i, (d, e) in enumerate(zip(decisions, expected)) if action_of(d) != e]
+    if len(decisions) != len(expected):
+        diffs.append(f"{len(expected)} décisions attendues, {len(decisions)} obtenues")
+    return diffs
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def iter_transcripts(paths: List[str]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith('.txt'):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def load_expected(path: str) -> Optional[List[str]]:
+    try:
+        with open(path + '.expected') as f:
+            return [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='transcripts (.txt) ou dossiers de transcripts')
+    parser.add_argument('--record', action='store_true', help='écrire les décisions actuelles dans <transcript>.expected')
+    parser.add_argument('--equity', action='store_true', help="activer le calcul d'équité (ranges.py)")
+    parser.add_argument('--budget', type=float, default=BUDGET_MS, help='budget par tour (ms)')
+    args = parser.parse_args()
+
+    regressions = 0
+    all_latencies: List[float] = []
+    for path in iter_transcripts(args.paths):
+        decisions, latencies = replay_transcript(path, use_equity=args.equity)
+        all_latencies += latencies
+        if args.record:
+            with open(path + '.expected', 'w') as f:
+                f.write(''.join(action_of(d) + '\n' for d in decisions))
+            status = 'enregistré'
+        else:
+            expected = load_expected(path)
+            if expected is None:
+                status = 'pas de référence'
+            else:
+                diffs = compare(decisions, expected)
+                regressions += len(diffs)
+                status = 'OK' if not diffs else f'{len(diffs)} écart(s)'
+                for diff in diffs[:10]:
+                    print(f"  ❌ {diff}")
+        print(f"{path}: {len(decisions)} tours, p50={percentile(latencies, 0.5):.2f} ms "
+              f"p99={percentile(latencies, 0.99):.2f} ms max={max(latencies, default=0):.2f} ms — {status}")
+
+    over = sum(1 for t in all_latencies if t > args.budget)
+    p99 = percentile(all_latencies, 0.99)
+    print(f"\nTotal: {len(all_latencies)} tours, p50={percentile(all_latencies, 0.5):.2f} ms p99={p99:.2f} ms "
+          f"max={max(all_latencies, default=0):.2f} ms, {over} tour(s) au-delà de {args.budget:g} ms")
+    if regressions or p99 > args.budget:
+        print(f"❌ {regressions} régression(s) de décision" + (f", p99 au-delà du budget" if p99 > args.budget else ''))
+        return 1
+    print("✅ Décisions et latences conformes")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
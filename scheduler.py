@@ -0,0 +1,98 @@
+"""
+Ordonnanceur de minuteurs unique pour le serveur (délais de parole, main suivante, ...).
+
+Un seul tas d'échéances, parcouru par une seule tâche de fond, au lieu d'une tâche endormie par
+minuteur. Chaque minuteur est identifié par une clé (ex: ('action', game_id)): reprogrammer une clé
+remplace l'échéance précédente.
+
+- schedule: O(log n) (insertion dans le tas)
+- cancel: O(1) (suppression paresseuse: l'entrée périmée est ignorée quand elle remonte du tas)
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TimerScheduler:
+    def __init__(self, sleep: Callable[[float], Any] = time.sleep, clock: Callable[[], float] = time.monotonic,
+                 resolution: float = 0.25):
+        """`sleep` doit être coopératif sous eventlet/gevent (ex: socketio.sleep).
+
+        `resolution` borne la durée d'un sommeil: un minuteur ajouté pendant que la tâche dort est
+        pris en compte au plus tard après ce délai.
+        """
+        self._sleep = sleep
+        self._clock = clock
+        self.resolution = resolution
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._timers: Dict[Hashable, Tuple[float, int, Callable, tuple]] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._running = False
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable, *args) -> None:
+        """Programmer `callback(*args)` dans `delay` secondes (remplace le minuteur de même clé)."""
+        deadline = self._clock() + max(0.0, delay)
+        seq = next(self._seq)
+        with self._lock:
+            self._timers[key] = (deadline, seq, callback, args)
+            heapq.heappush(self._heap, (deadline, seq, key))
+            # Compacter si les entrées annulées/remplacées dominent le tas
+            if len(self._heap) > 64 and len(self._heap) > 4 * len(self._timers):
+                self._heap = [(d, s, k) for k, (d, s, _, _) in self._timers.items()]
+                heapq.heapify(self._heap)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Annuler le minuteur de clé `key`. Retourne True s'il était programmé."""
+        with self._lock:
+            return self._timers.pop(key, None) is not None
+
+    def pending(self, key: Hashable) -> Optional[float]:
+        """Secondes restantes avant l'échéance du minuteur `key` (None s'il n'est pas programmé)."""
+        timer = self._timers.get(key)
+        return None if timer is None else max(0.0, timer[0] - self._clock())
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def run_due(self) -> int:
+        """Exécuter les minuteurs échus. Retourne le nombre de callbacks exécutés."""
+        now = self._clock()
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, key = heapq.heappop(self._heap)
+                timer = self._timers.get(key)
+                if timer is None or timer[1] != seq:
+                    continue  # annulé ou reprogrammé depuis
+                del self._timers[key]
+                due.append(timer)
+        for _, _, callback, args in due:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"[SCHEDULER] erreur dans {getattr(callback, '__name__', callback)}: {e}")
+        return len(due)
+
+    def next_delay(self) -> float:
+        """Durée de sommeil jusqu'à la prochaine échéance, bornée par `resolution`."""
+        with self._lock:
+            while self._heap:
+                deadline, seq, key = self._heap[0]
+                timer = self._timers.get(key)
+                if timer is not None and timer[1] == seq:
+                    return min(self.resolution, max(0.0, deadline - self._clock()))
+                heapq.heappop(self._heap)
+        return self.resolution
+
+    def run_forever(self) -> None:
+        """Boucle de la tâche de fond unique."""
+        self._running = True
+        while self._running:
+            self.run_due()
+            self._sleep(self.next_delay())
+
+    def stop(self) -> None:
+        self._running = False
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Mesurer la part de la lecture des entrées dans le budget de 49 ms par tour du bot CodinGame (poker.py).
+
+Un transcript au format de l'arbitre (comme input.txt, mais sur plusieurs tours) est généré puis:
+- rejoué par poker.py (sous-processus): temps de lecture par tour relevé dans sa trace ('parse: x ms');
+- relu par l'ancienne méthode (input() + split + card_values.index + recherche dans le deck), pour comparaison.
+
+Exemple:
+  python scripts/bench_bot_parser.py --turns 200 --players 4
+  python scripts/bench_bot_parser.py --transcript input.txt
+"""
+import argparse
+import io
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUITS = ['D', 'H', 'S', 'C']
+VALUES = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
+LABELS = [v + s for s in SUITS for v in VALUES]
+
+
+def make_transcript(turns: int, players: int, seed: int) -> str:
+    """Transcript synthétique: en-tête + `turns` tours avec actions et abattages."""
+    rng = random.Random(seed)
+    lines = ['10', '20', '10', '2', '2000', '0', str(players), '0']
+    for r in range(1, turns + 1):
+        hand_nb = 1 + r // 4
+        cards = rng.sample(LABELS, 5 + 2 * players)
+        shown = rng.choice((0, 3, 4, 5))
+        board = '_'.join(cards[:shown] + ['X'] * (5 - shown))
+        lines += [str(r), str(hand_nb)]
+        lines += [f'{rng.randrange(0, 2000)} {rng.randrange(0, 200)}' for _ in range(players)]
+        lines += [board, '_'.join(cards[5:7])]
+        actions = rng.randrange(0, players + 2)
+        lines.append(str(actions))
+        for _ in range(actions):
+            action = rng.choice(('CALL', 'CHECK', 'FOLD', 'ALL-IN', f'BET_{rng.randrange(20, 400)}'))
+            lines.append(f'{r} {hand_nb} {rng.randrange(players)} {action} {board}')
+        showdowns = 1 if r % 4 == 0 else 0
+        lines.append(str(showdowns))
+        for _ in range(showdowns):
+            lines.append(f"{hand_nb - 1} {'_'.join(cards[:5])} {'_'.join(cards[5:5 + 2 * players])}")
+        lines += ['4', 'ALL-IN', 'BET_40', 'CALL', 'FOLD']
+    return '\n'.join(lines) + '\n'
+
+
+def legacy_parse(text: str) -> list:
+    """Ancienne lecture de poker.py (input(), index dans card_values, recherche dans le deck), par tour (ms)."""
+    class Card:
+        def __init__(self, value, suit):
+            self.value, self.suit = value, suit
+
+        def __eq__(self, other):
+            return self.suit == other.suit and self.value == other.value
+
+    deck = {13 * i + j: Card(j + 2, s) for i, s in enumerate(SUITS) for j in range(13)}
+    conv = lambda v: (VALUES.index(v[0]) + 2, v[1])  # noqa: E731
+    stdin, sys.stdin = sys.stdin, io.StringIO(text)
+    timings = []
+    try:
+        player_nb = [int(input()) for _ in range(8)][6]
+        while True:
+            try:
+                int(input())
+            except EOFError:
+                break
+            tic = time.perf_counter()
+            int(input())
+            for _ in range(player_nb):
+                [int(j) for j in input().split()]
+            board_cards, player_cards = input(), input()
+            for _ in range(int(input())):
+                inputs = input().split()
+                int(inputs[0]), int(inputs[1]), int(inputs[2])
+            for _ in range(int(input())):
+                inputs = input().split()
+                int(inputs[0])
+            [input() for _ in range(int(input()))]
+            board = [Card(*conv(v)) for v in board_cards.split('_') if v != 'X']
+            [i for i, c in deck.items() if c in board]
+            hand = [Card(*conv(v)) for v in player_cards.split('_') if v != 'X']
+            [i for i, c in deck.items() if c in hand]
+            timings.append((time.perf_counter() - tic) * 1000)
+    finally:
+        sys.stdin = stdin
+    return timings
+
+
+def bot_parse(text: str) -> list:
+    """Rejouer le transcript dans poker.py et relever ses temps de lecture par tour (ms)."""
+    proc = subprocess.run([sys.executable, os.path.join(ROOT, 'poker.py')], input=text, capture_output=True,
+                          text=True, cwd=ROOT)
+    timings = [float(m) for m in re.findall(r'parse: ([0-9.]+) ms', proc.stderr)]
+    if not timings:
+        raise SystemExit(f"poker.py n'a produit aucune mesure:\n{proc.stderr[-2000:]}")
+    return timings
+
+
+def report(name: str, timings: list) -> None:
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(0.99 * len(timings)))]
+    print(f"{name:<28} tours={len(timings):<5} p50={statistics.median(timings) * 1000:8.1f}µs "
+          f"p99={p99 * 1000:8.1f}µs max={timings[-1] * 1000:8.1f}µs  ({100 * timings[-1] / 49:.3f}% du budget)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--turns', type=int, default=200)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--transcript', help='transcript existant (ex: input.txt) au lieu du transcript généré')
+    args = parser.parse_args()
+
+    if args.transcript:
+        with open(args.transcript) as f:
+            text = f.read()
+    else:
+        text = make_transcript(args.turns, args.players, args.seed)
+    report('ancienne lecture (input())', legacy_parse(text))
+    report('poker.py (ProtocolReader)', bot_parse(text))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Mesure mémoire des tables du moteur (app.PokerGame) avec tracemalloc.
+
+Construit N tables de P joueurs et rapporte les octets alloués par table:
+- table inactive: joueurs assis, aucune main en cours (phase waiting)
+- table active: une main démarrée (blindes postées, cartes distribuées)
+
+Exemples:
+  python scripts/bench_memory.py
+  python scripts/bench_memory.py --tables 5000 --players 6
+  # Comparer avec une autre version du moteur (ex: worktree git d'un ancien commit)
+  python scripts/bench_memory.py --app-dir /tmp/poker-old
+"""
+import argparse
+import contextlib
+import gc
+import os
+import sys
+import tracemalloc
+
+
+def _load_app(app_dir: str):
+    sys.path.insert(0, app_dir)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        import app  # type: ignore
+    return app
+
+
+def _build_tables(app, n_tables: int, n_players: int, active: bool) -> list:
+    tables = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for t in range(n_tables):
+            game = app.PokerGame(id=f'bench{t:06d}')
+            for s in range(n_players):
+                game.add_player(f'p{t:06d}{s}', f'Player{s}', 1000)
+            if active:
+                game.start_hand()
+            tables.append(game)
+    return tables
+
+
+def bytes_per_table(app, n_tables: int, n_players: int, active: bool) -> float:
+    # Un premier passage pour amortir les allocations paresseuses (caches, interning, imports)
+    _build_tables(app, 10, n_players, active)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tables = _build_tables(app, n_tables, n_players, active)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(tables) == n_tables
+    return (after - before) / n_tables
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Octets par table inactive / active')
+    parser.add_argument('--tables', type=int, default=2000)
+    parser.add_argument('--players', type=int, default=6)
+    parser.add_argument('--app-dir', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help='dossier contenant app.py (défaut: ce dépôt)')
+    args = parser.parse_args()
+
+    app = _load_app(args.app_dir)
+    idle = bytes_per_table(app, args.tables, args.players, active=False)
+    active = bytes_per_table(app, args.tables, args.players, active=True)
+    print(f"📏 {args.tables} tables de {args.players} joueurs ({args.app_dir})")
+    print(f"  table inactive: {idle:,.0f} octets")
+    print(f"  table active:   {active:,.0f} octets")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
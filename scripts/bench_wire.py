@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Comparer la taille et le temps d'encodage des événements Socket.IO: JSON vs MessagePack compact (wire.py).
+
+Les payloads sont capturés sur des tables réalistes de 6 joueurs (ids UUID, vrais noms) jouées par le
+simulateur: un `game_update` après chaque action, un `hand_result` par main, et des `open_games`
+pour un lobby de 50 tables.
+
+Mesure aussi la synchronisation par siège: N sérialisations complètes `to_dict(player_id)` contre
+une sérialisation publique `to_dict()` + N petits compléments privés (`private_overlay`, cf. app._fan_out_state).
+
+Exemple:
+  python scripts/bench_wire.py --hands 300
+"""
+import argparse
+import contextlib
+import copy
+import json
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with open(os.devnull, 'w') as _devnull, contextlib.redirect_stdout(_devnull):
+    import tournament_sim as ts  # type: ignore
+    from app import PokerGame, GamePhase  # type: ignore
+import wire  # type: ignore
+
+NAMES = ['Alice', 'Bertrand', 'Camille', 'Dominique', 'Élodie', 'François']
+# Socket.IO envoie une pièce jointe binaire avec un paquet texte de remplacement
+BINARY_OVERHEAD = len('451-["game_update",{"_placeholder":true,"num":0}]')
+
+
+def capture(hands: int, seed: int) -> dict:
+    """Jouer des mains à 6 et retourner les payloads émis par le serveur, par événement."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    strategies = [ts.heuristic_strategy, ts.passive, ts.random_strategy] * 2
+    payloads = {'game_update': [], 'hand_result': [], 'open_games': []}
+    game = None
+    tables = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(hands):
+            if game is None or sum(1 for p in game.players if p.stack > 0) < 2:
+                game = PokerGame(id=str(uuid.UUID(int=rng.getrandbits(128)))[:8])
+                for name in NAMES:
+                    game.add_player(str(uuid.UUID(int=rng.getrandbits(128))), name)
+            game.start_hand(seed=rng.getrandbits(64))
+            if len(tables) < 50:
+                tables.append(copy.deepcopy(game))
+            payloads['game_update'].append(game.to_dict())
+            for _ in range(ts.MAX_ACTIONS_PER_HAND):
+                if game.phase == GamePhase.SHOWDOWN:
+                    break
+                seat = game.current_player
+                for action, amount in [strategies[seat](game, seat)] + ts._fallback_action(game, seat):
+                    if game.apply_action(game.players[seat].id, action, amount)[0] is None:
+                        break
+                payloads['game_update'].append(game.to_dict())
+            if game.last_winner:
+                payloads['hand_result'].append(game.last_winner)
+    lobby = [{'id': f'{i:08x}', 'players': 1 + i % 6, 'connected': i % 6, 'phase': 'preflop',
+              'host': NAMES[i % 6], 'can_join': i % 6 != 5} for i in range(50)]
+    payloads['open_games'] = [{'games': lobby}] * 20
+    payloads['tables'] = tables
+    return payloads
+
+
+def _time_per_call(fn, items, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / (repeat * len(items))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Taille / temps d\'encodage JSON vs MessagePack compact')
+    parser.add_argument('--hands', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = capture(args.hands, args.seed)
+    tables = payloads.pop('tables')
+    to_json = lambda p: json.dumps(p, separators=(',', ':')).encode('utf-8')  # comme python-socketio
+    print(f"📦 MessagePack: {'extension msgpack' if wire.msgpack is not None else 'encodeur pur Python'}")
+    print(f"{'événement':<12} {'n':>6} {'JSON o':>8} {'msgpack o':>10} {'gain':>6} {'JSON µs':>8} {'msgpack µs':>11}")
+    for event, items in payloads.items():
+        if not items:
+            continue
+        json_bytes = sum(len(to_json(p)) for p in items) / len(items)
+        bin_bytes = sum(len(wire.encode(p)) + BINARY_OVERHEAD for p in items) / len(items)
+        assert all(wire.unpackb(wire.encode(p)) == json.loads(to_json(wire.compact(p))) for p in items[:50])
+        t_json = _time_per_call(to_json, items, args.repeat) * 1e6
+        t_bin = _time_per_call(wire.encode, items, args.repeat) * 1e6
+        print(f"{event:<12} {len(items):>6} {json_bytes:>8.0f} {bin_bytes:>10.0f} {1 - bin_bytes / json_bytes:>6.0%} "
+              f"{t_json:>8.1f} {t_bin:>11.1f}")
+    print(f"(msgpack inclut les {BINARY_OVERHEAD} octets du paquet Socket.IO de remplacement)")
+
+    def per_seat(game):
+        return sum(len(to_json(game.to_dict(p.id))) for p in game.players)
+
+    def fan_out(game):
+        return len(to_json(game.to_dict())) + sum(len(to_json(o)) for o in map(game.private_overlay, (p.id for p in game.players)) if o)
+
+    for label, fn in (('N états complets', per_seat), ('public + overlays', fan_out)):
+        size = sum(fn(g) for g in tables) / len(tables)
+        t = _time_per_call(fn, tables, args.repeat * 10) * 1e6
+        print(f"sync 6 sièges, {label:<18}: {size:>6.0f} octets, {t:>6.1f} µs")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Construire la table d'équités préflop (main contre N adversaires aléatoires) sur les 169 classes de
+mains de départ (canonical.py) au lieu des 1326 combinaisons: ~7.8x moins de calcul pour le même résultat.
+
+Sortie: JSON {'opponents': N, 'samples': S, 'equity': {'AA': 0.85, 'AKs': ..., ...}, 'combos': {'AA': 6, ...}}
+
+Exemple:
+  python scripts/build_preflop_table.py --opponents 1 --samples 4000 --out preflop_equity.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from canonical import preflop_classes  # type: ignore
+from equity import equity_vs_random  # type: ignore
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--opponents', type=int, default=1)
+    parser.add_argument('--samples', type=int, default=4000, help='tirages Monte-Carlo par classe')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--out', default='preflop_equity.json')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    classes = preflop_classes()
+    start = time.perf_counter()
+    table = {name: round(equity_vs_random(hole, opponents=args.opponents, samples=args.samples, rng=rng), 4)
+             for name, (hole, _) in classes.items()}
+    elapsed = time.perf_counter() - start
+    combos = {name: mult for name, (_, mult) in classes.items()}
+
+    with open(args.out, 'w') as f:
+        json.dump({'opponents': args.opponents, 'samples': args.samples, 'equity': table, 'combos': combos}, f,
+                  indent=1, sort_keys=True)
+    total = sum(combos.values())
+    print(f"{len(table)} classes ({total} combinaisons) en {elapsed:.1f}s "
+          f"(~{elapsed * total / len(table):.0f}s sans isomorphisme) -> {args.out}")
+    best = sorted(table, key=table.get, reverse=True)
+    print("Meilleures:", ', '.join(f"{n} {table[n]:.3f}" for n in best[:5]))
+    print("Pires:", ', '.join(f"{n} {table[n]:.3f}" for n in best[-5:]))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
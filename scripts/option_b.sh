@@ -19,6 +19,8 @@ else
   npm install
 fi
 npm run build
+info "Précompression du build (.gz, .br si brotli est installé)…"
+python3 "$BASE_DIR/static_assets.py" "$FRONT_DIR/build"
 
 # 2) Démarrage backend Flask (utilise le build si présent)
 cd "$BASE_DIR"
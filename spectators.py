@@ -0,0 +1,67 @@
+"""
+Canal des spectateurs d'une table: dernier état public (PokerGame.to_dict) mis en cache et deltas.
+
+Le serveur (app.py) calcule l'état public une seule fois par mise à jour de la table (pour la room des
+joueurs) et le dépose ici. Les spectateurs (room séparée, sans siège) reçoivent:
+- à l'abonnement, le dernier état diffusé (`subscribe()`), sans nouvel appel à to_dict;
+- ensuite, au plus un delta par intervalle et par table (`delta()`), identique pour tous les spectateurs:
+  clés de premier niveau modifiées (`changes`) et sièges modifiés (`seats`, indice -> joueur).
+Chaque delta porte la version de l'état de départ (`base`): un client dont la version ne correspond
+pas redemande l'état complet.
+"""
+from typing import Any, Dict, Optional
+
+
+class SpectatorChannel:
+    __slots__ = ('snapshot', 'version', 'sent', 'sent_version', 'watchers')
+
+    def __init__(self):
+        self.snapshot: Optional[Dict[str, Any]] = None   # dernier état public de la table
+        self.version = 0
+        self.sent: Optional[Dict[str, Any]] = None       # dernier état diffusé aux spectateurs
+        self.sent_version = 0
+        self.watchers = 0
+
+    def update(self, state: Dict[str, Any]) -> None:
+        """Nouvel état public (déjà calculé pour les joueurs; non copié, ne pas le modifier ensuite)."""
+        self.snapshot = state
+        self.version += 1
+
+    @property
+    def pending(self) -> bool:
+        return self.snapshot is not None and self.version != self.sent_version
+
+    def subscribe(self) -> Dict[str, Any]:
+        """État complet pour un nouveau spectateur: le dernier diffusé, base des deltas suivants."""
+        if self.sent is None:
+            self.sent, self.sent_version = self.snapshot, self.version
+        return {'version': self.sent_version, 'state': self.sent}
+
+    def delta(self) -> Optional[Dict[str, Any]]:
+        """Différences entre le dernier état diffusé et l'état courant (None si rien de nouveau)."""
+        if not self.pending:
+            return None
+        new, old = self.snapshot, self.sent or {}
+        changes = {k: v for k, v in new.items() if k != 'players' and old.get(k) != v}
+        delta: Dict[str, Any] = {'version': self.version, 'base': self.sent_version, 'changes': changes}
+        players, old_players = new.get('players', []), old.get('players')
+        if old_players is None or len(players) != len(old_players):
+            changes['players'] = players
+        else:
+            seats = {str(i): p for i, (p, q) in enumerate(zip(players, old_players)) if p != q}
+            if seats:
+                delta['seats'] = seats
+        self.sent, self.sent_version = new, self.version
+        return delta
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Appliquer un delta à un état (côté client; utilisé par les tests). Retourne le nouvel état."""
+    result = dict(state, **delta.get('changes', {}))
+    seats = delta.get('seats')
+    if seats:
+        players = list(result.get('players', []))
+        for index, player in seats.items():
+            players[int(index)] = player
+        result['players'] = players
+    return result
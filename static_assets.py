@@ -0,0 +1,194 @@
+"""
+Index des fichiers du build React (frontend/build) servis par Flask (Option B).
+
+Le répertoire est parcouru une seule fois (au démarrage, puis seulement s'il a changé): chaque requête
+se résume à une recherche dans un dictionnaire, sans `os.path.exists` ni `os.stat` par requête.
+Pour chaque fichier, l'index garde taille, date, ETag, type MIME et ses variantes précompressées
+(`fichier.br`, `fichier.gz`, ignorées si plus anciennes que l'original), choisies selon `Accept-Encoding`.
+Les fichiers à nom haché (`main.3f2a1b4c.js`, `logo.6ce24c58….svg`) ne changent jamais de contenu:
+ils peuvent être mis en cache un an (`immutable`); les autres (index.html, manifest.json) sont revalidés.
+
+Détection des changements: au plus toutes les `rescan_seconds` secondes, `os.stat` des répertoires du build
+(fichier ajouté, supprimé ou renommé, y compris dans un sous-répertoire) et des fichiers indexés et de leurs
+variantes (taille et date: fichier modifié sur place). Tout changement provoque un nouveau parcours.
+
+Précompression (à lancer après `npm run build`, cf. scripts/option_b.sh):
+  python static_assets.py frontend/build
+écrit `.gz` (et `.br` si le paquet optionnel `brotli` est installé) à côté des fichiers texte.
+"""
+import gzip
+import mimetypes
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli  # type: ignore
+except Exception:  # dépendance optionnelle
+    brotli = None
+
+# Variantes précompressées: extension du fichier -> Content-Encoding (ordre de préférence)
+ENCODINGS = (('.br', 'br'), ('.gz', 'gzip'))
+COMPRESSIBLE = frozenset(('.html', '.js', '.css', '.json', '.map', '.svg', '.txt', '.ico', '.webmanifest'))
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+_HASHED = re.compile(r'\.[0-9a-f]{8,}\.')
+
+
+@dataclass(slots=True)
+class Asset:
+    path: str
+    size: int
+    last_modified: datetime
+    etag: str
+    mimetype: str
+    immutable: bool
+    # Content-Encoding -> (chemin, taille) des variantes précompressées
+    variants: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+    # (taille, date en ns) du fichier puis de ses variantes possibles, au moment de l'indexation
+    stamp: Tuple[Optional[Tuple[int, int]], ...] = ()
+
+    def select(self, accept_encodings) -> Tuple[Optional[str], str, int, str]:
+        """Variante à servir selon `Accept-Encoding`: (encodage ou None, chemin, taille, ETag)."""
+        for _, encoding in ENCODINGS:
+            variant = self.variants.get(encoding)
+            if variant is not None and accept_encodings.quality(encoding) > 0:
+                return encoding, variant[0], variant[1], f'{self.etag}-{encoding}'
+        return None, self.path, self.size, self.etag
+
+
+class AssetIndex:
+    def __init__(self, root: str, rescan_seconds: float = 2.0):
+        self.root = root
+        self.rescan_seconds = rescan_seconds
+        self.assets: Dict[str, Asset] = {}
+        self._signature = None
+        self._dirs: List[str] = []
+        self._checked_at = 0.0
+        self.scan()
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def get(self, relpath: str) -> Optional[Asset]:
+        """Fichier `relpath` (séparateurs '/', relatif au build), ou None s'il n'existe pas."""
+        if self.rescan_seconds > 0 and time.monotonic() - self._checked_at >= self.rescan_seconds:
+            self.refresh()
+        return self.assets.get(relpath)
+
+    def refresh(self) -> bool:
+        """Reparcourir le build s'il a changé depuis le dernier parcours. Retourne True si réindexé."""
+        self._checked_at = time.monotonic()
+        if self._stat_dirs() == self._signature and all(_stamp(a) == a.stamp for a in self.assets.values()):
+            return False
+        self.scan()
+        return True
+
+    def scan(self) -> None:
+        self._checked_at = time.monotonic()
+        self._dirs = []
+        assets: Dict[str, Asset] = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            self._dirs.append(dirpath)
+            names = set(filenames)
+            for name in filenames:
+                if any(name.endswith(ext) and name[:-len(ext)] in names for ext, _ in ENCODINGS):
+                    continue  # variante d'un fichier indexé
+                path = os.path.join(dirpath, name)
+                asset = _index_file(path, name, names)
+                if asset is not None:
+                    assets[os.path.relpath(path, self.root).replace(os.sep, '/')] = asset
+        self._signature = self._stat_dirs()
+        self.assets = assets
+
+    def _stat_dirs(self):
+        """Signature du build: (inode, date) de chaque répertoire indexé (racine comprise)."""
+        signature = []
+        for path in self._dirs or [self.root]:
+            try:
+                st = os.stat(path)
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((st.st_ino, st.st_mtime_ns))
+        return tuple(signature)
+
+
+def _index_file(path: str, name: str, siblings) -> Optional[Asset]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    # Last-Modified à la seconde (résolution HTTP); l'ETag garde la date exacte
+    last_modified = datetime.fromtimestamp(int(st.st_mtime), timezone.utc)
+    asset = Asset(path, st.st_size, last_modified, f'{st.st_size:x}-{st.st_mtime_ns:x}', mimetype,
+                  bool(_HASHED.search(name)))
+    for ext, encoding in ENCODINGS:
+        if name + ext not in siblings:
+            continue
+        try:
+            vst = os.stat(path + ext)
+        except OSError:
+            continue
+        if vst.st_mtime_ns >= st.st_mtime_ns:  # une variante plus ancienne que l'original est périmée
+            asset.variants[encoding] = (path + ext, vst.st_size)
+    asset.stamp = _stamp(asset)
+    return asset
+
+
+def _stamp(asset: Asset) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(taille, date en ns) actuelles du fichier et de ses variantes possibles (None si absent): une variante
+    périmée, ignorée à l'indexation, est aussi surveillée (réécrite sur place par `precompress`)."""
+    stamp = []
+    for path in [asset.path] + [asset.path + ext for ext, _ in ENCODINGS]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((st.st_size, st.st_mtime_ns))
+    return tuple(stamp)
+
+
+def precompress(root: str, min_size: int = 256) -> int:
+    """Écrire les variantes .gz (et .br si `brotli` est disponible) des fichiers texte du build.
+
+    Une variante à jour n'est pas réécrite; une variante qui ne gagne rien n'est pas gardée.
+    Retourne le nombre de fichiers écrits."""
+    written = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if os.path.splitext(name)[1] not in COMPRESSIBLE:
+                continue
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            if st.st_size < min_size:
+                continue
+            data = None
+            for ext, encoding in ENCODINGS:
+                if encoding == 'br' and brotli is None:
+                    continue
+                target = path + ext
+                if os.path.exists(target) and os.stat(target).st_mtime_ns >= st.st_mtime_ns:
+                    continue
+                if data is None:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                packed = brotli.compress(data) if encoding == 'br' else gzip.compress(data, 9, mtime=0)
+                if len(packed) >= len(data):
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(packed)
+                written += 1
+    return written
+
+
+if __name__ == '__main__':
+    build = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), 'frontend', 'build')
+    count = precompress(build)
+    print(f"✅ {count} variante(s) précompressée(s) écrite(s) dans {build}"
+          + ("" if brotli is not None else " (gzip seulement: paquet brotli absent)"))
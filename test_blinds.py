@@ -14,6 +14,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app import PokerGame  # type: ignore
+from blinds import geometric_structure, parse_structure  # type: ignore
 
 
 def assert_equal(actual, expected, label: str, errors: list[str]):
@@ -152,6 +153,67 @@ def test_three_players() -> list[str]:
     return errors
 
 
+def test_tournament_levels_and_antes():
+    """Structure de tournoi: niveau appliqué par post_blinds (par mains ou au temps), antes en mise morte."""
+    structure = parse_structure('10/20,25/50/5,50/100/10', hands_per_level=2)
+    assert structure.level_index(1) == 0 and structure.level_index(3) == 1 and structure.level_index(99) == 2
+    assert structure.level_index(1, level_due=1) == 1
+    assert geometric_structure(10, 20, 2, hands_per_level=10).level(3).big_blind == 160
+    try:
+        parse_structure('10/20,50/25')
+        assert False, "niveau invalide accepté"
+    except ValueError:
+        pass
+
+    game = PokerGame(id="tb", blind_structure=structure)
+    game.add_player("p1", "Alice", buy_in=1000)
+    game.add_player("p2", "Bob", buy_in=1000)
+    game.add_player("p3", "Carol", buy_in=1000)
+    levels = []
+    for _ in range(3):
+        assert game.start_hand()
+        levels.append((game.small_blind, game.big_blind, game.ante, game.blinds_changed))
+        game.blinds_changed = False
+        for p in game.players:  # rendre les jetons pour la main suivante
+            p.stack += p.total_bet
+    assert levels == [(10, 20, 0, True), (10, 20, 0, False), (25, 50, 5, True)], levels
+    # Antes: 3 x 5 dans le pot, hors de la mise à suivre
+    assert game.pot == 3 * 5 + 25 + 50 and game.current_bet == 50
+    assert [a[1] for a in game.hand_log['actions']] == ['ante', 'ante', 'ante', 'sb', 'bb']
+    assert game.blinds_info()['next'] == {'small_blind': 50, 'big_blind': 100, 'ante': 10}
+
+    # Montée au temps: niveau atteint par l'ordonnanceur, appliqué à la main suivante
+    game.blind_level_due = 2
+    for p in game.players:
+        p.stack += p.total_bet
+    assert game.start_hand() and game.big_blind == 100 and game.ante == 10
+    assert 'next' not in game.blinds_info()
+
+
+def test_ante_all_in_does_not_post_blinds():
+    """Un joueur mis all-in par l'ante ne pose pas de blind (ni 'bb' à 0)."""
+    structure = parse_structure('10/20/10')
+    game = PokerGame(id="ta", blind_structure=structure)
+    game.add_player("p1", "Alice", buy_in=8)
+    game.add_player("p2", "Bob", buy_in=1000)
+    game.add_player("p3", "Carol", buy_in=1000)
+    assert game.start_hand()
+    actions = [(game.hand_log['seats'][seat][0], action, amount) for seat, action, amount, _ in game.hand_log['actions']]
+    blinds = [(pid, action, amount) for pid, action, amount in actions if action in ('sb', 'bb')]
+    assert sorted(pid for pid, _, _ in blinds) == ['p2', 'p3'] and all(amount > 0 for _, _, amount in blinds), actions
+    assert game.current_bet == 20 and game.players[0].all_in
+
+    # Tête-à-tête: l'ante met l'un des deux all-in, plus personne contre qui miser
+    game = PokerGame(id="tb", blind_structure=structure)
+    game.add_player("p1", "Alice", buy_in=8)
+    game.add_player("p2", "Bob", buy_in=1000)
+    assert game.start_hand()
+    assert [a[1] for a in game.hand_log['actions']] == ['ante', 'ante'] and game.current_bet == 0
+    while game.phase.value != 'showdown':
+        assert game.apply_action(game.players[game.current_player].id, 'check')[0] is None
+    assert sum(p.stack for p in game.players) == 1008
+
+
 def main() -> int:
     all_errors: list[str] = []
     print("🧪 Test blinds & dealer: 2 joueurs...")
@@ -172,6 +234,22 @@ def main() -> int:
         print("✅ 3 joueurs: OK")
     all_errors.extend(errs)
 
+    print("\n🧪 Test structure de blinds de tournoi...")
+    try:
+        test_tournament_levels_and_antes()
+        print("✅ structure de tournoi: OK")
+    except AssertionError as e:
+        print("❌", e)
+        all_errors.append(f"structure de tournoi: {e}")
+
+    print("\n🧪 Test ante qui met un joueur all-in...")
+    try:
+        test_ante_all_in_does_not_post_blinds()
+        print("✅ ante all-in: OK")
+    except AssertionError as e:
+        print("❌", e)
+        all_errors.append(f"ante all-in: {e}")
+
     if all_errors:
         print(f"\n❌ ECHOUÉ — {len(all_errors)} erreur(s)")
         return 1
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests rapides du bot CodinGame (poker.py): classement des mains par masques de bits, statistiques
+des adversaires et rejeu des transcripts de référence (replay_bot.py, sans calcul d'équité).
+
+Exécution:
+  python test_bot.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from poker import OpponentStats, card_codes, classify  # type: ignore
+from replay_bot import compare, iter_transcripts, load_expected, replay_transcript  # type: ignore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _classify(board: str, hole: str):
+    return classify(card_codes(board), card_codes(hole))
+
+
+def test_classify_keeps_bot_scoring():
+    assert _classify('2H_3H_4H_9C_KD', '5H_6H') == (1000, 'strait_flush', True)
+    assert _classify('AD_2S_3C', '4H_5D')[:2] == (600, 'straight')          # quinte blanche
+    assert _classify('9D_9H_KS', '9S_9C') == (900, 'four_of_a_kind', True)
+    assert _classify('9D_9H_9S_9C_KS', '2D_3H')[0] == 0                      # carré entièrement sur la table
+    assert _classify('QD_QH_4S', 'QS_4C')[:2] == (800, 'full_house')
+    assert _classify('AD_AH_4S', 'AS_4C')[:2] == (300 + 4 - 13, 'one_pair')  # brelan d'As non compté
+    assert _classify('2D_7D_9D_JD', 'KD_3C')[:2] == (700, 'flush')
+    assert _classify('2D_7D_9D_JD_4D', 'KD_3C')[:2] == (0, None)             # 6 cartes de la couleur
+    assert _classify('2D_2H_7S_7C', '8D_9H')[0] == 0                         # paires sur la table seulement
+    assert _classify('TD_7S', 'TH_2C') == (300 + 10 - 13, 'one_pair', True)
+    assert _classify('', 'AD_KC') == (200, 'high_card', True)
+    assert _classify('AS_4D_8H', 'AD_KC')[0] == 300 + 14 - 13
+
+
+def test_opponent_stats_feed_ranges():
+    stats = OpponentStats(2)
+    for hand in range(1, 11):
+        stats.record_action(hand, 1, 'BET_40' if hand % 5 == 0 else 'CALL' if hand % 2 else 'FOLD', 'X_X_X_X_X')
+    stats.record_showdown('E_E_AH_KD')
+    assert stats.hands[1] == 10 and stats.vpip[1] == 6 and stats.pfr[1] == 2
+    assert stats.showdowns[1] == 1 and stats.last_shown[1] == 'AH_KD' and stats.showdowns[0] == 0
+    assert stats.range_for(1, has_bet=False) == 'top 60%' and stats.range_for(1, has_bet=True) == 'top 20%'
+    assert stats.range_for(0, has_bet=True) == 'top 20%'  # pas assez de mains observées
+
+
+def test_replay_reference_transcripts():
+    paths = list(iter_transcripts([os.path.join(HERE, 'bot_transcripts')]))
+    assert paths
+    for path in paths:
+        decisions, latencies = replay_transcript(path, use_equity=False)
+        expected = load_expected(path)
+        assert expected is not None and not compare(decisions, expected), (path, compare(decisions, expected)[:3])
+        # Latences mesurées et rapportées par replay_bot.py: pas de borne d'horloge dans un test unitaire
+        assert len(latencies) == len(decisions)
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests rapides de l'évaluateur rapide (hand_eval.rank_codes), de son cache (hand_eval.EVAL_CACHE), de l'isomorphisme des couleurs
+(canonical.py), des équités (equity.py), des ranges pondérées (ranges.py)
+et de la révélation rue par rue des all-in (PokerGame.paced_runout).
+
+Exécution:
+  python test_equity.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import random
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+from canonical import canonical_form, flop_classes, preflop_class, preflop_classes  # type: ignore
+from equity import EXACT_CACHE, equities  # type: ignore
+from ranges import AliasTable, parse_range, range_equities  # type: ignore
+from hand_eval import SUITS, VALUE_CHARS, LRUCache, canonical_mask, card_label, evaluate_7cards, label_card, pack_key, rank_codes  # type: ignore
+import hand_eval  # type: ignore
+
+
+def _codes(labels: str) -> list:
+    return [13 * SUITS.index(c[1]) + VALUE_CHARS.index(c[0]) for c in labels.split()]
+
+
+def test_rank_codes_orders_like_evaluate_7cards():
+    rng = random.Random(7)
+    for _ in range(20000):
+        cards = rng.sample(range(52), 7)
+        key, _ = evaluate_7cards([label_card(card_label(c)) for c in cards])
+        assert rank_codes(cards) == pack_key(key), [card_label(c) for c in cards]
+    # Une suite 2-6 bat la roue A-5 (l'As bas ne doit pas masquer une suite plus haute)
+    assert evaluate_7cards([label_card(c) for c in 'AS 2C 3D 4S 5C 6C TC'.split()])[0] == (4, (6,))
+
+
+def test_eval_cache_is_suit_canonical_and_bounded():
+    hand = [label_card(c) for c in 'AS KS QS JS 9S 2H 2D'.split()]
+    swapped = [label_card(c) for c in 'AH KH QH JH 9H 2S 2C'.split()]
+    assert canonical_mask(hand) == canonical_mask(swapped)
+    assert canonical_mask(hand) != canonical_mask([label_card(c) for c in 'AS KS QS JS 9H 2H 2D'.split()])
+    cache, saved = LRUCache(2), hand_eval.EVAL_CACHE
+    hand_eval.EVAL_CACHE = cache
+    try:
+        first = evaluate_7cards(hand)
+        assert evaluate_7cards(swapped) == first and (cache.hits, cache.misses) == (1, 1)
+        evaluate_7cards([label_card(c) for c in '2S 3S 4S 5S 7H 9D JC'.split()])
+        evaluate_7cards([label_card(c) for c in '2S 3S 4S 5S 8H 9D JC'.split()])
+        assert len(cache) == 2 and cache.get(canonical_mask(hand)) is None  # la plus ancienne est évincée
+    finally:
+        hand_eval.EVAL_CACHE = saved
+
+
+def test_suit_isomorphism_classes():
+    classes = preflop_classes()
+    assert len(classes) == 169 and sum(m for _, m in classes.values()) == 1326
+    assert classes['AA'][1] == 6 and classes['AKs'][1] == 4 and classes['AKo'][1] == 12
+    assert preflop_class(_codes('KD AD')) == 'AKs' and preflop_class(_codes('7C 2H')) == '72o'
+    flops = flop_classes()
+    assert len(flops) == 1755 and sum(m for _, m in flops) == 22100
+    # Même situation aux couleurs près (D<->S, H<->C) -> même forme canonique
+    a = canonical_form(_codes('AD KD'), _codes('QH JH 2D'))
+    b = canonical_form(_codes('AS KS'), _codes('QC JC 2S'))
+    assert a == b and a[1] == 12
+
+
+def test_exact_equities_reused_across_suit_permutations():
+    EXACT_CACHE.clear()
+    first = equities([_codes('AD KD'), _codes('QH QC')], _codes('2D 7S 9D TH'))
+    again = equities([_codes('AS KS'), _codes('QH QD')], _codes('2S 7C 9S TH'))
+    assert again == first and EXACT_CACHE.hits == 1
+
+
+def test_equities_exact_on_the_turn():
+    # AA contre 7-8 à cœur sur 9h 6h 2c Kd: une seule carte à venir, outs comptables à la main
+    hands = [_codes('AS AD'), _codes('7H 8H')]
+    board = _codes('9H 6H 2C KD')
+    result = equities(hands, board)
+    assert result['exact'] and result['samples'] == 44
+    # Outs de 7-8: 5 et 10 (quinte, 8 cartes) + cœurs restants hors 5h/Th (7 cartes) = 15
+    assert abs(result['equity'][1] - 15 / 44) < 1e-9, result
+    assert abs(sum(result['equity']) - 1) < 1e-9
+
+
+def test_equities_sampling_respects_budget():
+    result = equities([_codes('AS AD'), _codes('KS KD')], time_budget=0.01, max_samples=500, rng=random.Random(3))
+    assert not result['exact'] and 0 < result['samples'] <= 500
+    assert 0.7 < result['equity'][0] < 0.95, result
+
+
+def test_parse_range_and_alias_sampling():
+    assert len(parse_range('QQ+')) == 18 and len(parse_range('AKs, AKo')) == 16
+    assert len(parse_range('ATs+')) == 16 and len(parse_range('22-44, K9o-K8o')) == 18 + 24
+    assert parse_range('AsKs') == parse_range('KSAS') == {tuple(sorted(_codes('AS KS'))): 1.0}
+    assert len(parse_range('random')) == 1326 and parse_range('top 0.9%').keys() == parse_range('AA, KK').keys()
+    assert parse_range('AKo:0.5')[tuple(sorted(_codes('AD KH')))] == 0.5
+    try:
+        parse_range('ZZ')
+        assert False, 'range invalide acceptée'
+    except ValueError:
+        pass
+    rng, counts = random.Random(3), [0, 0, 0]
+    table = AliasTable([1, 2, 7])
+    for _ in range(20000):
+        counts[table.sample(rng)] += 1
+    assert abs(counts[2] / 20000 - 0.7) < 0.02 and abs(counts[0] / 20000 - 0.1) < 0.02
+
+
+def test_range_equities_match_exact_and_remove_conflicts():
+    hero, villain, board = _codes('AD AH'), _codes('KD KH'), _codes('2S 7C 9D')
+    exact = equities([hero, villain], board)['equity'][0]
+    sampled = range_equities([hero, villain], board, time_budget=1, max_samples=6000, rng=random.Random(1))
+    assert abs(sampled['equity'][0] - exact) < 0.02 and sampled['samples'] == 6000
+    # La range 'AA' ne peut contenir que AS AC une fois AD AH connus: partage quasi systématique
+    split = range_equities([hero, 'AA'], board, time_budget=1, max_samples=2000, rng=random.Random(1))
+    assert abs(split['equity'][0] - 0.5) < 0.05
+
+
+def test_paced_runout_reveals_one_street_at_a_time():
+    def all_in_preflop(paced: bool) -> 'app.PokerGame':
+        game = app.PokerGame(id='ro', paced_runout=paced)
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.add_player('a', 'Alice', buy_in=100)
+            game.add_player('b', 'Bob', buy_in=100)
+            game.start_hand(seed=11)
+            p = game.players[game.current_player]
+            assert game.apply_action(p.id, 'raise', p.stack)[0] is None
+            q = game.players[game.current_player]
+            game.apply_action(q.id, 'call')
+        return game
+
+    instant, paced = all_in_preflop(False), all_in_preflop(True)
+    assert instant.phase == app.GamePhase.SHOWDOWN
+    assert paced.phase == app.GamePhase.PREFLOP and paced.in_runout() and not paced.community_cards
+    eq = paced.runout_equity(time_budget=0.01)
+    assert eq and len(eq['players']) == 2 and abs(sum(p['equity'] for p in eq['players']) - 1) < 1e-6
+    boards = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        while paced.runout_step():
+            boards.append(len(paced.community_cards))
+    assert boards == [3, 4, 5, 5] and paced.phase == app.GamePhase.SHOWDOWN
+    assert [str(c) for c in paced.community_cards] == [str(c) for c in instant.community_cards]
+    assert paced.last_winner == instant.last_winner
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests rapides de l'historique des mains (hand_history.py): encodage binaire, écriture par lots
+en tâche de fond, rotation quotidienne, lecture en flux et rejeu déterministe (replay.py).
+
+Exécution:
+  python test_hand_history.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import tournament_sim as ts  # type: ignore
+from blinds import parse_structure  # type: ignore
+from hand_history import HandHistoryWriter, decode_hand, encode_hand, iter_hands  # type: ignore
+from replay import replay_file, replay_hand  # type: ignore
+
+
+def play_hands(n: int, structure=None) -> list[dict]:
+    """Jouer n mains en self-play et retourner leurs enregistrements d'historique."""
+    records = []
+    strategies = [ts.heuristic_strategy, ts.random_strategy, ts.passive]
+    game = ts.PokerGame(id='hist', blind_structure=structure)
+    ts.random.seed(1234)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for seat in range(3):
+            game.add_player(f'p{seat}', f'Bot{seat}')
+        for _ in range(n):
+            if not game.start_hand(seed=ts.random.getrandbits(64)):
+                break
+            while game.phase != ts.GamePhase.SHOWDOWN:
+                seat = game.current_player
+                for action, amount in [strategies[seat](game, seat)] + ts._fallback_action(game, seat):
+                    if game.apply_action(game.players[seat].id, action, amount)[0] is None:
+                        break
+            records.append(game.hand_record())
+    return records
+
+
+def test_encode_decode_roundtrip():
+    for record in play_hands(20):
+        decoded = decode_hand(encode_hand(record))
+        assert decoded['seats'] == record['seats'], (decoded['seats'], record['seats'])
+        assert decoded['actions'] == record['actions']
+        for key in ('game_id', 'hand_number', 'dealer_pos', 'seed', 'board', 'pot', 'reason', 'winners', 'started_at'):
+            assert decoded[key] == record[key], key
+        # Les blinds sont journalisées en tête de main
+        assert [a[1] for a in record['actions'][:2]] == ['sb', 'bb']
+
+
+def test_writer_rotates_daily_and_reader_streams():
+    records = play_hands(10)
+    day = 86400.0
+    for i, record in enumerate(records):
+        record['started_at'] = 1_700_000_000.0 + (day if i >= len(records) // 2 else 0.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = HandHistoryWriter(tmp, batch_size=3, flush_interval=0.05)
+        for record in records:
+            writer.write(record)
+        writer.close()
+        files = sorted(os.listdir(tmp))
+        assert len(files) == 2, files
+        # Un enregistrement tronqué en fin de fichier (écriture en cours) est ignoré
+        with open(os.path.join(tmp, files[-1]), 'ab') as f:
+            f.write(b'\xff\x00')
+        read = list(iter_hands(tmp))
+        assert [r['hand_number'] for r in read] == [r['hand_number'] for r in records]
+
+
+def test_invalid_actions_are_rejected_and_bad_records_skipped():
+    game = ts.PokerGame(id='bad')
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.add_player('a', 'A')
+        game.add_player('b', 'B')
+        assert game.start_hand(seed=1)
+    player = game.players[game.current_player]
+    logged = list(game.hand_log['actions'])
+    for action, amount in (('foo', 0), ('raise', 0), ('raise', -50), ('sb', 10)):
+        assert game.apply_action(player.id, action, amount)[0] is not None, action
+    assert game.hand_log['actions'] == logged and game.players[game.current_player] is player
+    # Un enregistrement non encodable est écarté seul: les autres mains du lot sont écrites
+    records = play_hands(4)
+    broken = dict(records[1], actions=[(0, 'foo', 0, 'preflop')])
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = HandHistoryWriter(tmp, batch_size=64, flush_interval=0.05)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for record in [records[0], broken] + records[2:]:
+                writer.write(record)
+            writer.close()
+        read = list(iter_hands(tmp))
+    assert [r['hand_number'] for r in read] == [r['hand_number'] for r in records if r is not records[1]]
+
+
+def test_replay_reproduces_recorded_hands():
+    records = play_hands(30)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for record in records:
+            _, mismatches = replay_hand(decode_hand(encode_hand(record)))
+            assert not mismatches, (record['hand_number'], mismatches)
+    # Une main falsifiée (tapis final modifié) doit être détectée
+    tampered = decode_hand(encode_hand(records[0]))
+    tampered['seats'][0]['final_stack'] += 1
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert replay_hand(tampered)[1], "écart non détecté"
+
+
+def test_replay_tournament_hands_with_antes():
+    records = play_hands(15, parse_structure('10/20,20/40/5,40/80/10', hands_per_level=5))
+    assert [(r['big_blind'], r['ante']) for r in records[::5]] == [(20, 0), (40, 5), (80, 10)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for record in records:
+            decoded = decode_hand(encode_hand(record))
+            assert decoded['ante'] == record['ante'] and decoded['actions'] == record['actions']
+            _, mismatches = replay_hand(decoded)
+            assert not mismatches, (record['hand_number'], mismatches)
+
+
+def test_replay_file_batch_across_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = HandHistoryWriter(tmp, flush_interval=0.01)
+        for record in play_hands(12):
+            writer.write(record)
+        writer.close()
+        results = list(replay_file(tmp, workers=2, batch_size=5))
+        assert len(results) == 12, len(results)
+        assert all(not mismatches for _, _, mismatches in results), results
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
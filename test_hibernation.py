@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests rapides de l'hibernation des tables inactives (hibernation.py et ramasseur de app.py).
+
+Exécution:
+  python test_hibernation.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+from hibernation import DiskStore, dumps_game, loads_game  # type: ignore
+
+
+def _table(game_id: str) -> 'app.PokerGame':
+    game = app.PokerGame(id=game_id)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.add_player(f'{game_id}-a', 'Alice')
+        game.add_player(f'{game_id}-b', 'Bob')
+        game.start_hand(seed=99)
+    return game
+
+
+def test_roundtrip_resumes_hand_in_progress():
+    game = _table('g1')
+    data = dumps_game(game)
+    restored = loads_game(data)
+    assert restored.to_dict() == game.to_dict()
+    # Les cartes restaurées sont les cartes partagées du moteur, pas des copies
+    assert all(c is app.CARDS[app.CARDS.index(c)] for p in restored.players for c in p.hand)
+    # La main se poursuit à l'identique (même deck, mêmes mises)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for g in (game, restored):
+            current = g.players[g.current_player]
+            assert g.apply_action(current.id, 'call')[0] is None
+    assert restored.to_dict() == game.to_dict()
+    assert [str(c) for c in restored.community_cards] == [str(c) for c in game.community_cards]
+
+
+def test_reaper_hibernates_idle_tables_and_join_rehydrates():
+    saved = (app.hibernated, app.IDLE_TABLE_TTL_SECONDS, app._scheduler_started)
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        app.hibernated = DiskStore(tmp)
+        app.IDLE_TABLE_TTL_SECONDS = 60
+        app._scheduler_started = True  # pas de tâche de fond pendant le test
+        try:
+            idle, active, empty = _table('idle1'), _table('busy1'), app.PokerGame(id='empty1')
+            for p in idle.players:
+                p.connected = False
+            app.games.update({'idle1': idle, 'busy1': active, 'empty1': empty})
+
+            assert app._reap_idle_tables(now=1000.0) == 0  # début d'inactivité relevé
+            assert app._reap_idle_tables(now=1059.0) == 0
+            assert app._reap_idle_tables(now=1060.0) == 2
+            assert 'idle1' not in app.games and 'empty1' not in app.games and 'busy1' in app.games
+            assert 'idle1' in app.hibernated and 'empty1' not in app.hibernated
+
+            game = app._get_game('idle1')
+            assert game is not None and app.games['idle1'] is game
+            assert game.to_dict() == idle.to_dict()
+            assert 'idle1' not in app.hibernated
+            assert app._get_game('unknown') is None
+        finally:
+            for gid in ('idle1', 'busy1', 'empty1'):
+                app.games.pop(gid, None)
+                app.scheduler.cancel(('action', gid))
+            app.scheduler.cancel(('reaper',))
+            app.hibernated, app.IDLE_TABLE_TTL_SECONDS, app._scheduler_started = saved
+
+
+def test_hibernated_tables_stay_in_lobby_and_joinable():
+    saved = (app.hibernated, app.IDLE_TABLE_TTL_SECONDS, app._scheduler_started)
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        app.hibernated = DiskStore(tmp)
+        app.IDLE_TABLE_TTL_SECONDS = 60
+        app._scheduler_started = True
+        client = app.socketio.test_client(app.app)
+        try:
+            idle = _table('nap1')
+            for p in idle.players:
+                p.connected = False
+            app.games['nap1'] = idle
+            app._reap_idle_tables(now=1000.0)
+            assert app._reap_idle_tables(now=1060.0) == 1 and 'nap1' not in app.games
+            # Table hibernée par un autre worker: seul l'id est connu (stockage partagé)
+            app.hibernated.save('nap2', dumps_game(_table('nap2')))
+            app.lobby.invalidate()  # en production: recalcul au-delà de max_age
+            listed = {g['id']: g for g in app.lobby.refresh().games}
+            assert listed['nap1']['asleep'] and listed['nap1']['host'] == 'Alice', listed
+            assert listed['nap1']['players'] == 2 and listed['nap1']['connected'] == 0
+            assert listed['nap2']['asleep'] and listed['nap2']['can_join'], listed
+
+            client.emit('join_game', {'game_id': 'nap1', 'player_name': 'Carol'})
+            joined = [m['args'][0] for m in client.get_received() if m['name'] == 'game_joined']
+            listed = {g['id']: g for g in app.lobby.refresh().games}
+            assert joined and 'nap1' in app.games and 'nap1' not in app.hibernated
+            assert not listed['nap1'].get('asleep') and listed['nap1']['players'] == 3, listed
+        finally:
+            client.disconnect()
+            for gid in ('nap1', 'nap2'):
+                app.games.pop(gid, None)
+                app._asleep.pop(gid, None)
+                for kind in ('action', 'blinds'):
+                    app.scheduler.cancel((kind, gid))
+            app.scheduler.cancel(('reaper',))
+            app.hibernated, app.IDLE_TABLE_TTL_SECONDS, app._scheduler_started = saved
+            app.lobby.invalidate()
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Tests rapides du directeur de tournoi multi-tables (mtt.py): tas des tailles de tables, répartition,
+éliminations, équilibrage et cassage des tables, tournoi complet en self-play (tournament_sim.play_mtt),
+mains enchaînées côté serveur (app._run_next_hand: bouton, joueur déplacé en cours de main).
+
+Exécution:
+  python test_mtt.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import tournament_sim as ts  # type: ignore
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+from blinds import parse_structure  # type: ignore
+from mtt import TableSizes, TournamentDirector  # type: ignore
+
+
+def _director(entrants: int, table_size: int) -> TournamentDirector:
+    director = TournamentDirector('t', lambda table_id: ts.PokerGame(id=table_id), table_size=table_size)
+    for i in range(entrants):
+        director.register(f'p{i}', f'Bot{i}')
+    with contextlib.redirect_stdout(io.StringIO()):
+        director.seat_players(seed=1)
+    return director
+
+
+def _bust(director: TournamentDirector, table_id: str, count: int) -> None:
+    """Éliminer `count` joueurs de la table (tapis vidé), jetons reportés sur le premier survivant."""
+    game = director.tables[table_id]
+    for p in game.players[:count]:
+        game.players[count].stack += p.stack
+        p.stack = 0
+
+
+def test_table_sizes_lazy_heaps():
+    sizes = TableSizes()
+    for table_id, size in (('a', 6), ('b', 5), ('c', 6)):
+        sizes.set(table_id, size)
+    assert sizes.smallest() == 'b' and sizes.largest() == 'a'
+    sizes.set('b', 7)
+    sizes.set('a', 3)
+    assert sizes.smallest() == 'a' and sizes.largest() == 'b'
+    sizes.remove('a')
+    assert sizes.smallest() == 'c' and len(sizes) == 2
+
+
+def test_seating_and_balancing():
+    director = _director(22, 6)
+    assert list(director.table_sizes().values()) == [6, 6, 5, 5]
+    director.flush()
+    # 3 éliminés à une table: chaque table qui finit ensuite sa main lui envoie des joueurs si besoin
+    table_ids = list(director.tables)
+    _bust(director, table_ids[0], 3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert director.hand_finished(table_ids[0]) == []
+        moves = [m for t in table_ids[1:] for m in director.hand_finished(t)]
+    assert [(m.from_table, m.to_table) for m in moves] == [(table_ids[1], table_ids[0])], moves
+    assert director.imbalance() <= 1 and director.players_left == 19
+    updates = director.flush()
+    assert sorted(place for _, place in updates.eliminated) == [20, 21, 22]
+    assert sorted(updates.tables) == sorted(table_ids[:1] + [m.from_table for m in moves])
+    chips = sum(p.stack for g in director.tables.values() for p in g.players)
+    assert chips == 22 * 1000
+
+
+def test_table_breaks_when_players_fit():
+    director = _director(12, 6)
+    table_a, table_b = list(director.tables)
+    _bust(director, table_a, 1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        director.hand_finished(table_a)
+        _bust(director, table_b, 1)
+        moves = director.hand_finished(table_b)
+    # 10 joueurs restants: pas assez peu pour tenir sur une seule table
+    assert moves == [] and len(director.tables) == 2
+    _bust(director, table_a, 4)
+    with contextlib.redirect_stdout(io.StringIO()):
+        moves = director.hand_finished(table_a)
+    updates = director.flush()
+    assert updates.broken == [table_a] and len(moves) == 1 and list(director.tables) == [table_b]
+    assert table_a not in updates.tables and table_b in updates.tables
+    assert len(director.tables[table_b].players) == 6
+
+
+def test_full_mtt_self_play():
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = ts.play_mtt(60, ['heuristic', 'call', 'random'], table_size=6, seed=5)
+    standings = result['standings']
+    assert result['chips'] == 60 * 1000 and not result['stalled']
+    assert sorted(row['place'] for row in standings) == list(range(1, 61))
+    assert standings[0]['stack'] == 60 * 1000 and result['moves'] > 0
+    # Un seul game_update par table touchée et par fin de main, quel que soit le nombre de déplacements
+    assert result['updates'] <= result['hands'] + result['moves']
+
+
+def test_blind_level_is_tournament_wide():
+    structure = parse_structure('10/20,20/40,40/80', hands_per_level=2)
+    director = TournamentDirector('b', lambda table_id: ts.PokerGame(id=table_id), table_size=3, structure=structure)
+    for i in range(6):
+        director.register(f'p{i}', f'Bot{i}')
+    with contextlib.redirect_stdout(io.StringIO()):
+        director.seat_players(seed=1)
+    table_a, table_b = director.tables.values()
+    assert table_a.blind_structure.hands_per_level == 0, "les tables ne montent pas de niveau seules"
+    table_a.hand_number = 2
+    with contextlib.redirect_stdout(io.StringIO()):
+        director.hand_finished(table_a.id)
+    assert director.blind_level == 1 and table_b.blind_level_due == 1 and table_b.hand_number == 0
+    assert director.level_up() and table_a.blind_level_due == table_b.blind_level_due == 2
+    assert not director.level_up(), "au-delà du dernier niveau"
+
+
+def test_clients_create_register_and_start_tournament():
+    saved = app.blind_structure
+    app.blind_structure = parse_structure('10/20,20/40', seconds_per_level=60)
+    with contextlib.redirect_stdout(io.StringIO()):
+        clients = [app.socketio.test_client(app.app) for _ in range(3)]
+        try:
+            clients[0].emit('create_tournament', {'player_name': 'Host', 'table_size': 2})
+            tournament_id = [m for m in clients[0].get_received()
+                             if m['name'] == 'tournament_created'][0]['args'][0]['tournament_id']
+            for i, c in enumerate(clients[1:]):
+                c.emit('register_tournament', {'tournament_id': tournament_id, 'player_name': f'Guest{i}'})
+            clients[1].emit('start_tournament', {'tournament_id': tournament_id})
+            refused = [m for m in clients[1].get_received() if m['name'] == 'error']
+            registration = [m['args'][0] for m in clients[0].get_received() if m['name'] == 'tournament_registration']
+            clients[0].emit('start_tournament', {'tournament_id': tournament_id})
+            director = app.tournaments[tournament_id]
+            moved = [[m for m in c.get_received() if m['name'] == 'table_moved'] for c in clients]
+            table_ids = list(director.tables)
+            clock = app.scheduler.pending(('mtt_blinds', tournament_id))
+            table_timers = [app.scheduler.pending(('blinds', t)) for t in table_ids]
+        finally:
+            app.blind_structure = saved
+            for c in clients:
+                c.disconnect()
+            for table_id in list(app.games):
+                if table_id.startswith(tournament_id):
+                    app.games.pop(table_id, None)
+                    for kind in ('action', 'next_hand', 'blinds'):
+                        app.scheduler.cancel((kind, table_id))
+            app.scheduler.cancel(('mtt_blinds', tournament_id))
+            app.scheduler.cancel(('mtt', tournament_id))
+            app.tournaments.pop(tournament_id, None)
+    assert refused, "seul l'organisateur peut lancer le tournoi"
+    assert registration[-1]['entrants'] == ['Host', 'Guest0', 'Guest1'] and registration[-1]['host'] == 'Host'
+    assert director.started and len(table_ids) == 2 and all(len(m) == 1 for m in moved)
+    assert clock is not None and table_timers == [None, None], "une seule horloge de blinds par tournoi"
+
+
+def _cleanup_tournament(director) -> None:
+    for table_id in list(app.games):
+        if table_id.startswith(director.id):
+            app.games.pop(table_id, None)
+            for kind in ('action', 'next_hand', 'runout', 'blinds'):
+                app.scheduler.cancel((kind, table_id))
+    app.scheduler.cancel(('mtt', director.id))
+    app.scheduler.cancel(('mtt_blinds', director.id))
+    app.tournaments.pop(director.id, None)
+
+
+def _deal_scheduled_hand(table_id: str):
+    """Exécuter tout de suite la main suivante programmée pour la table (app._run_next_hand)."""
+    assert app.scheduler.pending(('next_hand', table_id)) is not None, f"main suivante non programmée: {table_id}"
+    app.scheduler.cancel(('next_hand', table_id))
+    app._run_next_hand(table_id)
+    game = app.games[table_id]
+    assert game.phase == app.GamePhase.PREFLOP, game.phase
+    return game
+
+
+def _fold_out(game, skip=()):
+    """Coucher les joueurs à tour de rôle jusqu'à la fin de la main (les sièges `skip` ne doivent pas jouer)."""
+    while True:
+        player = game.players[game.current_player]
+        assert player.id not in skip, f"{player.id} appelé à jouer sans cartes"
+        error, ended, _ = game.apply_action(player.id, 'fold')
+        assert error is None, error
+        if ended:
+            return
+
+
+def test_server_tables_move_button_one_seat_per_hand():
+    for size in (3, 2):
+        with contextlib.redirect_stdout(io.StringIO()):
+            director = app.start_tournament([(f'bt{size}{i}', f'Srv{i}') for i in range(size)],
+                                            table_size=size, seed=3)
+            try:
+                table_id = next(iter(director.tables))
+                buttons = []
+                for _ in range(4):
+                    game = _deal_scheduled_hand(table_id)
+                    buttons.append(game.dealer_pos)
+                    _fold_out(game)
+                    app._finish_hand(table_id, game)
+                flush = app.scheduler.pending(('mtt', director.id))
+            finally:
+                _cleanup_tournament(director)
+        assert buttons == [i % size for i in range(4)], (size, buttons)
+        assert flush is not None and all(director.stacks[p.id] == p.stack for p in game.players)
+
+
+def test_player_moved_into_live_hand_sits_out():
+    with contextlib.redirect_stdout(io.StringIO()):
+        director = app.start_tournament([(f'mv{i}', f'Srv{i}') for i in range(9)], table_size=4, seed=5)
+        try:
+            table_ids = list(director.tables)
+            assert sorted(director.table_sizes().values()) == [3, 3, 3]
+            live = {table_id: _deal_scheduled_hand(table_id) for table_id in table_ids}
+            # Table cassée: deux éliminés à la fin de sa main, le survivant rejoint une table en pleine main
+            broken = table_ids[0]
+            game = live[broken]
+            _fold_out(game)
+            survivor = game.players[2]
+            for p in game.players[:2]:
+                survivor.stack += p.stack
+                p.stack = 0
+            app._finish_hand(broken, game)
+            target_id = director.table_of[survivor.id]
+            target = live[target_id]
+            moved = target.players[-1]
+            assert broken not in director.tables and moved.id == survivor.id
+            assert moved.folded and moved.has_acted and moved.hand == [] and moved.stack == survivor.stack
+            # La main en cours se termine sans lui, il est servi à la suivante
+            _fold_out(target, skip={moved.id})
+            app._finish_hand(target_id, target)
+            target = _deal_scheduled_hand(target_id)
+            dealt = not target.players[-1].folded and len(target.players[-1].hand) == 2
+        finally:
+            _cleanup_tournament(director)
+    assert dealt, "le joueur déplacé doit recevoir des cartes à la main suivante"
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests rapides de l'arbitre local (referee.py): protocole de l'arbitre CodinGame compris par poker.py,
+parties entre bots en sous-processus et statistiques (intervalle de Wilson).
+
+Exécution:
+  python test_referee.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from referee import play_match, run_arena, wilson_interval  # type: ignore
+
+# Bot minimal: suit toujours (check si possible), en lisant exactement le protocole de l'arbitre
+CALLER = '''import sys
+r = sys.stdin.readline
+h = [int(r()) for _ in range(8)]
+while r():
+    r()
+    for _ in range(h[6]): r()
+    r(); r()
+    for _ in range(int(r())): r()
+    for _ in range(int(r())): r()
+    acts = [r().strip() for _ in range(int(r()))]
+    print('CALL;suivi' if 'CALL' in acts else 'CHECK' if 'CHECK' in acts else 'ALL_IN', flush=True)
+'''
+
+
+def _caller_command(tmp: str) -> str:
+    path = os.path.join(tmp, 'caller.py')
+    with open(path, 'w') as f:
+        f.write(CALLER)
+    return f'{sys.executable} {path}'
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert 0.40 < low < 0.41 and 0.59 < high < 0.60
+    assert wilson_interval(0, 0) == (0.0, 1.0) and wilson_interval(10, 10)[1] == 1.0
+
+
+def test_callers_play_to_the_end_without_protocol_errors():
+    with tempfile.TemporaryDirectory() as tmp:
+        caller = _caller_command(tmp)
+        result = play_match([caller, caller, caller], seed=4, max_rounds=600, buy_in=200, hand_nb_by_level=3)
+    assert sum(result['stacks']) == 600 and sorted(result['ranks']) == [0, 1, 2]
+    assert result['timeouts'] == [0, 0, 0] and result['invalid'] == [0, 0, 0]
+    assert result['hands'] > 1 and result['rounds'] > result['hands']
+
+
+def test_poker_bot_speaks_the_protocol():
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = run_arena([('poker', f'{sys.executable} -u poker.py'), ('caller', _caller_command(tmp))],
+                          players=2, matches=2, seed=1, max_rounds=16, timeout=0.5)
+    assert stats['poker']['seats'] == stats['caller']['seats'] == 2
+    assert stats['poker']['invalid'] == 0 and stats['poker']['timeouts'] == 0
+    assert stats['poker']['wins'] + stats['caller']['wins'] == 2
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests rapides de l'ordonnanceur de minuteurs partagé (scheduler.py), avec une horloge simulée.
+
+Exécution:
+  python test_scheduler.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scheduler import TimerScheduler  # type: ignore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_timers_fire_in_deadline_order():
+    clock = FakeClock()
+    sched = TimerScheduler(clock=clock)
+    fired: list[str] = []
+    sched.schedule(('action', 'b'), 2.0, fired.append, 'b')
+    sched.schedule(('action', 'a'), 1.0, fired.append, 'a')
+    sched.schedule(('next_hand', 'a'), 3.0, fired.append, 'next')
+    clock.now = 0.5
+    assert sched.run_due() == 0
+    clock.now = 2.0
+    assert sched.run_due() == 2
+    assert fired == ['a', 'b'], fired
+    assert len(sched) == 1 and sched.pending(('next_hand', 'a')) == 1.0
+
+
+def test_reschedule_replaces_and_cancel_removes():
+    clock = FakeClock()
+    sched = TimerScheduler(clock=clock)
+    fired: list[int] = []
+    sched.schedule('t', 1.0, fired.append, 1)
+    sched.schedule('t', 5.0, fired.append, 2)  # remplace l'échéance précédente
+    sched.schedule('u', 1.0, fired.append, 3)
+    assert sched.cancel('u') and not sched.cancel('u')
+    clock.now = 2.0
+    sched.run_due()
+    assert fired == [], fired
+    clock.now = 5.0
+    sched.run_due()
+    assert fired == [2], fired
+
+
+def test_heap_compaction_keeps_live_timers():
+    clock = FakeClock()
+    sched = TimerScheduler(clock=clock)
+    fired: list[int] = []
+    for i in range(1000):
+        sched.schedule(('action', i % 10), 1.0 + i / 1000, fired.append, i)
+    assert len(sched) == 10
+    assert len(sched._heap) <= 4 * 10 + 64, len(sched._heap)
+    clock.now = 10.0
+    sched.run_due()
+    assert sorted(fired) == list(range(990, 1000)), fired
+
+
+def test_next_delay_is_bounded_by_resolution():
+    clock = FakeClock()
+    sched = TimerScheduler(clock=clock, resolution=0.25)
+    assert sched.next_delay() == 0.25
+    sched.schedule('t', 0.1, lambda: None)
+    assert abs(sched.next_delay() - 0.1) < 1e-9
+    sched.cancel('t')
+    assert sched.next_delay() == 0.25
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests rapides du showdown différé (évaluation hors de la boucle d'événements, SHOWDOWN_OFFLOAD).
+
+Exécution:
+  python test_showdown_offload.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+from hand_eval import evaluate_labels  # type: ignore
+
+
+def _play_to_river(defer: bool, seed: int = 2024) -> 'app.PokerGame':
+    """Trois joueurs qui suivent/checkent jusqu'au dernier tour d'enchères (river)."""
+    game = app.PokerGame(id='sd', defer_showdown=defer)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in ('Alice', 'Bob', 'Chloé'):
+            game.add_player(name.lower(), name)
+        game.start_hand(seed=seed)
+        while game.phase != app.GamePhase.RIVER:
+            p = game.players[game.current_player]
+            game.apply_action(p.id, 'call' if p.current_bet < game.current_bet else 'check')
+    return game
+
+
+def _finish_river(game: 'app.PokerGame') -> bool:
+    hand_ended = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        while game.phase == app.GamePhase.RIVER:
+            error, hand_ended, _ = game.apply_action(game.players[game.current_player].id, 'check')
+            assert error is None, error
+    return hand_ended
+
+
+def test_deferred_showdown_matches_inline_result():
+    inline, deferred = _play_to_river(False), _play_to_river(True)
+    assert _finish_river(inline) and _finish_river(deferred)
+    assert deferred.phase == app.GamePhase.SHOWDOWN and deferred.pending_showdown is not None
+    assert deferred.last_winner == {} and deferred.pot == inline.last_winner['amount']
+    assert not deferred.start_hand(), "nouvelle main démarrée avant le résultat"
+    request = deferred.pending_showdown
+    with contextlib.redirect_stdout(io.StringIO()):
+        deferred.finish_showdown(evaluate_labels(request['hands'], request['board']))
+    assert deferred.pending_showdown is None
+    assert deferred.last_winner == inline.last_winner
+    assert [p.stack for p in deferred.players] == [p.stack for p in inline.players]
+
+
+def test_server_emits_result_when_pool_evaluation_completes():
+    saved_pool = app.showdown_pool
+    emitted = []
+    saved_emit = app._emit_hand_result
+    app.showdown_pool = ThreadPoolExecutor(max_workers=1)
+    app._emit_hand_result = lambda game_id, game, all_in_auto=False: emitted.append(dict(game.last_winner))
+    game = _play_to_river(True)
+    app.games['sd'] = game
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            while game.phase == app.GamePhase.RIVER:
+                player = game.players[game.current_player]
+                error, hand_ended, all_in_auto = game.apply_action(player.id, 'check')
+            app._broadcast_after_action('sd', game, hand_ended, all_in_auto)
+            deadline = time.monotonic() + 5
+            while not emitted and time.monotonic() < deadline:
+                app.socketio.sleep(0.01)  # laisser tourner la tâche de fond
+        assert emitted and emitted[0]['reason'] == 'showdown', emitted
+        assert game.pending_showdown is None and 'sd' not in app._showdown_jobs
+    finally:
+        app.showdown_pool.shutdown()
+        app.showdown_pool = saved_pool
+        app._emit_hand_result = saved_emit
+        app.games.pop('sd', None)
+        app.scheduler.cancel(('action', 'sd'))
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
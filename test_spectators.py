@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests rapides du mode spectateur: deltas de l'état public (spectators.py) et room des spectateurs
+côté serveur (app.py: spectate_game, deltas groupés, aucun to_dict par spectateur).
+
+Exécution:
+  python test_spectators.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+from spectators import SpectatorChannel, apply_delta  # type: ignore
+
+
+def _state(pot: int, stacks: list) -> dict:
+    return {'id': 't', 'pot': pot, 'phase': 'preflop', 'players': [{'name': f'P{i}', 'stack': s} for i, s in enumerate(stacks)]}
+
+
+def test_channel_deltas_rebuild_state():
+    channel = SpectatorChannel()
+    channel.update(_state(0, [1000, 1000, 1000]))
+    full = channel.subscribe()
+    assert full['version'] == 1 and channel.delta() is None
+    channel.update(_state(30, [990, 980, 1000]))
+    channel.update(_state(60, [990, 980, 970]))   # deux mises à jour regroupées en un delta
+    delta = channel.delta()
+    assert delta['base'] == 1 and delta['version'] == 3 and delta['changes'] == {'pot': 60}
+    assert sorted(delta['seats']) == ['0', '1', '2']
+    assert apply_delta(full['state'], delta) == _state(60, [990, 980, 970])
+    # Un siège de plus: liste des joueurs envoyée entière
+    channel.update(_state(60, [990, 980, 970, 1000]))
+    delta = channel.delta()
+    assert delta['base'] == 3 and len(delta['changes']['players']) == 4 and 'seats' not in delta
+
+
+def test_spectators_share_one_public_state():
+    calls = []
+    to_dict = app.PokerGame.to_dict
+
+    def counting_to_dict(self, *args, **kwargs):
+        calls.append(1)
+        return to_dict(self, *args, **kwargs)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        a = app.socketio.test_client(app.app)
+        b = app.socketio.test_client(app.app)
+        a.emit('create_game', {'player_name': 'Alice'})
+        game_id = [m for m in a.get_received() if m['name'] == 'game_created'][0]['args'][0]['game_id']
+        b.emit('join_game', {'game_id': game_id, 'player_name': 'Bob'})
+        watchers = [app.socketio.test_client(app.app) for _ in range(10)]
+        for w in watchers:
+            w.emit('spectate_game', {'game_id': game_id})
+        first = [m['args'][0] for m in watchers[0].get_received() if m['name'] == 'spectator_state']
+        app.PokerGame.to_dict = counting_to_dict
+        try:
+            a.emit('start_game', {'game_id': game_id})
+            app.scheduler.cancel(('spectators', game_id))
+            app._flush_spectators(game_id)
+        finally:
+            app.PokerGame.to_dict = to_dict
+        received = [w.get_received() for w in watchers]
+        game = app.games[game_id]
+        for client in [a, b] + watchers:
+            client.disconnect()
+        app.games.pop(game_id, None)
+        app.scheduler.cancel(('action', game_id))
+    assert len(game.players) == 2, "un spectateur ne doit pas prendre de siège"
+    assert first and first[0]['state']['phase'] == 'waiting' and first[0]['game_id'] == game_id
+    assert len(calls) == 1, f"to_dict appelé {len(calls)} fois pour 10 spectateurs"
+    for messages in received:
+        names = [m['name'] for m in messages]
+        assert names.count('spectator_delta') == 1 and 'hand_dealt' not in names and 'game_update' not in names
+        delta = [m['args'][0] for m in messages if m['name'] == 'spectator_delta'][0]
+        state = apply_delta(first[0]['state'], delta)
+        assert state['phase'] == 'preflop' and all(p['hand'] == [] for p in state['players'])
+    assert game_id not in app._spectators and not app._spectating, "spectateurs non oubliés à la déconnexion"
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests rapides du service des fichiers du build React (static_assets.py, routes /, /static/..., /manifest.json):
+index construit une seule fois, variantes précompressées .br/.gz, cache immuable des noms hachés,
+revalidation (ETag -> 304) et réindexation quand le build change (y compris fichier modifié sur place
+ou ajouté dans un sous-répertoire).
+
+Exécution:
+  python test_static_assets.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import gzip
+import io
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+from static_assets import AssetIndex, precompress  # type: ignore
+
+SCRIPT = b'console.log("poker");\n' * 100
+
+
+def _build(root: str) -> None:
+    os.makedirs(os.path.join(root, 'static', 'js'))
+    with open(os.path.join(root, 'index.html'), 'wb') as f:
+        f.write(b'<!doctype html><div id="root"></div>' * 20)
+    with open(os.path.join(root, 'static', 'js', 'main.3f2a1b4c.js'), 'wb') as f:
+        f.write(SCRIPT)
+    with open(os.path.join(root, 'manifest.json'), 'wb') as f:
+        f.write(b'{}')
+
+
+@contextlib.contextmanager
+def _serving(root: str):
+    """Servir `root` à la place de frontend/build pendant le test."""
+    index = app.static_index
+    app.static_index = AssetIndex(root, rescan_seconds=0)
+    try:
+        yield app.app.test_client()
+    finally:
+        app.static_index = index
+
+
+def test_index_and_precompressed_variants():
+    with tempfile.TemporaryDirectory() as root:
+        _build(root)
+        assert precompress(root) >= 2, "index.html et main.js doivent être précompressés"
+        assert not os.path.exists(os.path.join(root, 'manifest.json.gz')), "fichier trop petit compressé"
+        index = AssetIndex(root, rescan_seconds=0)
+        assert sorted(index.assets) == ['index.html', 'manifest.json', 'static/js/main.3f2a1b4c.js']
+        script = index.get('static/js/main.3f2a1b4c.js')
+        assert script.immutable and 'gzip' in script.variants and not index.get('index.html').immutable
+        assert index.get('static/js/main.3f2a1b4c.js.gz') is None and index.get('../app.py') is None
+
+
+def test_routes_serve_variants_with_cache_headers():
+    with tempfile.TemporaryDirectory() as root:
+        _build(root)
+        precompress(root)
+        with _serving(root) as http:
+            url = '/static/js/main.3f2a1b4c.js'
+            plain = http.get(url, headers={'Accept-Encoding': 'identity'})
+            zipped = http.get(url, headers={'Accept-Encoding': 'gzip, deflate'})
+            again = http.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': zipped.headers['ETag']})
+            page = http.get('/')
+            revalidated = http.get('/', headers={'If-None-Match': page.headers['ETag']})
+            missing = http.get('/static/js/absent.js')
+            manifest = http.get('/manifest.json')
+            for resp in (plain, zipped, page, manifest):
+                resp.get_data()  # lire le corps avant de fermer le fichier envoyé
+                resp.close()
+    assert plain.status_code == 200 and plain.data == SCRIPT and 'Content-Encoding' not in plain.headers
+    assert zipped.headers['Content-Encoding'] == 'gzip' and gzip.decompress(zipped.data) == SCRIPT
+    assert zipped.headers['Vary'] == 'Accept-Encoding' and zipped.headers['ETag'] != plain.headers['ETag']
+    assert 'immutable' in zipped.headers['Cache-Control'] and 'javascript' in zipped.headers['Content-Type']
+    assert again.status_code == 304 and not again.data
+    assert page.status_code == 200 and page.headers['Cache-Control'] == 'no-cache'
+    assert revalidated.status_code == 304 and missing.status_code == 404
+    assert manifest.status_code == 200 and manifest.data == b'{}'
+
+
+def test_build_change_is_reindexed():
+    with tempfile.TemporaryDirectory() as root:
+        _build(root)
+        index = AssetIndex(root, rescan_seconds=0)
+        assert not index.refresh(), "build inchangé: pas de nouveau parcours"
+        with open(os.path.join(root, 'asset-manifest.json'), 'wb') as f:
+            f.write(b'{"files": {}}')
+        assert index.refresh() and index.get('asset-manifest.json') is not None
+    assert index.refresh() and len(index) == 0, "build supprimé: index vide"
+
+
+def test_in_place_and_subdirectory_changes_are_reindexed():
+    with tempfile.TemporaryDirectory() as root:
+        _build(root)
+        precompress(root)
+        script = os.path.join(root, 'static', 'js', 'main.3f2a1b4c.js')
+        with _serving(root) as http:
+            first = http.get('/static/js/main.3f2a1b4c.js', headers={'Accept-Encoding': 'identity'})
+            first.get_data()
+            first.close()
+            # Fichier réécrit sur place (répertoires inchangés): nouveau contenu, nouvel ETag, variante périmée
+            stat = os.stat(script)
+            with open(script, 'wb') as f:
+                f.write(b'console.log("v2");\n' * 100)
+            os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            assert app.static_index.refresh(), "fichier modifié sur place non détecté"
+            edited = http.get('/static/js/main.3f2a1b4c.js', headers={'Accept-Encoding': 'gzip',
+                                                                   'If-None-Match': first.headers['ETag']})
+            edited.get_data()
+            edited.close()
+            # Nouveau fichier dans un sous-répertoire (date de la racine inchangée)
+            with open(os.path.join(root, 'static', 'js', 'chunk.9a8b7c6d.js'), 'wb') as f:
+                f.write(SCRIPT)
+            assert app.static_index.refresh()
+            added = http.get('/static/js/chunk.9a8b7c6d.js')
+            added.get_data()
+            added.close()
+            assert not app.static_index.refresh(), "build inchangé: pas de nouveau parcours"
+    assert edited.status_code == 200 and edited.data.startswith(b'console.log("v2")')
+    assert 'Content-Encoding' not in edited.headers and edited.headers['ETag'] != first.headers['ETag']
+    assert added.status_code == 200 and added.data == SCRIPT
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests rapides du simulateur de tournois (tournament_sim.py) et de l'écriture colonne (.npz).
+
+Exécution:
+  python test_tournament_sim.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import zipfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import tournament_sim as ts  # type: ignore
+from columnar import write_npz  # type: ignore
+
+
+def test_play_table_runs_and_rotates_dealer():
+    strategies = [ts.heuristic_strategy, ts.passive, ts.random_strategy]
+    with contextlib.redirect_stdout(io.StringIO()):
+        cols = ts.play_table(0, strategies, max_hands=300, seed=42)
+    hands = len(cols['hand'])
+    assert hands > 0, "aucune main jouée"
+    assert not any(cols['stalled']), "main bloquée par le moteur"
+    # Le bouton tourne d'un siège à chaque main (3 joueurs, tant que personne n'est éliminé)
+    assert cols['dealer_pos'][:3] == [0, 1, 2], cols['dealer_pos'][:3]
+    assert all(w in (-1, 0, 1, 2) for w in cols['winner_seat'])
+
+
+def test_run_tournament_sequential_is_reproducible():
+    a = ts.run_tournament(3, ['heuristic', 'random'], workers=0, seed=7, max_hands=50)
+    b = ts.run_tournament(3, ['heuristic', 'random'], workers=0, seed=7, max_hands=50)
+    assert a == b, "même graine, résultats différents"
+    assert set(a['table']) == {0, 1, 2}
+
+
+def test_write_npz_columns():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'r.npz')
+        write_npz(path, {'hand': [1, 2, 3], 'board': ['AH KD', '', '2C'], 'ratio': [0.5, 1, 2.0]})
+        with zipfile.ZipFile(path) as zf:
+            assert sorted(zf.namelist()) == ['board.npy', 'hand.npy', 'ratio.npy']
+            header = zf.read('board.npy')[:128]
+            assert header.startswith(b'\x93NUMPY') and b"'<U5'" in header
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests rapides de la diffusion des événements: encodage binaire optionnel (wire.py) négocié par client,
+puis état public unique + compléments privés par joueur (app._fan_out_state), lobby HTTP versionné (/api/games).
+
+Exécution:
+  python test_wire.py
+
+Sortie: affiche PASS/FAIL pour chaque sous-test et renvoie un code de sortie 0 si tout est OK.
+"""
+from __future__ import annotations
+import contextlib
+import gzip
+import io
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app  # type: ignore
+import wire  # type: ignore
+
+SAMPLE = {
+    'id': 'a1b2c3d4', 'pot': 70000, 'ratio': 0.25, 'none': None, 'ok': True, 'neg': [-1, -200, -70000, -2 ** 40],
+    'big': [255, 65535, 2 ** 32, 2 ** 63], 'name': 'Élodie' * 10, 'raw': b'\x00' * 300,
+    'hand': ['AH', 'TD'], 'community': ['2C', 'KS', '9H'], 'rank_key': (8, (14, 13)),
+    'players': [{'n': i} for i in range(20)],
+}
+
+
+def _packb_pure(obj) -> bytes:
+    out = bytearray()
+    wire._pack(obj, out)
+    return bytes(out)
+
+
+def test_compact_encodes_cards_as_ints():
+    c = wire.compact(SAMPLE)
+    assert c['hand'] == [12 + 13, 8] and c['community'] == [39, 11 + 26, 7 + 13], c
+    assert c['rank_key'] == [8, [14, 13]]
+    assert SAMPLE['hand'] == ['AH', 'TD'], "le payload d'origine ne doit pas être modifié"
+
+
+def test_pure_python_msgpack_roundtrip_and_matches_extension():
+    obj = wire.compact(SAMPLE)
+    data = _packb_pure(obj)
+    decoded, pos = wire._unpack(data, 0)
+    assert pos == len(data) and decoded == obj
+    if wire.msgpack is not None:
+        assert data == wire.msgpack.packb(obj, use_bin_type=True)
+
+
+def test_client_negotiates_msgpack_per_connection():
+    with contextlib.redirect_stdout(io.StringIO()):
+        a = app.socketio.test_client(app.app)
+        b = app.socketio.test_client(app.app)
+        a.emit('set_wire_format', {'format': 'msgpack'})
+        assert a.get_received()[-1]['args'][0] == {'format': 'msgpack'}
+        a.emit('create_game', {'player_name': 'Alice'})
+        created = [m for m in a.get_received() if m['name'] == 'game_created'][0]['args'][0]
+        b.emit('join_game', {'game_id': created['game_id'], 'player_name': 'Bob'})
+        a_updates = [m['args'][0] for m in a.get_received() if m['name'] == 'game_update']
+        b_updates = [m['args'][0] for m in b.get_received() if m['name'] == 'game_update']
+        a.disconnect()
+        b.disconnect()
+        app.games.pop(created['game_id'], None)
+    assert a_updates and all(isinstance(u, bytes) for u in a_updates)
+    assert b_updates and all(isinstance(u, dict) for u in b_updates)
+    state = wire.unpackb(a_updates[-1])
+    assert [p['name'] for p in state['players']] == ['Alice', 'Bob'], state
+    assert not app._wire_formats, "format non oublié à la déconnexion"
+
+
+def test_fan_out_sends_public_state_once_and_private_hands():
+    with contextlib.redirect_stdout(io.StringIO()):
+        a = app.socketio.test_client(app.app)
+        b = app.socketio.test_client(app.app)
+        a.emit('create_game', {'player_name': 'Alice'})
+        game_id = [m for m in a.get_received() if m['name'] == 'game_created'][0]['args'][0]['game_id']
+        b.emit('join_game', {'game_id': game_id, 'player_name': 'Bob'})
+        a.get_received()
+        b.get_received()
+        a.emit('start_game', {'game_id': game_id})
+        received = {'a': a.get_received(), 'b': b.get_received()}
+        game = app.games[game_id]
+        # Reconnexion: le joueur retrouve ses cartes
+        b.emit('join_game', {'game_id': game_id, 'player_name': 'Bob'})
+        rejoined = b.get_received()
+        a.disconnect()
+        b.disconnect()
+        app.games.pop(game_id, None)
+        app.scheduler.cancel(('action', game_id))
+    for who, player in (('a', game.players[0]), ('b', game.players[1])):
+        updates = [m['args'][0] for m in received[who] if m['name'] == 'game_update']
+        dealt = [m['args'][0] for m in received[who] if m['name'] == 'hand_dealt']
+        assert len(updates) == 1 and all(p['hand'] == [] for p in updates[0]['players']), updates
+        assert len(dealt) == 1 and dealt[0]['hand'] == [str(c) for c in player.hand], dealt
+    assert [m['args'][0]['hand'] for m in rejoined if m['name'] == 'hand_dealt'] == [[str(c) for c in game.players[1].hand]]
+
+
+def test_hand_result_is_compact_and_detail_is_fetched_on_demand():
+    with contextlib.redirect_stdout(io.StringIO()):
+        a = app.socketio.test_client(app.app)
+        b = app.socketio.test_client(app.app)
+        a.emit('create_game', {'player_name': 'Alice'})
+        game_id = [m for m in a.get_received() if m['name'] == 'game_created'][0]['args'][0]['game_id']
+        b.emit('join_game', {'game_id': game_id, 'player_name': 'Bob'})
+        a.emit('start_game', {'game_id': game_id})
+        game = app.games[game_id]
+        # Tout le monde suit puis check jusqu'au showdown
+        clients = {game.players[0].id: a, game.players[1].id: b}
+        while game.phase.value != 'showdown':
+            player = game.players[game.current_player]
+            action = 'call' if player.current_bet < game.current_bet else 'check'
+            clients[player.id].emit('player_action', {'game_id': game_id, 'action': action})
+        result = [m['args'][0] for m in b.get_received() if m['name'] == 'hand_result'][-1]
+        b.emit('request_hand_detail', {'game_id': game_id, 'hand_number': result['hand_number']})
+        detail = [m['args'][0] for m in b.get_received() if m['name'] == 'hand_detail'][0]
+        http = app.app.test_client()
+        url = f'/api/games/{game_id}/hands/{result["hand_number"]}'
+        first = http.get(url)
+        again = http.get(url, headers={'If-None-Match': first.headers['ETag']})
+        missing = http.get(f'/api/games/{game_id}/hands/99')
+        a.disconnect()
+        b.disconnect()
+        app.games.pop(game_id, None)
+        app.scheduler.cancel(('action', game_id))
+    assert set(result) == {'hand_number', 'player_id', 'name', 'amount', 'reason', 'winners', 'hands'}, result
+    assert result['reason'] == 'showdown' and all(set(h) == {'player_id', 'cards', 'best'} for h in result['hands'])
+    assert len(detail['board']) == 5 and [x['action'] for x in detail['actions'][:2]] == ['sb', 'bb']
+    assert all(h['rank_key'] is not None for h in detail['hands'])
+    assert first.status_code == 200 and first.get_json() == detail
+    assert again.status_code == 304 and not again.data and missing.status_code == 404
+
+
+def test_lobby_api_is_versioned_and_conditional():
+    http = app.app.test_client()
+    gzip_min = app.LOBBY_GZIP_MIN_BYTES
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = http.get('/api/games')
+        same = http.get('/api/games', headers={'If-None-Match': first.headers['ETag']})
+        since = http.get('/api/games', headers={'If-Modified-Since': first.headers['Last-Modified']})
+        a = app.socketio.test_client(app.app)
+        a.emit('create_game', {'player_name': 'Alice'})
+        game_id = [m for m in a.get_received() if m['name'] == 'game_created'][0]['args'][0]['game_id']
+        changed = http.get('/api/games', headers={'If-None-Match': first.headers['ETag']})
+        app.LOBBY_GZIP_MIN_BYTES = 1
+        try:
+            zipped = http.get('/api/games', headers={'Accept-Encoding': 'gzip'})
+            zipped_again = http.get('/api/games', headers={'Accept-Encoding': 'gzip',
+                                                           'If-None-Match': zipped.headers['ETag']})
+        finally:
+            app.LOBBY_GZIP_MIN_BYTES = gzip_min
+        a.disconnect()
+        app.games.pop(game_id, None)
+    assert first.status_code == 200 and first.headers['Cache-Control'] == 'no-cache'
+    assert same.status_code == 304 and not same.data and since.status_code == 304
+    body = changed.get_json()
+    assert changed.status_code == 200 and body['version'] > first.get_json()['version']
+    assert any(g['id'] == game_id for g in body['games']) and changed.headers['ETag'] != first.headers['ETag']
+    assert zipped.headers['Content-Encoding'] == 'gzip' and gzip.decompress(zipped.data) == changed.data
+    assert zipped_again.status_code == 304 and zipped.headers['Vary'] == 'Accept-Encoding'
+
+
+def test_open_games_broadcast_only_when_lobby_changes():
+    with contextlib.redirect_stdout(io.StringIO()):
+        a = app.socketio.test_client(app.app)
+        a.emit('create_game', {'player_name': 'Alice'})
+        game_id = [m for m in a.get_received() if m['name'] == 'game_created'][0]['args'][0]['game_id']
+        app._broadcast_open_games()
+        app._broadcast_open_games()
+        unchanged = [m for m in a.get_received() if m['name'] == 'open_games']
+        app.games[game_id].players[0].name = 'Alicia'
+        app._broadcast_open_games()
+        changed = [m['args'][0] for m in a.get_received() if m['name'] == 'open_games']
+        a.disconnect()
+        app.games.pop(game_id, None)
+    assert not unchanged, "liste inchangée: aucune diffusion"
+    assert len(changed) == 1 and any(g['host'] == 'Alicia' for g in changed[0]['games']), changed
+
+
+def main() -> int:
+    failures = 0
+    for name, fn in list(globals().items()):
+        if name.startswith('test_') and callable(fn):
+            try:
+                fn()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"❌ {name}: {e}")
+    if failures:
+        print(f"\n❌ ECHOUÉ — {failures} erreur(s)")
+        return 1
+    print("\n✅ SUCCÈS — Tous les tests sont verts")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Simulateur de tournois sans client (self-play) basé sur le moteur `PokerGame` de app.py.
+
+- Chaque table joue jusqu'à ce qu'il ne reste qu'un joueur avec des jetons (ou `max_hands` mains).
+- Les stratégies sont des callables `strategy(game, seat) -> (action, amount)` avec
+  action parmi 'fold', 'check', 'call', 'raise' (amount = jetons ajoutés, comme côté client).
+- Le bouton (dealer_pos) tourne via `start_hand()`, exactement comme dans la vraie partie.
+- Les tables indépendantes peuvent être jouées en parallèle dans un pool de processus.
+- Les résultats par main sont écrits au format colonne (.npz, cf. columnar.py).
+- Tournoi multi-tables (--mtt N): N inscrits répartis sur des tables de --players places, cassées et
+  équilibrées par le directeur de tournoi (mtt.py) au fil des éliminations.
+
+Exemple:
+  python tournament_sim.py --tables 200 --players 6 --strategies heuristic,call,random --workers 4 --out results.npz
+  python tournament_sim.py --mtt 600 --players 9 --seed 1
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.devnull, 'w') as _devnull, contextlib.redirect_stdout(_devnull):
+    # app.py affiche sa configuration à l'import: inutile ici
+    from app import PokerGame, GamePhase  # type: ignore
+from mtt import TournamentDirector
+from hand_eval import evaluate_7cards, HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, \
+    FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH
+
+Strategy = Callable[[PokerGame, int], Tuple[str, int]]
+
+# Garde-fou: nombre maximal d'actions dans une main (évite toute boucle infinie en cas de bug moteur)
+MAX_ACTIONS_PER_HAND = 200
+
+
+def to_call(game: PokerGame, seat: int) -> int:
+    """Montant à ajouter pour suivre."""
+    player = game.players[seat]
+    return max(0, min(game.current_bet - player.current_bet, player.stack))
+
+
+def min_raise(game: PokerGame, seat: int) -> int:
+    """Montant minimal à ajouter pour relancer (suivre + une big blind), borné par le tapis."""
+    return min(to_call(game, seat) + game.big_blind, game.players[seat].stack)
+
+
+def passive(game: PokerGame, seat: int) -> Tuple[str, int]:
+    """Toujours check si possible, sinon suivre."""
+    return ('call', 0) if to_call(game, seat) > 0 else ('check', 0)
+
+
+def random_strategy(game: PokerGame, seat: int) -> Tuple[str, int]:
+    """Actions aléatoires (fold rare), utile comme adversaire de référence."""
+    r = random.random()
+    if r < 0.15 and to_call(game, seat) > 0:
+        return 'fold', 0
+    if r < 0.30:
+        return 'raise', min_raise(game, seat)
+    return passive(game, seat)
+
+
+# --- Portage de l'heuristique du bot CodinGame (poker.py) ---
+
+_CATEGORY_SCORES = {
+    STRAIGHT_FLUSH: 1000, ROYAL_FLUSH: 1000, FOUR_OF_A_KIND: 900, FULL_HOUSE: 800,
+    FLUSH: 700, STRAIGHT: 600, THREE_OF_A_KIND: 500, TWO_PAIR: 400,
+}
+
+
+def heuristic_score(hole: Sequence, board: Sequence) -> int:
+    """Score de poker.py: 200 (As en main) .. 1000 (quinte flush), 0 si rien.
+
+    Comme dans poker.py, une combinaison ne compte que si elle utilise au moins une carte
+    privée (sinon elle est entièrement sur la table et partagée par tous).
+    """
+    (category, tie), _ = evaluate_7cards(list(board) + list(hole))
+    board_category = evaluate_7cards(list(board))[0][0] if board else HIGH_CARD
+    if category > board_category and category >= TWO_PAIR:
+        return _CATEGORY_SCORES[category]
+    if category == ONE_PAIR and board_category < ONE_PAIR:
+        return 300 + tie[0] - 13  # ne pas se coucher avec une paire de (J, Q, K, A)
+    if any(c.value == 14 for c in hole):
+        return 200
+    return 0
+
+
+def heuristic_strategy(game: PokerGame, seat: int) -> Tuple[str, int]:
+    """Mêmes seuils de décision que la boucle principale de poker.py."""
+    player = game.players[seat]
+    score = heuristic_score(player.hand, game.community_cards)
+    facing = to_call(game, seat) > 0
+    opponent_all_in = any(p.all_in and not p.folded for i, p in enumerate(game.players) if i != seat)
+    river = game.phase == GamePhase.RIVER
+    if score < 200:
+        if river and facing:
+            return 'fold', 0
+        if not facing:
+            return 'check', 0
+        if not opponent_all_in:
+            return 'call', 0
+        return 'fold', 0
+    if score < 400:
+        if facing:
+            return ('call', 0) if river and score > 300 else ('fold', 0)
+        return 'raise', min_raise(game, seat)
+    if score < 600:
+        return 'raise', max(min_raise(game, seat), player.stack // 2)
+    return 'raise', player.stack
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    'call': passive,
+    'random': random_strategy,
+    'heuristic': heuristic_strategy,
+}
+
+_STRATEGY_NAMES = {fn: name for name, fn in STRATEGIES.items()}
+
+
+def _fallback_action(game: PokerGame, seat: int) -> List[Tuple[str, int]]:
+    return [passive(game, seat), ('fold', 0)]
+
+
+def play_table(table_id: int, strategies: Sequence[Strategy], max_hands: int = 1000, seed: Optional[int] = None,
+               buy_in: int = 1000, small_blind: int = 10, big_blind: int = 20) -> Dict[str, list]:
+    """Jouer une table complète et retourner les résultats par main, colonne par colonne."""
+    if seed is not None:
+        random.seed(seed)
+    # Graines des mains tirées d'un RNG dédié: une table rejouée avec la même graine donne les mêmes donnes
+    deal_rng = random.Random(seed)
+    game = PokerGame(id=f'sim{table_id}', small_blind=small_blind, big_blind=big_blind)
+    for seat in range(len(strategies)):
+        game.add_player(f'bot{seat}', f'Bot{seat}', buy_in=buy_in)
+
+    cols: Dict[str, list] = {name: [] for name in (
+        'table', 'hand', 'dealer_pos', 'players_in', 'winner_seat', 'winner_strategy', 'pot', 'reason',
+        'actions', 'board', 'stalled')}
+    names = [_STRATEGY_NAMES.get(s, getattr(s, '__name__', str(s))) for s in strategies]
+    seat_of = {p.id: i for i, p in enumerate(game.players)}
+
+    for _ in range(max_hands):
+        if not game.start_hand(seed=deal_rng.getrandbits(64)):
+            break
+        players_in = sum(1 for p in game.players if p.hand)
+        pot_before = sum(p.total_bet for p in game.players)
+        actions = 0
+        stalled = False
+        while game.phase != GamePhase.SHOWDOWN:
+            if actions >= MAX_ACTIONS_PER_HAND:
+                stalled = True
+                break
+            seat = game.current_player
+            player = game.players[seat]
+            error = 'pending'
+            for action, amount in [strategies[seat](game, seat)] + _fallback_action(game, seat):
+                error, _, _ = game.apply_action(player.id, action, amount)
+                if error is None:
+                    break
+            if error is not None:
+                stalled = True
+                break
+            actions += 1
+
+        result = game.last_winner if game.phase == GamePhase.SHOWDOWN else {}
+        winner_seat = seat_of.get(result.get('player_id'), -1)
+        cols['table'].append(table_id)
+        cols['hand'].append(game.hand_number)
+        cols['dealer_pos'].append(game.dealer_pos)
+        cols['players_in'].append(players_in)
+        cols['winner_seat'].append(winner_seat)
+        cols['winner_strategy'].append(names[winner_seat] if winner_seat >= 0 else '')
+        cols['pot'].append(result.get('amount', 0) if result else pot_before)
+        cols['reason'].append(result.get('reason', '') if result else 'stalled')
+        cols['actions'].append(actions)
+        cols['board'].append(' '.join(str(c) for c in game.community_cards))
+        cols['stalled'].append(stalled)
+        if stalled:
+            break
+        if sum(1 for p in game.players if p.stack > 0) < 2:
+            break
+    return cols
+
+
+def play_hand(game: PokerGame, strategy_of: Dict[str, Strategy]) -> bool:
+    """Jouer une main complète (stratégie par id de joueur). False si la main n'a pas pu démarrer ou s'est bloquée."""
+    if not game.start_hand(seed=random.getrandbits(64)):
+        return False
+    for _ in range(MAX_ACTIONS_PER_HAND):
+        if game.phase == GamePhase.SHOWDOWN:
+            return True
+        seat = game.current_player
+        player = game.players[seat]
+        for action, amount in [strategy_of[player.id](game, seat)] + _fallback_action(game, seat):
+            if game.apply_action(player.id, action, amount)[0] is None:
+                break
+        else:
+            return False
+    return game.phase == GamePhase.SHOWDOWN
+
+
+def play_mtt(entrants: int, strategy_names: Sequence[str], table_size: int = 6, seed: Optional[int] = None,
+             buy_in: int = 1000, structure=None, max_hands: int = 200000) -> Dict:
+    """Jouer un tournoi multi-tables complet: les tables jouent une main chacune à tour de rôle et le
+    directeur (mtt.py) élimine, casse et équilibre après chaque main."""
+    random.seed(seed)
+    director = TournamentDirector('mtt', lambda table_id: PokerGame(id=table_id), table_size=table_size,
+                                  buy_in=buy_in, structure=structure)
+    strategy_of: Dict[str, Strategy] = {}
+    for i in range(entrants):
+        director.register(f'p{i}', f'Bot{i}')
+        strategy_of[f'p{i}'] = STRATEGIES[strategy_names[i % len(strategy_names)]]
+    director.seat_players(seed)
+    tables_at_start = len(director.tables)
+    hands = moves = updates = stalled = max_imbalance = 0
+    while not director.finished and hands < max_hands:
+        played = 0
+        for table_id in list(director.tables):
+            game = director.tables.get(table_id)
+            if game is None or director.finished:
+                continue
+            if not play_hand(game, strategy_of):
+                stalled += game.phase != GamePhase.SHOWDOWN and game.hand_number > 0
+                continue
+            played += 1
+            moves += len(director.hand_finished(table_id))
+            # Un game_update par table touchée, quel que soit le nombre de déplacements
+            updates += len(director.flush().tables)
+        max_imbalance = max(max_imbalance, director.imbalance())
+        hands += played
+        if not played:
+            break
+    chips = sum(p.stack for game in director.tables.values() for p in game.players)
+    return {'hands': hands, 'moves': moves, 'updates': updates, 'stalled': stalled, 'tables': tables_at_start,
+            'max_imbalance': max_imbalance, 'chips': chips, 'standings': director.standings()}
+
+
+def _play_table_quiet(args: tuple) -> Dict[str, list]:
+    # Le moteur trace chaque main sur stdout: le rediriger pour ne pas ralentir les simulations
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        table_id, strategy_names, kwargs = args
+        return play_table(table_id, [STRATEGIES[n] for n in strategy_names], **kwargs)
+
+
+def run_tournament(tables: int, strategy_names: Sequence[str], workers: int = 0, seed: Optional[int] = None,
+                   **kwargs) -> Dict[str, list]:
+    """Jouer `tables` tables indépendantes (en parallèle si workers > 1) et concaténer les colonnes."""
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    jobs = []
+    for t in range(tables):
+        # Faire tourner les places pour ne pas avantager une stratégie assise en siège 0
+        shift = t % len(strategy_names)
+        seats = list(strategy_names[shift:]) + list(strategy_names[:shift])
+        jobs.append((t, seats, dict(kwargs, seed=base_seed + t)))
+
+    merged: Dict[str, list] = {}
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_play_table_quiet, jobs, chunksize=max(1, tables // (workers * 4)))
+            for cols in results:
+                for k, v in cols.items():
+                    merged.setdefault(k, []).extend(v)
+    else:
+        for job in jobs:
+            for k, v in _play_table_quiet(job).items():
+                merged.setdefault(k, []).extend(v)
+    return merged
+
+
+def strategy_name(player_id: str, names: Sequence[str]) -> str:
+    return names[int(player_id[1:]) % len(names)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Simulation de tournois PokerGame en self-play')
+    parser.add_argument('--tables', type=int, default=20)
+    parser.add_argument('--players', type=int, default=6, help='joueurs par table (2 à 6)')
+    parser.add_argument('--strategies', default='heuristic,call,random',
+                        help=f"stratégies réparties sur les sièges, parmi: {', '.join(STRATEGIES)}")
+    parser.add_argument('--max-hands', type=int, default=1000)
+    parser.add_argument('--buy-in', type=int, default=1000)
+    parser.add_argument('--small-blind', type=int, default=10)
+    parser.add_argument('--big-blind', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='0 ou 1 = séquentiel')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--out', default='tournament_results.npz')
+    parser.add_argument('--mtt', type=int, default=0, help='tournoi multi-tables à N inscrits (tables de --players places)')
+    args = parser.parse_args()
+
+    names = [s.strip() for s in args.strategies.split(',') if s.strip()]
+    unknown = [n for n in names if n not in STRATEGIES]
+    if unknown:
+        parser.error(f"Stratégie(s) inconnue(s): {unknown}")
+    seats = [names[i % len(names)] for i in range(args.players)]
+
+    if args.mtt:
+        tic = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = play_mtt(args.mtt, names, table_size=args.players, seed=args.seed, buy_in=args.buy_in)
+        elapsed = time.perf_counter() - tic
+        winner = result['standings'][0]
+        print(f"✅ MTT {args.mtt} inscrits sur {result['tables']} tables: {result['hands']} mains en {elapsed:.2f}s, "
+              f"{result['moves']} déplacements, {result['updates']} game_update, écart max {result['max_imbalance']}")
+        print(f"  Vainqueur: {winner['name']} ({strategy_name(winner['player_id'], names)}), {winner['stack']} jetons")
+        return 0
+
+    tic = time.perf_counter()
+    cols = run_tournament(args.tables, seats, workers=args.workers, seed=args.seed, max_hands=args.max_hands,
+                          buy_in=args.buy_in, small_blind=args.small_blind, big_blind=args.big_blind)
+    elapsed = time.perf_counter() - tic
+
+    from columnar import write_npz
+    write_npz(args.out, cols)
+
+    hands = len(cols.get('hand', []))
+    print(f"✅ {args.tables} tables, {hands} mains en {elapsed:.2f}s ({hands / max(elapsed, 1e-9):.0f} mains/s) -> {args.out}")
+    wins: Dict[str, int] = {}
+    for strategy, reason in zip(cols.get('winner_strategy', []), cols.get('reason', [])):
+        if strategy:
+            wins[strategy] = wins.get(strategy, 0) + 1
+    for name, n in sorted(wins.items(), key=lambda kv: -kv[1]):
+        print(f"  {name}: {n} mains gagnées ({n / max(hands, 1):.1%})")
+    stalled = sum(cols.get('stalled', []))
+    if stalled:
+        print(f"⚠️ {stalled} main(s) bloquée(s) par le moteur")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
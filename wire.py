@@ -0,0 +1,208 @@
+"""
+Encodage binaire optionnel des événements Socket.IO (MessagePack, cartes en entiers).
+
+Un client peut demander ce format (événement `set_wire_format` {'format': 'msgpack'}): il reçoit alors
+`game_update`, `hand_result` et `open_games` sous forme d'une pièce jointe binaire MessagePack au lieu
+de JSON. Les autres clients ne sont pas concernés (négociation par connexion).
+
+Compactage appliqué avant l'encodage:
+- les cartes ('AH', 'TD', ...) deviennent des entiers 0..51 (13 * couleur + valeur - 2, cf. hand_eval.card_index)
+  dans les listes 'hand', 'cards', 'community_cards' et 'community';
+- les tuples (ex: rank_key) deviennent des tableaux MessagePack.
+
+Le paquet `msgpack` (extension C) est utilisé s'il est installé; sinon un encodeur pur Python
+produit exactement le même format (sous-ensemble: nil, bool, int, float64, str, bin, array, map).
+"""
+import struct
+from typing import Any, Dict, List, Tuple
+
+from hand_eval import card_label
+
+try:
+    import msgpack  # type: ignore
+except Exception:  # dépendance optionnelle
+    msgpack = None
+
+FORMATS = ('json', 'msgpack')
+
+CARD_KEYS = frozenset(('hand', 'cards', 'community_cards', 'community'))
+_CARD_CODES: Dict[str, int] = {card_label(i): i for i in range(52)}
+
+
+def compact(obj: Any) -> Any:
+    """Copie de `obj` avec les listes de cartes (clés CARD_KEYS) encodées en entiers."""
+    if isinstance(obj, dict):
+        out = {}
+        for key, value in obj.items():
+            if key in CARD_KEYS and isinstance(value, list):
+                out[key] = [_CARD_CODES.get(c, c) for c in value]
+            else:
+                out[key] = compact(value)
+        return out
+    if isinstance(obj, (list, tuple)):
+        return [compact(v) for v in obj]
+    return obj
+
+
+def encode(payload: Any) -> bytes:
+    """Compacter puis encoder un payload d'événement en MessagePack."""
+    return packb(compact(payload))
+
+
+# --- MessagePack ---
+
+def packb(obj: Any) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(obj, use_bin_type=True)
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+def _pack(obj: Any, out: bytearray) -> None:
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xFF)
+        elif obj >= 0:
+            if obj <= 0xFF:
+                out += b'\xcc' + struct.pack('>B', obj)
+            elif obj <= 0xFFFF:
+                out += b'\xcd' + struct.pack('>H', obj)
+            elif obj <= 0xFFFFFFFF:
+                out += b'\xce' + struct.pack('>I', obj)
+            else:
+                out += b'\xcf' + struct.pack('>Q', obj)
+        elif obj >= -0x80:
+            out += b'\xd0' + struct.pack('>b', obj)
+        elif obj >= -0x8000:
+            out += b'\xd1' + struct.pack('>h', obj)
+        elif obj >= -0x80000000:
+            out += b'\xd2' + struct.pack('>i', obj)
+        else:
+            out += b'\xd3' + struct.pack('>q', obj)
+    elif isinstance(obj, float):
+        out += b'\xcb' + struct.pack('>d', obj)
+    elif isinstance(obj, str):
+        raw = obj.encode('utf-8')
+        n = len(raw)
+        if n < 32:
+            out.append(0xA0 | n)
+        elif n <= 0xFF:
+            out += b'\xd9' + struct.pack('>B', n)
+        elif n <= 0xFFFF:
+            out += b'\xda' + struct.pack('>H', n)
+        else:
+            out += b'\xdb' + struct.pack('>I', n)
+        out += raw
+    elif isinstance(obj, (bytes, bytearray)):
+        n = len(obj)
+        if n <= 0xFF:
+            out += b'\xc4' + struct.pack('>B', n)
+        elif n <= 0xFFFF:
+            out += b'\xc5' + struct.pack('>H', n)
+        else:
+            out += b'\xc6' + struct.pack('>I', n)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        n = len(obj)
+        if n < 16:
+            out.append(0x90 | n)
+        elif n <= 0xFFFF:
+            out += b'\xdc' + struct.pack('>H', n)
+        else:
+            out += b'\xdd' + struct.pack('>I', n)
+        for v in obj:
+            _pack(v, out)
+    elif isinstance(obj, dict):
+        n = len(obj)
+        if n < 16:
+            out.append(0x80 | n)
+        elif n <= 0xFFFF:
+            out += b'\xde' + struct.pack('>H', n)
+        else:
+            out += b'\xdf' + struct.pack('>I', n)
+        for k, v in obj.items():
+            _pack(k, out)
+            _pack(v, out)
+    else:
+        raise TypeError(f"type non encodable en MessagePack: {type(obj).__name__}")
+
+
+def unpackb(data: bytes) -> Any:
+    """Décoder un message produit par packb (utile aux clients Python et aux tests)."""
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False)
+    obj, pos = _unpack(data, 0)
+    if pos != len(data):
+        raise ValueError('octets en trop après le message MessagePack')
+    return obj
+
+
+_FIXED: Dict[int, Tuple[str, int]] = {
+    0xCC: ('>B', 1), 0xCD: ('>H', 2), 0xCE: ('>I', 4), 0xCF: ('>Q', 8),
+    0xD0: ('>b', 1), 0xD1: ('>h', 2), 0xD2: ('>i', 4), 0xD3: ('>q', 8),
+    0xCA: ('>f', 4), 0xCB: ('>d', 8),
+}
+_LENGTHS = {0xD9: ('>B', 1), 0xDA: ('>H', 2), 0xDB: ('>I', 4),   # str
+            0xC4: ('>B', 1), 0xC5: ('>H', 2), 0xC6: ('>I', 4),   # bin
+            0xDC: ('>H', 2), 0xDD: ('>I', 4),                    # array
+            0xDE: ('>H', 2), 0xDF: ('>I', 4)}                    # map
+
+
+def _unpack(data: bytes, pos: int) -> Tuple[Any, int]:
+    b = data[pos]
+    pos += 1
+    if b < 0x80:
+        return b, pos
+    if b >= 0xE0:
+        return b - 0x100, pos
+    if 0xA0 <= b <= 0xBF:
+        n = b & 0x1F
+        return data[pos:pos + n].decode('utf-8'), pos + n
+    if 0x90 <= b <= 0x9F:
+        return _unpack_array(data, pos, b & 0x0F)
+    if 0x80 <= b <= 0x8F:
+        return _unpack_map(data, pos, b & 0x0F)
+    if b == 0xC0:
+        return None, pos
+    if b in (0xC2, 0xC3):
+        return b == 0xC3, pos
+    if b in _FIXED:
+        fmt, size = _FIXED[b]
+        return struct.unpack_from(fmt, data, pos)[0], pos + size
+    if b in _LENGTHS:
+        fmt, size = _LENGTHS[b]
+        (n,) = struct.unpack_from(fmt, data, pos)
+        pos += size
+        if b in (0xD9, 0xDA, 0xDB):
+            return data[pos:pos + n].decode('utf-8'), pos + n
+        if b in (0xC4, 0xC5, 0xC6):
+            return bytes(data[pos:pos + n]), pos + n
+        if b in (0xDC, 0xDD):
+            return _unpack_array(data, pos, n)
+        return _unpack_map(data, pos, n)
+    raise ValueError(f"octet de type MessagePack non supporté: 0x{b:02x}")
+
+
+def _unpack_array(data: bytes, pos: int, n: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(n):
+        item, pos = _unpack(data, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(data: bytes, pos: int, n: int) -> Tuple[Dict[Any, Any], int]:
+    out = {}
+    for _ in range(n):
+        key, pos = _unpack(data, pos)
+        out[key], pos = _unpack(data, pos)
+    return out, pos